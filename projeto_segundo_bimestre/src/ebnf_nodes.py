@@ -0,0 +1,279 @@
+"""
+=============================================================================
+PRODUÇÕES EBNF COMPILADAS - LINGUAGEM VYTHON
+=============================================================================
+
+A Grammar mantém grupos e operadores EBNF como strings nas produções
+(ex.: "('[' <expression> ']')", '*'). Antes da análise, cada produção é
+compilada uma vez em uma pequena árvore de nós preparados:
+
+- SequenceNode : sequência de entradas, já na ordem de empilhamento
+- ChoiceNode   : grupo com alternativas ( α | β ), escolhidas pelo
+                 lookahead em um dicionário id do terminal -> alternativa
+- RepeatNode   : X* (X+ vira X X*)
+- OptionNode   : X?
+
+Cada entrada é o id de um símbolo (grammar.symbols) ou um nó. FIRST de
+cada alternativa e de cada repetição é calculado na compilação, então o
+parser só compara inteiros e segue referências, sem tokenizar grupos
+nem procurar '|' durante a análise.
+=============================================================================
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Sequence, Union
+
+from terminal_sets import EBNF_OPERATORS
+
+
+# Tipos de nó (atributo kind), usados pelo parser para despachar
+SEQUENCE = 0
+CHOICE = 1
+REPEAT = 2
+OPTION = 3
+
+
+class SequenceNode:
+    """
+    Sequência de entradas (ids de símbolos ou nós).
+    
+    Attributes:
+        items: Entradas na ordem da produção
+        pushed: Entradas na ordem de empilhamento (invertidas)
+        first: Bitmask de FIRST da sequência (bit ε se anulável)
+        text: Texto da sequência na gramática
+    """
+    
+    __slots__ = ('items', 'pushed', 'first', 'text')
+    kind = SEQUENCE
+    
+    def __init__(self, items: Sequence, first: int, text: str):
+        self.items = tuple(items)
+        self.pushed = self.items[::-1]
+        self.first = first
+        self.text = text
+    
+    def __str__(self):
+        return self.text
+
+
+class ChoiceNode:
+    """
+    Grupo com alternativas: ( α | β | ... ).
+    
+    Attributes:
+        alternatives: SequenceNode de cada alternativa
+        select: Id do terminal -> primeira alternativa cujo FIRST o contém
+        default: Alternativa anulável usada sem lookahead correspondente
+        first: Bitmask de FIRST do grupo
+        text: Texto do grupo na gramática
+    """
+    
+    __slots__ = ('alternatives', 'select', 'default', 'first', 'text')
+    kind = CHOICE
+    
+    def __init__(self, alternatives: Sequence[SequenceNode], select: Dict[int, SequenceNode],
+                 default: Optional[SequenceNode], first: int, text: str):
+        self.alternatives = tuple(alternatives)
+        self.select = select
+        self.default = default
+        self.first = first
+        self.text = text
+    
+    def __str__(self):
+        return self.text
+
+
+class RepeatNode:
+    """
+    Repetição X*: o corpo é empilhado enquanto o lookahead está em FIRST(X).
+    
+    Attributes:
+        body: SequenceNode repetido
+        starts: Ids dos terminais em FIRST(X)
+        first: Bitmask de FIRST(X*) (sempre com ε)
+        text: Texto do elemento com o operador
+    """
+    
+    __slots__ = ('body', 'starts', 'first', 'text')
+    kind = REPEAT
+    
+    def __init__(self, body: SequenceNode, starts: FrozenSet[int], first: int, text: str):
+        self.body = body
+        self.starts = starts
+        self.first = first
+        self.text = text
+    
+    def __str__(self):
+        return self.text
+
+
+class OptionNode:
+    """
+    Opcional X?: o corpo é empilhado se o lookahead está em FIRST(X).
+    
+    Attributes:
+        body: SequenceNode opcional
+        starts: Ids dos terminais em FIRST(X)
+        first: Bitmask de FIRST(X?) (sempre com ε)
+        text: Texto do elemento com o operador
+    """
+    
+    __slots__ = ('body', 'starts', 'first', 'text')
+    kind = OPTION
+    
+    def __init__(self, body: SequenceNode, starts: FrozenSet[int], first: int, text: str):
+        self.body = body
+        self.starts = starts
+        self.first = first
+        self.text = text
+    
+    def __str__(self):
+        return self.text
+
+
+Node = Union[SequenceNode, ChoiceNode, RepeatNode, OptionNode]
+Entry = Union[int, Node]
+
+
+class EBNFCompiler:
+    """
+    Compila as produções EBNF de uma Grammar em árvores de nós.
+    
+    Usa os ids de grammar.symbols e o FIRST dos não-terminais já
+    calculado em first_follow (bitmasks de TerminalSets).
+    
+    Attributes:
+        productions: Nó de cada produção, na numeração de
+            first_follow.production_list
+    """
+    
+    def __init__(self, grammar, first_follow):
+        self.grammar = grammar
+        self.first_follow = first_follow
+        self.symbols = grammar.symbols
+        self.num_terminals = grammar.symbols.num_terminals
+        self.EPSILON = first_follow.sets.EPSILON
+        self.productions: List[SequenceNode] = []
+        self._groups: Dict[str, Node] = {}  # Grupos já compilados, pelo texto
+    
+    def compile(self) -> List[SequenceNode]:
+        """Compila todas as produções (first_follow.compute_first já executado)."""
+        self.productions = [self.compile_sequence(body)
+                            for _, body in self.first_follow.production_list]
+        return self.productions
+    
+    # -------------------------------------------------------------------------
+    # SEQUÊNCIAS E GRUPOS
+    # -------------------------------------------------------------------------
+    
+    def compile_sequence(self, tokens: Sequence[str]) -> SequenceNode:
+        """Compila uma sequência de símbolos com operadores EBNF."""
+        items: List[Entry] = []
+        length = len(tokens)
+        
+        i = 0
+        while i < length:
+            symbol = tokens[i]
+            operator = tokens[i + 1] if i + 1 < length and tokens[i + 1] in EBNF_OPERATORS else None
+            i += 2 if operator else 1
+            
+            if self.grammar.is_epsilon(symbol):
+                continue
+            
+            element = self._compile_element(symbol)
+            
+            if operator is None:
+                # Grupo sequencial sem operador: entradas vão direto na sequência
+                if isinstance(element, SequenceNode):
+                    items.extend(element.items)
+                else:
+                    items.append(element)
+                continue
+            
+            body = element if isinstance(element, SequenceNode) else self._wrap(element, symbol)
+            text = f"{symbol}{operator}"
+            starts = self._terminal_ids(body.first)
+            first = body.first | self.EPSILON
+            
+            if operator == '?':
+                items.append(OptionNode(body, starts, first, text))
+            elif operator == '*':
+                items.append(RepeatNode(body, starts, first, text))
+            else:
+                # X+ = X X*
+                items.extend(body.items)
+                items.append(RepeatNode(body, starts, first, f"{symbol}*"))
+        
+        return SequenceNode(items, self._first_of(items), ' '.join(tokens))
+    
+    def _compile_element(self, symbol: str) -> Entry:
+        """Id do símbolo, ou o nó de um grupo (...)."""
+        if symbol.startswith('(') and symbol.endswith(')'):
+            if symbol not in self._groups:
+                self._groups[symbol] = self._compile_group(symbol)
+            return self._groups[symbol]
+        
+        symbol_id = self.symbols.id_of(symbol)
+        if symbol_id == self.symbols.NOT_FOUND:
+            symbol_id = self.symbols.token_id(symbol)
+        return symbol_id
+    
+    def _compile_group(self, text: str) -> Node:
+        """Compila um grupo: uma alternativa vira sequência, várias viram escolha."""
+        grammar = self.grammar
+        alternatives = [self.compile_sequence(grammar._tokenize(alt))
+                        for alt in grammar._split_alternatives(text[1:-1])]
+        
+        if len(alternatives) == 1:
+            return alternatives[0]
+        
+        select: Dict[int, SequenceNode] = {}
+        default = None
+        first = 0
+        for alternative in alternatives:
+            for terminal_id in self._terminal_ids(alternative.first):
+                select.setdefault(terminal_id, alternative)
+            if default is None and alternative.first & self.EPSILON:
+                default = alternative
+            first |= alternative.first
+        
+        return ChoiceNode(alternatives, select, default, first, text)
+    
+    def _wrap(self, element: Entry, text: str) -> SequenceNode:
+        """Sequência de uma entrada só (corpo de X* e X?)."""
+        return SequenceNode((element,), self._first_of((element,)), text)
+    
+    # -------------------------------------------------------------------------
+    # FIRST
+    # -------------------------------------------------------------------------
+    
+    def _first_of_entry(self, entry: Entry) -> int:
+        """Bitmask de FIRST de uma entrada."""
+        if not isinstance(entry, int):
+            return entry.first
+        if entry < 0:
+            return 0
+        if entry < self.num_terminals:
+            return 1 << entry
+        return self.first_follow.first_bits.get(self.symbols.names[entry], 0)
+    
+    def _first_of(self, items: Sequence[Entry]) -> int:
+        """Bitmask de FIRST de uma sequência de entradas."""
+        epsilon = self.EPSILON
+        result = 0
+        for entry in items:
+            mask = self._first_of_entry(entry)
+            result |= mask & ~epsilon
+            if not mask & epsilon:
+                return result
+        return result | epsilon
+    
+    def _terminal_ids(self, mask: int) -> FrozenSet[int]:
+        """Ids dos terminais de um bitmask (sem ε)."""
+        mask &= ~self.EPSILON
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(low.bit_length() - 1)
+            mask ^= low
+        return frozenset(ids)
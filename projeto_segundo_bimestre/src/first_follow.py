@@ -1,226 +1,99 @@
-from collections import defaultdict
+from terminal_sets import TerminalSets, TerminalSetView
+
 
 class FirstFollow:
-    """Calcula First e Follow processando EBNF diretamente."""
+    """
+    Calcula First e Follow processando EBNF diretamente.
+    
+    Os conjuntos são calculados como bitmasks (TerminalSets) em
+    first_bits/follow_bits; first e follow são visões dict-de-sets.
+    Após FIRST, suffixes guarda FIRST de todos os sufixos das produções,
+    numeradas na ordem de production_list, e step_factor limita o número
+    de passos do parser (ver TerminalSets.step_factor).
+    """
     
     def __init__(self, grammar):
         self.grammar = grammar
-        self.first = defaultdict(set)
-        self.follow = defaultdict(set)
-        
+        self.sets = TerminalSets(
+            grammar.symbols,
+            epsilon=grammar.epsilon,
+            epsilon_symbols=['ε', 'epsilon', 'EPSILON'],
+            ebnf=True
+        )
+        self.first_bits = {}
+        self.follow_bits = {}
+        self.first = TerminalSetView(self.first_bits, self.sets)
+        self.follow = TerminalSetView(self.follow_bits, self.sets)
+        self.production_list = []
+        self.production_numbers = {}
+        self.suffixes = None
+        self.step_factor = 1
+        
+    def _productions(self):
+        """Pares (cabeça, corpo) de todas as produções, numerados."""
+        productions = []
+        numbers = {}
+        for nt in self.grammar.nonterminals:
+            for prod in self.grammar.productions[nt]:
+                numbers.setdefault((nt, tuple(prod)), len(productions))
+                productions.append((nt, prod))
+        self.production_list = productions
+        self.production_numbers = numbers
+        return productions
+    
     def compute_first(self):
         """Calcula FIRST para todos os símbolos."""
         # FIRST de terminais
-        for terminal in self.grammar.terminals:
-            self.first[terminal] = {terminal}
+        first = {t: self.sets.bit(t) for t in self.grammar.terminals}
         
-        # Algoritmo de ponto fixo
-        changed = True
-        while changed:
-            changed = False
-            for nt in self.grammar.nonterminals:
-                for prod in self.grammar.productions[nt]:
-                    old_size = len(self.first[nt])
-                    self._first_of_production(nt, prod)
-                    if len(self.first[nt]) > old_size:
-                        changed = True
+        # Ponto fixo sobre bitmasks
+        productions = self._productions()
+        self.sets.compute_first(productions, first)
         
+        self.first_bits = first
+        self.first = TerminalSetView(first, self.sets)
+        self.suffixes = self.sets.suffix_first(productions, first)
+        self.step_factor = self.sets.step_factor(productions, first)
         return self.first
     
-    def _first_of_production(self, nt, prod):
-        """Calcula FIRST de uma produção com EBNF."""
-        # Produção epsilon
-        if len(prod) == 1 and self.grammar.is_epsilon(prod[0]):
-            self.first[nt].add(self.grammar.epsilon)
-            return
-        
-        i = 0
-        while i < len(prod):
-            symbol = prod[i]
-            
-            # Verificar se próximo é operador EBNF
-            if i + 1 < len(prod) and prod[i + 1] in ['*', '+', '?']:
-                operator = prod[i + 1]
-                first_sym = self._first_of_ebnf(symbol, operator)
-                
-                # A* e A?: adicionar FIRST e continuar (pode derivar ε)
-                if operator in ['*', '?']:
-                    self.first[nt].update(first_sym - {self.grammar.epsilon})
-                    # Sempre continua (pode ser vazio)
-                    i += 2
-                    if i >= len(prod):
-                        # Se último, adicionar ε
-                        self.first[nt].add(self.grammar.epsilon)
-                    continue
-                
-                # A+: adicionar FIRST e parar se não deriva ε
-                elif operator == '+':
-                    self.first[nt].update(first_sym - {self.grammar.epsilon})
-                    if self.grammar.epsilon not in first_sym:
-                        break
-                    i += 2
-                    if i >= len(prod):
-                        self.first[nt].add(self.grammar.epsilon)
-                    continue
-            
-            # Símbolo normal (sem operador EBNF)
-            # Terminal
-            if symbol in self.grammar.terminals:
-                self.first[nt].add(symbol)
-                break
-            
-            # Não-terminal
-            first_sym = self.first.get(symbol, set())
-            self.first[nt].update(first_sym - {self.grammar.epsilon})
-            
-            if self.grammar.epsilon not in first_sym:
-                break
-            
-            i += 1
-            if i >= len(prod):
-                self.first[nt].add(self.grammar.epsilon)
-    
-    def _first_of_ebnf(self, symbol, operator):
+    def compute_follow(self):
         """
-        Calcula FIRST de expressão EBNF.
+        Calcula FOLLOW para todos os não-terminais.
         
-        A* → FIRST(A) ∪ {ε}
-        A+ → FIRST(A)
-        A? → FIRST(A) ∪ {ε}
+        Restrições coletadas uma vez por produção e propagadas pelo
+        algoritmo digraph (ver TerminalSets.compute_follow).
         """
-        if symbol in self.grammar.terminals:
-            base_first = {symbol}
-        else:
-            base_first = self.first.get(symbol, set())
-        
-        if operator == '*':
-            # A* pode ser vazio
-            return base_first | {self.grammar.epsilon}
-        elif operator == '+':
-            # A+ não pode ser vazio
-            return base_first
-        elif operator == '?':
-            # A? pode ser vazio
-            return base_first | {self.grammar.epsilon}
-        
-        return base_first
+        follow = self.sets.compute_follow(
+            self.production_list,
+            self.first_bits,
+            self.grammar.nonterminals,
+            self.grammar.start_symbol,
+            '$',
+            self.suffixes
+        )
+        
+        self.follow_bits = follow
+        self.follow = TerminalSetView(follow, self.sets)
+        return self.follow
     
-    def compute_follow(self):
-        """Calcula FOLLOW para todos os não-terminais."""
-        # $ no FOLLOW do símbolo inicial
-        self.follow[self.grammar.start_symbol].add('$')
-        
-        # Algoritmo de ponto fixo
-        changed = True
-        while changed:
-            changed = False
-            for nt in self.grammar.nonterminals:
-                for prod in self.grammar.productions[nt]:
-                    old_follows = {n: set(f) for n, f in self.follow.items()}
-                    self._follow_of_production(nt, prod)
-                    
-                    for n in self.grammar.nonterminals:
-                        if self.follow[n] != old_follows.get(n, set()):
-                            changed = True
-                            break
+    def production_first_bits(self, nonterminal, production, offset=0):
+        """
+        Bitmask de FIRST(produção[offset:]), lido do cache de sufixos.
         
-        return self.follow
+        Produções que não estão na gramática caem no cálculo direto.
+        """
+        number = self.production_numbers.get((nonterminal, tuple(production)))
+        if number is None:
+            return self.sets.first_of_sequence(production[offset:], self.first_bits)
+        return self.suffixes.first_at(number, offset)
     
-    def _follow_of_production(self, nt, prod):
-        """Atualiza FOLLOW baseado em uma produção com EBNF."""
-        i = 0
-        while i < len(prod):
-            symbol = prod[i]
-            
-            # Só processar não-terminais
-            if symbol not in self.grammar.nonterminals:
-                i += 1
-                continue
-            
-            # Verificar se próximo é operador EBNF
-            next_is_ebnf_op = (i + 1 < len(prod) and prod[i + 1] in ['*', '+', '?'])
-            
-            if next_is_ebnf_op:
-                operator = prod[i + 1]
-                
-                # Para A* e A+: FOLLOW(A) inclui FIRST(A) (recursão)
-                if operator in ['*', '+']:
-                    self.follow[symbol].update(self.first.get(symbol, set()) - {self.grammar.epsilon})
-                
-                # Verificar o que vem depois do operador
-                if i + 2 < len(prod):
-                    beta = prod[i + 2:]
-                    first_beta = self._first_of_string(beta)
-                    self.follow[symbol].update(first_beta - {self.grammar.epsilon})
-                    
-                    if self.grammar.epsilon in first_beta:
-                        self.follow[symbol].update(self.follow[nt])
-                else:
-                    # A* é último: FOLLOW(A) inclui FOLLOW(nt)
-                    self.follow[symbol].update(self.follow[nt])
-                
-                i += 2
-            else:
-                # Símbolo normal
-                if i + 1 < len(prod):
-                    beta = prod[i + 1:]
-                    first_beta = self._first_of_string(beta)
-                    self.follow[symbol].update(first_beta - {self.grammar.epsilon})
-                    
-                    if self.grammar.epsilon in first_beta:
-                        self.follow[symbol].update(self.follow[nt])
-                else:
-                    self.follow[symbol].update(self.follow[nt])
-                
-                i += 1
+    def first_of_production(self, nonterminal, production, offset=0):
+        """FIRST(produção[offset:]) como conjunto de nomes."""
+        return self.sets.names(self.production_first_bits(nonterminal, production, offset))
     
-    def _first_of_string(self, string):
+    def first_of_string(self, string):
         """Calcula FIRST de uma string de símbolos com EBNF."""
-        result = set()
-        
-        i = 0
-        while i < len(string):
-            symbol = string[i]
-            
-            # Verificar operador EBNF
-            if i + 1 < len(string) and string[i + 1] in ['*', '+', '?']:
-                operator = string[i + 1]
-                first_sym = self._first_of_ebnf(symbol, operator)
-                result.update(first_sym - {self.grammar.epsilon})
-                
-                # A* e A? sempre podem ser vazios, continuar
-                if operator in ['*', '?']:
-                    i += 2
-                    if i >= len(string):
-                        result.add(self.grammar.epsilon)
-                    continue
-                
-                # A+ só continua se deriva epsilon
-                elif operator == '+':
-                    if self.grammar.epsilon not in first_sym:
-                        break
-                    i += 2
-                    if i >= len(string):
-                        result.add(self.grammar.epsilon)
-                    continue
-            
-            # Terminal
-            if symbol in self.grammar.terminals:
-                result.add(symbol)
-                break
-            
-            # Não-terminal
-            first_sym = self.first.get(symbol, set())
-            result.update(first_sym - {self.grammar.epsilon})
-            
-            if self.grammar.epsilon not in first_sym:
-                break
-            
-            i += 1
-            if i >= len(string):
-                result.add(self.grammar.epsilon)
-        
-        return result
+        return self.sets.names(self.sets.first_of_sequence(string, self.first_bits))
     
     def debug_print(self):
         """Imprime First e Follow."""
@@ -1,11 +1,13 @@
 """
 Classe Grammar que lê EBNF SEM converter para BNF
-Mantém operadores *, +, ? nas produções
+Mantém operadores *, +, ? nas produções (to_bnf() gera a versão em BNF)
 """
 
 import re
 from collections import defaultdict
 
+from symbols import SymbolTable
+
 
 class Grammar:
     """Gramática que lê EBNF mas não converte."""
@@ -16,6 +18,8 @@ class Grammar:
         self.productions = defaultdict(list)
         self.start_symbol = None
         self.epsilon = 'ε'
+        self.end_marker = '$'
+        self.symbols = None  # Ids densos dos símbolos (SymbolTable)
         
     def load_from_file(self, filepath):
         """Carrega gramática de arquivo mantendo EBNF."""
@@ -57,6 +61,9 @@ class Grammar:
         # Processar cada regra
         for rule in merged_lines:
             self._parse_rule(rule)
+        
+        # Numerar terminais (incluindo $) e não-terminais
+        self.symbols = SymbolTable(self.terminals | {self.end_marker}, self.nonterminals)
     
     def _parse_rule(self, line):
         """Parse uma regra sem converter EBNF."""
@@ -75,18 +82,106 @@ class Grammar:
             symbols = self._tokenize(alt.strip())
             
             if symbols:
-                self.productions[left].append(symbols)
-                
-                # Registrar terminais e não-terminais
-                for sym in symbols:
-                    # Pular operadores EBNF
-                    if sym in ['*', '+', '?']:
-                        continue
-                    
-                    if self._is_nonterminal(sym):
-                        self.nonterminals.add(sym)
-                    elif sym != self.epsilon:
-                        self.terminals.add(sym)
+                self._add_production(left, symbols)
+    
+    def _add_production(self, head, symbols):
+        """Adiciona uma produção e registra terminais e não-terminais."""
+        self.nonterminals.add(head)
+        self.productions[head].append(symbols)
+        for sym in symbols:
+            self._register_symbol(sym)
+    
+    def _register_symbol(self, sym):
+        """Registra um símbolo; símbolos dentro de grupos também recebem ids."""
+        # Pular operadores EBNF
+        if sym in ['*', '+', '?']:
+            return
+        
+        if self._is_nonterminal(sym):
+            self.nonterminals.add(sym)
+        elif sym != self.epsilon:
+            self.terminals.add(sym)
+        
+        if sym.startswith('(') and sym.endswith(')'):
+            for alt in self._split_alternatives(sym[1:-1]):
+                for inner in self._tokenize(alt.strip()):
+                    self._register_symbol(inner)
+    
+    def to_bnf(self):
+        """
+        Retorna uma nova Grammar em BNF puro, sem grupos nem *, + e ?.
+        
+        Cada construção EBNF vira um não-terminal auxiliar novo, nomeado
+        a partir da cabeça da regra (recursão à direita):
+        - X*      → <A_rep1> ::= X <A_rep1> | ε
+        - X+      → X <A_rep1>
+        - X?      → <A_opt1> ::= X | ε
+        - (α | β) → <A_grp1> ::= α | β   (grupo sem | é copiado no lugar)
+        
+        Na gramática resultante a tabela LL(1) decide todas as
+        expansões; o parser não precisa tratar operadores EBNF.
+        """
+        bnf = Grammar()
+        bnf.start_symbol = self.start_symbol
+        bnf.epsilon = self.epsilon
+        bnf.end_marker = self.end_marker
+        counters = defaultdict(int)
+        
+        for nt in self.productions:
+            bnf.productions[nt]  # Mantém a ordem das regras originais
+            for prod in self.productions[nt]:
+                bnf._add_production(nt, self._desugar(bnf, nt, prod, counters))
+        
+        bnf.symbols = SymbolTable(bnf.terminals | {bnf.end_marker}, bnf.nonterminals)
+        return bnf
+    
+    def _desugar(self, bnf, head, symbols, counters):
+        """Reescreve uma sequência EBNF em símbolos BNF, criando auxiliares em bnf."""
+        result = []
+        i = 0
+        while i < len(symbols):
+            symbol = symbols[i]
+            operator = symbols[i + 1] if i + 1 < len(symbols) and symbols[i + 1] in ['*', '+', '?'] else None
+            i += 2 if operator else 1
+            
+            if symbol.startswith('(') and symbol.endswith(')'):
+                alternatives = [self._desugar(bnf, head, self._tokenize(alt.strip()), counters)
+                                for alt in self._split_alternatives(symbol[1:-1])]
+                if len(alternatives) == 1:
+                    element = alternatives[0]
+                else:
+                    group = self._helper_name(head, 'grp', counters)
+                    for alt in alternatives:
+                        bnf._add_production(group, alt)
+                    element = [group]
+            else:
+                element = [symbol]
+            
+            if operator is None:
+                result.extend(element)
+            elif operator == '?':
+                optional = self._helper_name(head, 'opt', counters)
+                bnf._add_production(optional, element)
+                bnf._add_production(optional, [self.epsilon])
+                result.append(optional)
+            else:
+                # X* e X+ (= X X*) compartilham a cauda recursiva
+                tail = self._helper_name(head, 'rep', counters)
+                bnf._add_production(tail, element + [tail])
+                bnf._add_production(tail, [self.epsilon])
+                if operator == '+':
+                    result.extend(element)
+                result.append(tail)
+        
+        return result
+    
+    def _helper_name(self, head, kind, counters):
+        """Nome novo de não-terminal auxiliar (ex.: <block_rep1>)."""
+        while True:
+            counters[head, kind] += 1
+            name = f"<{head[1:-1]}_{kind}{counters[head, kind]}>"
+            if name not in self.nonterminals:
+                return name
     
     def _split_alternatives(self, text):
         """Divide alternativas por | respeitando parênteses e aspas."""
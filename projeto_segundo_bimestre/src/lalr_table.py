@@ -0,0 +1,220 @@
+"""
+=============================================================================
+TABELA DE PARSING LALR(1) - LINGUAGEM VYTHON
+=============================================================================
+
+Construção da tabela LALR(1) sobre o mesmo autômato LR(0) da tabela
+SLR(1) (CanonicalCollection). A única diferença está nas reduções: em
+vez de FOLLOW(A), cada item completo [A -> ω •] do estado q usa o
+lookahead LA(q, A -> ω), calculado pelas relações de DeRemer e Pennello
+sobre as transições por não-terminal (p, A):
+
+- DR(p, A)     = terminais lidos logo após GOTO(p, A)
+- reads        : (p, A) reads (r, C) se r = GOTO(p, A) e C ⇒* ε
+- includes     : (p, A) includes (p', B) se B -> β A γ, γ ⇒* ε e
+                 p' --β--> p
+- lookback     : (q, A -> ω) lookback (p, A) se p --ω--> q
+
+Read = digraph(reads, DR), Follow = digraph(includes, Read) e
+LA(q, A -> ω) = ⋃ Follow(p, A) para cada lookback. As duas passadas do
+algoritmo digraph são lineares no tamanho das relações, sem construir
+os estados LR(1) canônicos.
+
+A interface (get_action, get_goto, conflicts, tabelas densas) é a de
+SLRParsingTable, então o SLRParser usa a tabela sem mudanças.
+=============================================================================
+"""
+
+from typing import Dict, List, Set, Tuple
+
+from slr_grammar import SLRGrammar, SLRFirstFollow, Production
+from slr_items import CanonicalCollection
+from slr_table import SLRParsingTable
+from terminal_sets import digraph
+
+
+# Transição por não-terminal: (estado de origem, não-terminal)
+Transition = Tuple[int, str]
+
+
+class LALRParsingTable(SLRParsingTable):
+    """
+    Tabela de parsing LALR(1).
+    
+    Shift, accept e GOTO são construídos como na SLR(1); reduções usam
+    os lookaheads LALR(1) em vez de FOLLOW (_reduce_lookaheads).
+    
+    Attributes:
+        lookaheads: (estado, número da produção) -> bitmask de terminais
+    """
+    
+    KIND = "LALR(1)"
+    
+    def __init__(self, grammar: SLRGrammar, collection: CanonicalCollection,
+                 first_follow: SLRFirstFollow):
+        super().__init__(grammar, collection, first_follow)
+        self.lookaheads: Dict[Tuple[int, int], int] = {}
+    
+    def build(self) -> bool:
+        """
+        Constrói a tabela de parsing LALR(1).
+        
+        Returns:
+            True se não houver conflitos, False caso contrário.
+        """
+        self._compute_lookaheads()
+        return super().build()
+    
+    # -------------------------------------------------------------------------
+    # LOOKAHEADS (DeRemer e Pennello)
+    # -------------------------------------------------------------------------
+    
+    def _compute_lookaheads(self):
+        """Calcula LA(q, A -> ω) para todos os itens completos."""
+        grammar = self.grammar
+        sets = self.first_follow.sets
+        first = self.first_follow.first_bits
+        epsilon = sets.EPSILON
+        goto = self.collection.goto_table
+        
+        # Transições por não-terminal e sucessores de cada estado
+        transitions: List[Transition] = []
+        successors: Dict[int, List[str]] = {}
+        for (state, symbol), _ in goto.items():
+            successors.setdefault(state, []).append(symbol)
+            if grammar.is_nonterminal(symbol):
+                transitions.append((state, symbol))
+        
+        # DR e reads
+        direct: Dict[Transition, int] = {}
+        reads: Dict[Transition, Set[Transition]] = {}
+        for state, symbol in transitions:
+            target = goto[(state, symbol)]
+            mask = 0
+            for next_symbol in successors.get(target, ()):
+                if grammar.is_nonterminal(next_symbol):
+                    if first.get(next_symbol, 0) & epsilon:
+                        reads.setdefault((state, symbol), set()).add((target, next_symbol))
+                else:
+                    mask |= sets.bit(next_symbol)
+            direct[(state, symbol)] = mask
+        
+        # S' -> S •: $ é lido após a transição (0, S)
+        start = (0, grammar.original_start)
+        if start in direct:
+            direct[start] |= sets.bit(grammar.END_MARKER)
+        
+        read = digraph(transitions, reads, direct)
+        
+        # includes e lookback, percorrendo cada produção a partir de p'
+        includes: Dict[Transition, Set[Transition]] = {}
+        lookback: Dict[Tuple[int, int], List[Transition]] = {}
+        suffixes = self.first_follow.suffixes
+        reduce_lengths = grammar.reduce_lengths
+        
+        for transition in transitions:
+            origin, head = transition
+            for prod in grammar.get_productions_for(head):
+                state = origin
+                for i in range(reduce_lengths[prod.number]):
+                    symbol = prod.body[i]
+                    if (grammar.is_nonterminal(symbol)
+                            and suffixes.is_nullable(prod.number, i + 1)):
+                        includes.setdefault((state, symbol), set()).add(transition)
+                    state = goto[(state, symbol)]
+                lookback.setdefault((state, prod.number), []).append(transition)
+        
+        follow = digraph(transitions, includes, read)
+        
+        lookaheads: Dict[Tuple[int, int], int] = {}
+        for key, sources in lookback.items():
+            mask = 0
+            for transition in sources:
+                mask |= follow[transition]
+            lookaheads[key] = mask
+        
+        self.lookaheads = lookaheads
+    
+    def get_lookaheads(self, state: int, production: int) -> Set[str]:
+        """Retorna LA(estado, produção) como conjunto de terminais."""
+        return self.first_follow.sets.names(self.lookaheads.get((state, production), 0))
+    
+    def _reduce_lookaheads(self, state_idx: int, prod: Production) -> Set[str]:
+        """Terminais que disparam a redução por prod no estado: LA(q, A -> ω)."""
+        return self.get_lookaheads(state_idx, prod.number)
+    
+    def print_statistics(self):
+        """Imprime estatísticas da tabela."""
+        super().print_statistics()
+        print(f"  - Itens completos com lookahead LALR(1): {len(self.lookaheads)}")
+
+
+# =============================================================================
+# TESTE DO MÓDULO
+# =============================================================================
+
+if __name__ == "__main__":
+    import sys
+    import os
+    
+    if len(sys.argv) > 1:
+        grammar_file = sys.argv[1]
+    else:
+        # Procurar gramatica_slr.bnf em docs/
+        possible_paths = [
+            "../docs/gramatica_slr.bnf",
+            "docs/gramatica_slr.bnf",
+            "gramatica_slr.bnf",
+        ]
+        grammar_file = None
+        for path in possible_paths:
+            if os.path.exists(path):
+                grammar_file = path
+                break
+        if not grammar_file:
+            grammar_file = "gramatica_slr.bnf"
+    
+    print("=" * 70)
+    print("TESTE: CONSTRUÇÃO DA TABELA LALR(1)")
+    print("=" * 70)
+    
+    # Carregar gramática
+    print(f"\n[1] Carregando gramática: {grammar_file}")
+    grammar = SLRGrammar()
+    
+    try:
+        grammar.load_from_file(grammar_file)
+        print(f"    Produções: {len(grammar.productions)}")
+    except FileNotFoundError:
+        print(f"    ❌ ERRO: Arquivo não encontrado: {grammar_file}")
+        print(f"    Diretório atual: {os.getcwd()}")
+        sys.exit(1)
+    
+    # Calcular FIRST e FOLLOW
+    print("\n[2] Calculando FIRST e FOLLOW...")
+    ff = SLRFirstFollow(grammar)
+    ff.compute()
+    
+    # Construir coleção canônica
+    print("\n[3] Construindo coleção canônica...")
+    collection = CanonicalCollection(grammar)
+    collection.build()
+    print(f"    Estados: {len(collection.states)}")
+    
+    # Construir tabelas SLR e LALR sobre o mesmo autômato
+    print("\n[4] Construindo tabelas SLR(1) e LALR(1)...")
+    slr_table = SLRParsingTable(grammar, collection, ff)
+    slr_table.build()
+    table = LALRParsingTable(grammar, collection, ff)
+    is_lalr1 = table.build()
+    
+    table.print_statistics()
+    table.print_conflicts()
+    
+    print(f"\n    Conflitos SLR(1):  {len(slr_table.conflicts)}")
+    print(f"    Conflitos LALR(1): {len(table.conflicts)}")
+    
+    if is_lalr1:
+        print("\n✅ Gramática é LALR(1)!")
+    else:
+        print(f"\n❌ Gramática NÃO é LALR(1) - {len(table.conflicts)} conflito(s)")
@@ -66,8 +66,11 @@ CLASSES DE LEXEMAS (TOKEN TYPES)
 =============================================================================
 """
 
+import os
 import re
-from typing import List, Tuple, Optional
+import mmap as mmap_module
+from array import array
+from typing import List, Tuple, Optional, Iterator, Iterable, Union, TextIO, Dict
 from enum import Enum, auto
 from dataclasses import dataclass
 
@@ -142,6 +145,63 @@ class RegexPatterns:
     NOT_EQUAL = re.compile(r'!=')     # Diferença
     LESS_EQUAL = re.compile(r'<=')    # Menor ou igual
     GREATER_EQUAL = re.compile(r'>=') # Maior ou igual
+    
+    # -------------------------------------------------------------------------
+    # PADRÃO: OPERADORES E DELIMITADORES DE UM CARACTERE
+    # -------------------------------------------------------------------------
+    # Mesmo conjunto de Lexer.SINGLE_CHAR_TOKENS
+    # -------------------------------------------------------------------------
+    SINGLE_CHAR = re.compile(r'[+\-*/%<>=&|()\[\]{},:;]')
+    
+    # -------------------------------------------------------------------------
+    # PADRÃO MESTRE (VARREDURA EM PASSADA ÚNICA)
+    # -------------------------------------------------------------------------
+    # Alternação de grupos nomeados na MESMA ordem de prioridade usada
+    # pelos métodos _match_* do Lexer. O grupo INVALID casa qualquer
+    # outro caractere, então finditer percorre o código sem lacunas.
+    # -------------------------------------------------------------------------
+    MASTER = re.compile('|'.join(
+        f'(?P<{name}>{pattern.pattern})' for name, pattern in [
+            ('WHITESPACE', WHITESPACE),
+            ('NEWLINE', NEWLINE),
+            ('COMMENT', COMMENT),
+            ('STRING_DOUBLE', STRING_DOUBLE),
+            ('STRING_SINGLE', STRING_SINGLE),
+            ('NUMBER', NUMBER),
+            ('IDENTIFIER', IDENTIFIER),
+            ('POWER', POWER),
+            ('EQUAL', EQUAL),
+            ('NOT_EQUAL', NOT_EQUAL),
+            ('LESS_EQUAL', LESS_EQUAL),
+            ('GREATER_EQUAL', GREATER_EQUAL),
+            ('SINGLE_CHAR', SINGLE_CHAR),
+        ]
+    ) + r'|(?P<INVALID>.)', re.DOTALL)
+    
+    # -------------------------------------------------------------------------
+    # PADRÃO MESTRE EM BYTES (ARQUIVOS MAPEADOS EM MEMÓRIA)
+    # -------------------------------------------------------------------------
+    # Mesmos grupos de MASTER, aplicados direto sobre os bytes UTF-8.
+    # Quebras de linha seguem a leitura em modo texto (\r\n, \r e \n
+    # contam como uma quebra), por isso NEWLINE e COMMENT diferem.
+    # -------------------------------------------------------------------------
+    MASTER_BYTES = re.compile(b'|'.join(
+        b'(?P<%s>%s)' % (name.encode(), pattern) for name, pattern in [
+            ('WHITESPACE', WHITESPACE.pattern.encode()),
+            ('NEWLINE', rb'\r\n|\r|\n'),
+            ('COMMENT', rb'#[^\r\n]*'),
+            ('STRING_DOUBLE', STRING_DOUBLE.pattern.encode()),
+            ('STRING_SINGLE', STRING_SINGLE.pattern.encode()),
+            ('NUMBER', NUMBER.pattern.encode()),
+            ('IDENTIFIER', IDENTIFIER.pattern.encode()),
+            ('POWER', POWER.pattern.encode()),
+            ('EQUAL', EQUAL.pattern.encode()),
+            ('NOT_EQUAL', NOT_EQUAL.pattern.encode()),
+            ('LESS_EQUAL', LESS_EQUAL.pattern.encode()),
+            ('GREATER_EQUAL', GREATER_EQUAL.pattern.encode()),
+            ('SINGLE_CHAR', SINGLE_CHAR.pattern.encode()),
+        ]
+    ) + rb'|(?P<INVALID>.)', re.DOTALL)
 
 
 # =============================================================================
@@ -254,6 +314,177 @@ class Token:
         return (self.type, self.value)
 
 
+class MappedToken:
+    """
+    Token produzido a partir de um arquivo mapeado em memória.
+    
+    Guarda apenas as posições do lexema nos bytes do arquivo; value e
+    lexeme são decodificados somente quando acessados.
+    
+    Attributes:
+        type: Tipo/classe do token
+        line: Linha onde o token foi encontrado
+        column: Coluna onde o token começa (em caracteres)
+        start: Posição (em bytes) do início do lexema
+        end: Posição (em bytes) do fim do lexema
+    """
+    __slots__ = ('type', 'line', 'column', 'start', 'end', '_data', '_encoding')
+    
+    def __init__(self, token_type: str, line: int, column: int,
+                 data, start: int, end: int, encoding: str = 'utf-8'):
+        self.type = token_type
+        self.line = line
+        self.column = column
+        self.start = start
+        self.end = end
+        self._data = data
+        self._encoding = encoding
+    
+    @property
+    def lexeme(self) -> str:
+        """Texto original do lexema."""
+        return _decode_text(self._data[self.start:self.end], self._encoding)
+    
+    @property
+    def value(self) -> str:
+        """Valor do lexema (strings sem as aspas)."""
+        if self.type == 'STRING':
+            return _decode_text(self._data[self.start + 1:self.end - 1], self._encoding)
+        return self.lexeme
+    
+    def __repr__(self):
+        return f"Token({self.type}, '{self.value}', {self.line}:{self.column})"
+    
+    def to_tuple(self) -> Tuple[str, str]:
+        """Converte para tupla (tipo, valor) para o parser."""
+        return (self.type, self.value)
+
+
+def _decode_text(data: bytes, encoding: str = 'utf-8') -> str:
+    """Decodifica bytes como na leitura em modo texto (CRLF e CR viram LF)."""
+    text = data.decode(encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+# =============================================================================
+# CADEIA DE TOKENS COMPACTA (STRUCT-OF-ARRAYS)
+# =============================================================================
+
+class TokenBuffer:
+    """
+    Cadeia de tokens armazenada em colunas.
+    
+    Em vez de um objeto Token por lexema, cada atributo fica em um
+    array('i') indexado pela posição do token (4 bytes por campo).
+    O texto é recortado do código-fonte somente quando pedido.
+    
+    Com uma SymbolTable, os tipos são gravados já como ids dos terminais
+    da gramática, e o parser usa type_ids diretamente nas tabelas.
+    
+    Attributes:
+        source: Código-fonte (str) ou bytes do arquivo mapeado
+        symbols: SymbolTable usada na numeração (ou None)
+        type_names: Tipo de token para cada id
+        ids_by_type: Id de cada tipo de token
+        type_ids: Id do tipo de cada token (índice em type_names)
+        starts: Início do lexema no código-fonte
+        ends: Fim do lexema no código-fonte
+        lines: Linha de cada token
+        columns: Coluna de cada token
+    """
+    
+    # Numeração padrão (sem gramática), na ordem de TokenType
+    TYPE_NAMES: Tuple[str, ...] = tuple(t.value for t in TokenType)
+    TYPE_IDS: Dict[str, int] = {name: i for i, name in enumerate(TYPE_NAMES)}
+    
+    def __init__(self, source, encoding: str = 'utf-8', symbols=None):
+        self.source = source
+        self.encoding = encoding
+        self.symbols = symbols
+        
+        if symbols is None:
+            self.type_names = self.TYPE_NAMES
+            self.ids_by_type = self.TYPE_IDS
+        else:
+            # Ids da gramática; tipos que não são terminais vêm depois
+            names = list(symbols.token_names)
+            ids = {}
+            for name in self.TYPE_NAMES:
+                symbol_id = symbols.token_id(name)
+                if symbol_id < 0:
+                    symbol_id = len(names)
+                    names.append(name)
+                ids[name] = symbol_id
+            self.type_names = tuple(names)
+            self.ids_by_type = ids
+        
+        self._eof_id = self.ids_by_type['EOF']
+        self._string_id = self.ids_by_type['STRING']
+        
+        self.type_ids = array('i')
+        self.starts = array('i')
+        self.ends = array('i')
+        self.lines = array('i')
+        self.columns = array('i')
+    
+    def __len__(self):
+        return len(self.type_ids)
+    
+    def __getitem__(self, index: int) -> Token:
+        """Materializa o token na posição `index`."""
+        return Token(
+            type=self.type_of(index),
+            value=self.value_of(index),
+            line=self.lines[index],
+            column=self.columns[index],
+            lexeme=self.lexeme_of(index)
+        )
+    
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    def append(self, type_id: int, start: int, end: int, line: int, column: int):
+        """Adiciona um token ao final da cadeia."""
+        self.type_ids.append(type_id)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.columns.append(column)
+    
+    def type_of(self, index: int) -> str:
+        """Retorna o tipo do token."""
+        return self.type_names[self.type_ids[index]]
+    
+    def lexeme_of(self, index: int) -> str:
+        """Retorna o texto original do token."""
+        if self.type_ids[index] == self._eof_id:
+            return 'EOF'
+        return self._text(self.starts[index], self.ends[index])
+    
+    def value_of(self, index: int) -> str:
+        """Retorna o valor do token (strings sem as aspas)."""
+        type_id = self.type_ids[index]
+        if type_id == self._eof_id:
+            return 'EOF'
+        if type_id == self._string_id:
+            return self._text(self.starts[index] + 1, self.ends[index] - 1)
+        return self._text(self.starts[index], self.ends[index])
+    
+    def to_tuples(self) -> List[Tuple[str, str]]:
+        """Retorna tokens como lista de tuplas (tipo, valor)."""
+        return [(self.type_of(i), self.value_of(i)) for i in range(len(self))]
+    
+    def _text(self, start: int, end: int) -> str:
+        """Recorta o código-fonte entre start e end."""
+        text = self.source[start:end]
+        if isinstance(text, str):
+            return text
+        return _decode_text(text, self.encoding)
+
+
 # =============================================================================
 # ANALISADOR LÉXICO (LEXER/SCANNER)
 # =============================================================================
@@ -332,18 +563,102 @@ class Lexer:
         ';': ';',
     }
     
-    def __init__(self, source_code: str):
+    # -------------------------------------------------------------------------
+    # MOTORES DE VARREDURA
+    # -------------------------------------------------------------------------
+    # 'master':     uma única regex (RegexPatterns.MASTER) em passada única
+    # 'sequential': tenta os métodos _match_* um a um em cada posição
+    # -------------------------------------------------------------------------
+    ENGINES = ('master', 'sequential')
+    
+    # Grupos do padrão mestre que não geram token
+    _SKIP_GROUPS = frozenset({'WHITESPACE', 'COMMENT'})
+    
+    # Todos os operadores/delimitadores (lexema -> tipo)
+    _OPERATORS = {**MULTI_CHAR_OPERATORS, **SINGLE_CHAR_TOKENS}
+    
+    # Tabelas em bytes usadas pela varredura de arquivos mapeados
+    _KEYWORDS_BYTES = {k.encode(): v for k, v in KEYWORDS.items()}
+    _OPERATORS_BYTES = {op.encode(): op for op in
+                        list(MULTI_CHAR_OPERATORS) + list(SINGLE_CHAR_TOKENS)}
+    
+    def __init__(self, source_code: str, engine: str = 'master'):
         """
         Inicializa o lexer.
         
         Args:
             source_code: Código-fonte Vython a ser analisado
+            engine: Motor de varredura ('master' ou 'sequential')
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Motor de varredura desconhecido: {engine}")
+        
         self.source = source_code
+        self.engine = engine
+        self.mapped = None      # Bytes do arquivo (ver from_path)
+        self.encoding = 'utf-8'
         self.position = 0       # Posição atual no código
         self.line = 1           # Linha atual (para mensagens de erro)
         self.column = 1         # Coluna atual
         self.tokens: List[Token] = []
+    
+    @classmethod
+    def from_path(cls, path: str, mmap: bool = True,
+                  encoding: str = 'utf-8') -> 'Lexer':
+        """
+        Cria um lexer para um arquivo de código-fonte.
+        
+        Com mmap=True o arquivo é mapeado em memória e varrido com
+        RegexPatterns.MASTER_BYTES, sem criar uma cópia str do conteúdo.
+        Os tokens gerados são MappedToken (texto decodificado sob demanda),
+        com linhas e colunas iguais às da leitura em modo texto.
+        
+        Args:
+            path: Caminho do arquivo .vy
+            mmap: Se True, usa o arquivo mapeado em memória
+            encoding: Codificação do arquivo (compatível com ASCII)
+            
+        Returns:
+            Lexer pronto para tokenize() ou iter_tokens()
+        """
+        if not mmap:
+            with open(path, 'r', encoding=encoding) as f:
+                return cls(f.read())
+        
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap não aceita arquivos vazios
+                return cls('')
+            mapped = mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ)
+        
+        lexer = cls('')
+        lexer.mapped = mapped
+        lexer.encoding = encoding
+        return lexer
+    
+    def close(self):
+        """
+        Libera o arquivo mapeado por from_path (no Windows, o arquivo fica
+        bloqueado enquanto o mapeamento existir).
+        
+        Depois disso, MappedToken e TokenBuffer lidos do mapeamento não
+        podem mais decodificar o texto; as tuplas de get_token_tuples()
+        continuam válidas. Sem arquivo mapeado, não faz nada.
+        """
+        if self.mapped is not None:
+            self.mapped.close()
+    
+    def _check_open(self):
+        """Recusa varrer um arquivo mapeado já liberado por close()."""
+        if self.mapped is not None and self.mapped.closed:
+            raise ValueError("Lexer fechado: o arquivo mapeado já foi liberado")
+    
+    def __enter__(self) -> 'Lexer':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
         
     def tokenize(self) -> List[Token]:
         """
@@ -358,8 +673,350 @@ class Lexer:
         Returns:
             Lista de tokens identificados
         """
+        self._check_open()
         self.tokens = []
         
+        if self.mapped is not None:
+            self.tokens.extend(self._scan_mapped())
+        elif self.engine == 'master':
+            self.tokens.extend(self._scan_master((self.source[self.position:],)))
+        else:
+            self._scan_sequential()
+        
+        # Adicionar token de fim de arquivo
+        self.tokens.append(Token(
+            type='EOF',
+            value='EOF',
+            line=self.line,
+            column=self.column,
+            lexeme='EOF'
+        ))
+        
+        return self.tokens
+    
+    def iter_tokens(self, source: Union[str, TextIO, None] = None) -> Iterator[Token]:
+        """
+        Gera os tokens sob demanda, terminando com o token EOF.
+        
+        Diferente de tokenize(), nada é acumulado em self.tokens: o parser
+        pode consumir o gerador diretamente enquanto o arquivo é lido.
+        
+        Só o motor 'master' é incremental. O motor 'sequential' precisa
+        do código inteiro: os tokens são calculados antes do primeiro
+        yield e um arquivo aberto como source é recusado.
+        
+        Args:
+            source: Código-fonte (str) ou arquivo texto aberto, lido linha
+                    a linha. Se omitido, usa o código passado ao construtor
+                    (ou o arquivo mapeado por from_path).
+        
+        Yields:
+            Tokens na ordem do código-fonte
+        
+        Raises:
+            ValueError: Arquivo como source com o motor 'sequential'
+        """
+        self.position = 0
+        self.line = 1
+        self.column = 1
+        
+        if source is None:
+            self._check_open()
+            if self.mapped is not None:
+                yield from self._scan_mapped()
+                yield Token('EOF', 'EOF', self.line, self.column, 'EOF')
+                return
+            source = self.source
+        
+        if self.engine == 'sequential':
+            # O motor sequencial precisa do código completo em memória
+            if not isinstance(source, str):
+                raise ValueError("O motor 'sequential' não lê arquivos sob demanda; "
+                                 "use engine='master' ou passe o código como str")
+            lexer = Lexer(source, engine='sequential')
+            yield from lexer.tokenize()
+            self.position = lexer.position
+            self.line = lexer.line
+            self.column = lexer.column
+            return
+        
+        chunks = (source,) if isinstance(source, str) else source
+        yield from self._scan_master(chunks)
+        
+        yield Token(
+            type='EOF',
+            value='EOF',
+            line=self.line,
+            column=self.column,
+            lexeme='EOF'
+        )
+    
+    def _scan_master(self, chunks: Iterable[str]) -> Iterator[Token]:
+        """
+        Varredura em passada única com o padrão mestre.
+        
+        Cada casamento de RegexPatterns.MASTER informa, via lastgroup,
+        qual classe de lexema foi reconhecida. A prioridade entre as
+        classes é a mesma de _scan_sequential.
+        
+        O código chega em pedaços (linhas de um arquivo ou uma única
+        string). Só um literal string pode atravessar uma quebra de linha,
+        então uma aspa sem fechamento adia o restante do pedaço até que
+        chegue um pedaço com a aspa de fechamento; só então o texto adiado
+        é varrido de novo, uma única vez. No fim da entrada, a aspa
+        aberta vira erro léxico.
+        
+        Args:
+            chunks: Pedaços consecutivos do código-fonte
+        """
+        keywords = self.KEYWORDS
+        skip_groups = self._SKIP_GROUPS
+        finditer = RegexPatterns.MASTER.finditer
+        line = self.line
+        column = self.column
+        offset = self.position   # Posição do início de `pending` no código
+        pending: List[str] = []  # Pedaços adiados por uma string aberta
+        quote = ''               # Aspa que abriu a string adiada
+        
+        for chunk in chunks:
+            if pending:
+                # Só volta a varrer quando a string adiada pode fechar
+                pending.append(chunk)
+                if quote not in chunk:
+                    continue
+                buffer = ''.join(pending)
+                pending = []
+            else:
+                buffer = chunk
+            
+            for match in finditer(buffer):
+                kind = match.lastgroup
+                lexeme = match.group()
+                
+                if kind == 'NEWLINE':
+                    line += 1
+                    column = 1
+                    continue
+                
+                if kind in skip_groups:
+                    column += len(lexeme)
+                    continue
+                
+                if kind == 'INVALID':
+                    if lexeme == '"' or lexeme == "'":
+                        # String pode fechar em um pedaço seguinte
+                        pending.append(buffer[match.start():])
+                        quote = lexeme
+                        break
+                    
+                    # Caractere não reconhecido
+                    self.position = offset + match.start()
+                    self.line = line
+                    self.column = column
+                    raise LexicalError(
+                        f"Caractere inválido '{lexeme}'",
+                        line,
+                        column
+                    )
+                
+                if kind == 'IDENTIFIER':
+                    token_type = keywords.get(lexeme, 'IDENTIFIER')
+                    value = lexeme
+                elif kind == 'NUMBER':
+                    token_type = 'NUMBER'
+                    value = lexeme
+                elif kind == 'STRING_DOUBLE' or kind == 'STRING_SINGLE':
+                    token_type = 'STRING'
+                    value = lexeme[1:-1]  # Remove aspas
+                else:
+                    # Operadores e delimitadores: o tipo é o próprio lexema
+                    token_type = lexeme
+                    value = lexeme
+                
+                yield Token(token_type, value, line, column, lexeme)
+                column += len(lexeme)
+            
+            offset += len(buffer) - (len(pending[0]) if pending else 0)
+        
+        if pending:
+            # Aspa sem fechamento até o fim da entrada
+            self.position = offset
+            self.line = line
+            self.column = column
+            raise LexicalError(
+                f"Caractere inválido '{quote}'",
+                line,
+                column
+            )
+        
+        self.position = offset
+        self.line = line
+        self.column = column
+    
+    def _scan_mapped(self) -> Iterator[MappedToken]:
+        """
+        Varredura em passada única sobre os bytes do arquivo mapeado.
+        
+        Equivalente a _scan_master, mas com RegexPatterns.MASTER_BYTES.
+        Colunas contam caracteres, não bytes: lexemas não-ASCII (só
+        possíveis em strings e comentários) são decodificados para medir
+        seu comprimento.
+        """
+        data = self.mapped
+        encoding = self.encoding
+        keywords = self._KEYWORDS_BYTES
+        operators = self._OPERATORS_BYTES
+        skip_groups = self._SKIP_GROUPS
+        line = self.line
+        column = self.column
+        
+        for match in RegexPatterns.MASTER_BYTES.finditer(data, self.position):
+            kind = match.lastgroup
+            
+            if kind == 'NEWLINE':
+                line += 1
+                column = 1
+                continue
+            
+            start, end = match.span()
+            
+            if kind == 'WHITESPACE' or kind == 'NUMBER':
+                length = end - start
+            elif kind == 'INVALID':
+                # Caractere não reconhecido (pode ocupar vários bytes)
+                char = data[start:start + 4].decode(encoding, errors='replace')[0]
+                self.position = start
+                self.line = line
+                self.column = column
+                raise LexicalError(
+                    f"Caractere inválido '{char}'",
+                    line,
+                    column
+                )
+            else:
+                lexeme = match.group()
+                length = len(lexeme) if lexeme.isascii() else len(_decode_text(lexeme, encoding))
+            
+            if kind in skip_groups:
+                column += length
+                continue
+            
+            if kind == 'IDENTIFIER':
+                token_type = keywords.get(lexeme, 'IDENTIFIER')
+            elif kind == 'NUMBER':
+                token_type = 'NUMBER'
+            elif kind == 'STRING_DOUBLE' or kind == 'STRING_SINGLE':
+                token_type = 'STRING'
+            else:
+                token_type = operators[lexeme]
+            
+            yield MappedToken(token_type, line, column, data, start, end, encoding)
+            column += length
+        
+        self.position = len(data)
+        self.line = line
+        self.column = column
+    
+    def tokenize_buffer(self, symbols=None) -> TokenBuffer:
+        """
+        Executa a análise léxica gerando um TokenBuffer.
+        
+        Mesma varredura do padrão mestre (ou de MASTER_BYTES, para
+        arquivos abertos com from_path), mas sem criar objetos Token:
+        cada lexema vira uma linha nos arrays do buffer.
+        
+        Args:
+            symbols: SymbolTable da gramática (opcional). Se informada,
+                     os tipos saem já como ids dos terminais
+        
+        Returns:
+            TokenBuffer com todos os tokens, terminando com EOF
+        """
+        self._check_open()
+        if self.mapped is not None:
+            data = self.mapped
+            pattern = RegexPatterns.MASTER_BYTES
+            keywords = self._KEYWORDS_BYTES
+            operators = self._OPERATORS_BYTES
+        else:
+            data = self.source
+            pattern = RegexPatterns.MASTER
+            keywords = self.KEYWORDS
+            operators = self._OPERATORS
+        
+        is_bytes = not isinstance(data, str)
+        buffer = TokenBuffer(data, self.encoding, symbols)
+        append = buffer.append
+        
+        type_ids = buffer.ids_by_type
+        keyword_ids = {k: type_ids[v] for k, v in keywords.items()}
+        operator_ids = {k: type_ids[v] for k, v in operators.items()}
+        identifier_id = type_ids['IDENTIFIER']
+        number_id = type_ids['NUMBER']
+        string_id = type_ids['STRING']
+        line = 1
+        column = 1
+        
+        for match in pattern.finditer(data):
+            kind = match.lastgroup
+            
+            if kind == 'NEWLINE':
+                line += 1
+                column = 1
+                continue
+            
+            start, end = match.span()
+            length = end - start
+            
+            if kind == 'INVALID':
+                # Caractere não reconhecido
+                char = match.group()
+                if is_bytes:
+                    char = data[start:start + 4].decode(self.encoding, errors='replace')[0]
+                self.position = start
+                self.line = line
+                self.column = column
+                raise LexicalError(
+                    f"Caractere inválido '{char}'",
+                    line,
+                    column
+                )
+            
+            if is_bytes and (kind == 'COMMENT' or kind == 'STRING_DOUBLE'
+                             or kind == 'STRING_SINGLE'):
+                # Colunas contam caracteres, não bytes
+                lexeme = match.group()
+                if not lexeme.isascii():
+                    length = len(_decode_text(lexeme, self.encoding))
+            
+            if kind == 'WHITESPACE' or kind == 'COMMENT':
+                column += length
+                continue
+            
+            if kind == 'IDENTIFIER':
+                type_id = keyword_ids.get(match.group(), identifier_id)
+            elif kind == 'NUMBER':
+                type_id = number_id
+            elif kind == 'STRING_DOUBLE' or kind == 'STRING_SINGLE':
+                type_id = string_id
+            else:
+                type_id = operator_ids[match.group()]
+            
+            append(type_id, start, end, line, column)
+            column += length
+        
+        # Token de fim de arquivo
+        append(type_ids['EOF'], len(data), len(data), line, column)
+        
+        self.position = len(data)
+        self.line = line
+        self.column = column
+        return buffer
+    
+    def _scan_sequential(self):
+        """
+        Varredura tentando cada método _match_* em ordem de prioridade.
+        """
         while self.position < len(self.source):
             # Posição atual para mensagens de erro
             start_line = self.line
@@ -397,17 +1054,6 @@ class Lexer:
                 start_line,
                 start_column
             )
-        
-        # Adicionar token de fim de arquivo
-        self.tokens.append(Token(
-            type='EOF',
-            value='EOF',
-            line=self.line,
-            column=self.column,
-            lexeme='EOF'
-        ))
-        
-        return self.tokens
     
     # -------------------------------------------------------------------------
     # MÉTODOS DE MATCHING COM REGEX
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+GERADOR DE PARSER DESCENDENTE RECURSIVO LL(1) - LINGUAGEM VYTHON
+=============================================================================
+
+Modo ahead-of-time: a partir da tabela LL(1) já construída, gera um
+módulo Python independente com uma função por não-terminal. Cada função
+escolhe a produção comparando o id do token atual com os terminais das
+células M[A, a] (FIRST da produção, ou FOLLOW(A) para produções
+anuláveis), sem pilha explícita nem interpretação da tabela.
+
+As produções vêm compiladas por ebnf_nodes:
+- X*, X+  -> laços while sobre FIRST(X)
+- X?      -> if sobre FIRST(X)
+- (α | β) -> if/elif sobre FIRST de cada alternativa
+Produções recursivas à direita (A -> α A) viram laços na própria
+função, então listas longas não aprofundam a recursão do Python. O
+aninhamento (ex.: parênteses) ainda vira recursão: entre dois tokens
+consumidos há no máximo CALLS_PER_TOKEN chamadas abertas (calculado na
+geração), e o parser gerado sobe o limite de recursão conforme consome
+tokens, aceitando qualquer profundidade que o LL1Parser aceita.
+
+As mensagens de erro seguem o formato do LL1Parser.
+
+Uso:
+    python ll1_codegen.py [gramatica.bnf] [saida.py]
+=============================================================================
+"""
+
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Sequence, Set
+
+from parsing_table import ParsingTable, NO_PRODUCTION
+from ebnf_nodes import EBNFCompiler, SequenceNode, CHOICE, REPEAT, OPTION
+
+
+# =============================================================================
+# MODELO DO MÓDULO GERADO
+# =============================================================================
+
+_MODULE_TEMPLATE = '''"""
+=============================================================================
+PARSER LL(1) DESCENDENTE RECURSIVO GERADO - LINGUAGEM VYTHON
+=============================================================================
+
+Gerado por ll1_codegen.py a partir de {grammar_name}. NÃO EDITE: gere de
+novo quando a gramática mudar.
+
+SHA-256 da gramática: {grammar_sha256}
+Terminais: {num_terminals} | Não-terminais: {num_nonterminals} | Símbolo inicial: {start_symbol}
+
+Uso:
+    accepted, error = parse(tokens)
+
+tokens: tuplas (tipo, valor), objetos Token ou um TokenBuffer do lexer.
+=============================================================================
+"""
+
+import sys
+
+GRAMMAR_SHA256 = {grammar_sha256!r}
+
+# Nome de cada terminal, pelo id
+TERMINALS = {terminals}
+
+# Tipo de token do lexer (com ou sem aspas) -> id do terminal
+TOKEN_IDS = {token_ids}
+END_ID = {end_id}
+
+# Chamadas aninhadas abertas entre dois tokens consumidos (no máximo)
+CALLS_PER_TOKEN = {calls_per_token}
+# Tokens consumidos entre dois ajustes do limite de recursão
+_LIMIT_STEP = 1024
+
+
+class ParseError(Exception):
+    """Erro sintático (mensagem no formato do LL1Parser)."""
+
+
+def _tokens(tokens):
+    """Gera (id do terminal, tipo, valor) de cada token, seguidos de $."""
+    if hasattr(tokens, 'type_ids'):
+        # TokenBuffer: traduz a numeração do buffer uma única vez
+        id_map = [TOKEN_IDS.get(name, -1) for name in tokens.type_names]
+        type_names = tokens.type_names
+        for index, type_id in enumerate(tokens.type_ids):
+            yield id_map[type_id], type_names[type_id], tokens.value_of(index)
+    else:
+        for token in tokens:
+            if isinstance(token, tuple):
+                token_type, token_value = token[0], token[1]
+            elif hasattr(token, 'type') and hasattr(token, 'value'):
+                token_type, token_value = token.type, token.value
+            else:
+                token_type = token_value = str(token)
+            yield TOKEN_IDS.get(token_type, -1), token_type, token_value
+    
+    yield END_ID, '$', '$'
+
+
+class _Parser:
+    """Estado da análise: token atual e uma função por não-terminal."""
+    
+    def __init__(self, tokens, base_limit):
+        self._stream = _tokens(tokens)
+        self.token_id, self.token_type, self.token_value = next(self._stream)
+        self.base_limit = base_limit
+        self.consumed = 0
+        self._raise_limit()
+    
+    def _advance(self):
+        """Consome o token atual."""
+        self.token_id, self.token_type, self.token_value = next(self._stream, (END_ID, '$', '$'))
+        self.consumed += 1
+        if self.consumed >= self.next_raise:
+            self._raise_limit()
+    
+    def _raise_limit(self):
+        """Garante limite de recursão para os próximos _LIMIT_STEP tokens."""
+        self.next_raise = self.consumed + _LIMIT_STEP
+        sys.setrecursionlimit(self.base_limit + (self.next_raise + 2) * CALLS_PER_TOKEN)
+    
+    def _mismatch(self, expected):
+        """Terminal com id diferente: aceita pelo valor, como o LL1Parser."""
+        name = TERMINALS[expected]
+        clean = name.strip("'\\"")
+        if clean == self.token_type or clean == self.token_value:
+            self._advance()
+            return
+        raise ParseError(f"Esperado '{{name}}', encontrado '{{self.token_type}}:{{self.token_value}}'")
+    
+    def _no_production(self, nonterminal):
+        """Célula M[A, a] vazia."""
+        raise ParseError(f"Sem produção M[{{nonterminal}}, {{self.token_type}}]")
+    
+    def _no_alternative(self):
+        """Nenhuma alternativa de um grupo (α | β) casa com o token."""
+        raise ParseError(f"Nenhuma alternativa do grupo casa com {{self.token_type}}")
+{functions}
+
+def parse(tokens):
+    """
+    Analisa a cadeia de tokens.
+    
+    Returns:
+        (True, None) se aceita, (False, mensagem de erro) se rejeitada
+    """
+    # A profundidade cresce com os tokens consumidos; o limite original
+    # volta ao fim da análise
+    base_limit = sys.getrecursionlimit()
+    try:
+        parser = _Parser(tokens, base_limit)
+        parser.{start_function}()
+        if parser.token_id != END_ID:
+            raise ParseError("Esperado fim ($), mas há tokens sobrando")
+    except ParseError as error:
+        return False, str(error)
+    finally:
+        sys.setrecursionlimit(base_limit)
+    return True, None
+'''
+
+
+# =============================================================================
+# GERAÇÃO
+# =============================================================================
+
+def _format_strings(values: Sequence[str], indent: str = '    ') -> str:
+    """Formata strings como literal de tupla, uma por linha."""
+    if not values:
+        return '()'
+    return '(\n' + '\n'.join(f"{indent}{v!r}," for v in values) + '\n)'
+
+
+def _format_token_ids(token_ids: Dict[str, int]) -> str:
+    """Formata o mapa tipo de token -> id do terminal."""
+    lines = [f"    {name!r}: {terminal_id}," for name, terminal_id in token_ids.items()]
+    return '{\n' + '\n'.join(lines) + '\n}'
+
+
+def _format_test(terminal_ids: Set[int]) -> str:
+    """Teste do token atual contra um conjunto de ids."""
+    if len(terminal_ids) == 1:
+        return f"self.token_id == {next(iter(terminal_ids))}"
+    return f"self.token_id in {{{', '.join(str(t) for t in sorted(terminal_ids))}}}"
+
+
+class _FunctionWriter:
+    """Emite o código das funções dos não-terminais."""
+    
+    def __init__(self, table: ParsingTable):
+        self.table = table
+        self.grammar = table.grammar
+        self.symbols = table.grammar.symbols
+        self.names = self.symbols.names
+        self.num_terminals = self.symbols.num_terminals
+        self.compiler = EBNFCompiler(self.grammar, table.first_follow)
+        self.productions = self.compiler.compile()
+        self.lines: List[str] = []
+        
+        # Nome da função de cada não-terminal (identificador Python único)
+        self.function_names: Dict[int, str] = {}
+        used = set()
+        for nt in sorted(self.grammar.nonterminals):
+            name = 'p_' + re.sub(r'\W', '_', nt.strip('<>'))
+            while name in used:
+                name += '_'
+            used.add(name)
+            self.function_names[self.symbols.id_of(nt)] = name
+    
+    def emit(self, indent: int, line: str):
+        self.lines.append('    ' * indent + line)
+    
+    def write_all(self) -> str:
+        """Código de todas as funções, na ordem das regras da gramática."""
+        for nt in self.grammar.productions:
+            self.write_function(nt)
+        return '\n'.join(self.lines)
+    
+    def write_function(self, nt: str):
+        """Função de um não-terminal: um ramo por produção da tabela."""
+        nt_id = self.symbols.id_of(nt)
+        production_list = self.table.first_follow.production_list
+        
+        # Terminais de cada produção em M[A, a], na ordem das produções
+        cells: Dict[int, Set[int]] = {}
+        for terminal_id in range(self.num_terminals):
+            number = self.table.get_production_number(nt_id, terminal_id)
+            if number != NO_PRODUCTION:
+                cells.setdefault(number, set()).add(terminal_id)
+        
+        # Recursão à direita: A -> α A vira laço
+        branches = []
+        for number in sorted(cells):
+            items = self.productions[number].items
+            tail = bool(items) and items[-1] == nt_id
+            branches.append((number, items[:-1] if tail else items, tail))
+        looped = any(tail for _, _, tail in branches)
+        
+        self.emit(0, '')
+        self.emit(1, f"def {self.function_names[nt_id]}(self):")
+        self.emit(2, f'"""{nt}"""')
+        indent = 2
+        if looped:
+            self.emit(2, "while True:")
+            indent = 3
+        
+        for position, (number, items, tail) in enumerate(branches):
+            keyword = 'if' if position == 0 else 'elif'
+            _, body = production_list[number]
+            self.emit(indent, f"{keyword} {_format_test(cells[number])}:")
+            self.emit(indent + 1, f"# {nt} → {' '.join(body)}")
+            self.write_items(items, indent + 1)
+            if looped:
+                self.emit(indent + 1, 'continue' if tail else 'return')
+            elif not items:
+                self.emit(indent + 1, 'pass')
+        
+        if branches:
+            self.emit(indent, "else:")
+            self.emit(indent + 1, f"self._no_production({nt!r})")
+        else:
+            self.emit(indent, f"self._no_production({nt!r})")
+    
+    def write_items(self, items: Sequence, indent: int):
+        """Código de uma sequência de entradas compiladas."""
+        for entry in items:
+            if type(entry) is int:
+                if entry < 0:
+                    self.emit(indent, "self._mismatch(-1)")
+                elif entry < self.num_terminals:
+                    self.emit(indent, f"if self.token_id == {entry}:  # {self.names[entry]}")
+                    self.emit(indent + 1, "self._advance()")
+                    self.emit(indent, "else:")
+                    self.emit(indent + 1, f"self._mismatch({entry})")
+                else:
+                    self.emit(indent, f"self.{self.function_names[entry]}()")
+            
+            elif entry.kind == REPEAT:
+                self.emit(indent, f"while {self._test_or_false(entry.starts)}:  # {entry}")
+                self.write_block(entry.body, indent + 1)
+            
+            elif entry.kind == OPTION:
+                self.emit(indent, f"if {self._test_or_false(entry.starts)}:  # {entry}")
+                self.write_block(entry.body, indent + 1)
+            
+            else:
+                # Grupo com alternativas: primeira alternativa cujo FIRST casa
+                starts: Dict[int, Set[int]] = {}
+                for terminal_id, alternative in entry.select.items():
+                    starts.setdefault(id(alternative), set()).add(terminal_id)
+                
+                keyword = 'if'
+                for alternative in entry.alternatives:
+                    if id(alternative) not in starts:
+                        continue
+                    self.emit(indent, f"{keyword} {_format_test(starts[id(alternative)])}:  # {alternative}")
+                    self.write_block(alternative, indent + 1)
+                    keyword = 'elif'
+                
+                if entry.default is not None:
+                    if keyword == 'if':
+                        self.write_items(entry.default.items, indent)
+                        continue
+                    self.emit(indent, "else:")
+                    self.write_block(entry.default, indent + 1)
+                elif keyword == 'if':
+                    self.emit(indent, "self._no_alternative()")
+                else:
+                    self.emit(indent, "else:")
+                    self.emit(indent + 1, "self._no_alternative()")
+    
+    def write_block(self, node: SequenceNode, indent: int):
+        """Corpo de um bloco (while/if), com pass se vazio."""
+        if node.items:
+            self.write_items(node.items, indent)
+        else:
+            self.emit(indent, "pass")
+    
+    @staticmethod
+    def _test_or_false(terminal_ids) -> str:
+        return _format_test(terminal_ids) if terminal_ids else 'False'
+    
+    # -------------------------------------------------------------------------
+    # PROFUNDIDADE DE CHAMADAS
+    # -------------------------------------------------------------------------
+    
+    def calls_per_token(self) -> int:
+        """
+        Máximo de chamadas abertas entre dois tokens consumidos.
+        
+        Sem consumir token, a cadeia de chamadas só segue o prefixo
+        anulável das produções; numa gramática LL(1) essa cadeia não
+        repete não-terminal, então o valor é finito. O +1 conta
+        _advance/_mismatch.
+        """
+        memo: Dict[int, int] = {}
+        depth = max((self._nonterminal_depth(self.symbols.id_of(nt), memo)
+                     for nt in self.grammar.productions), default=0)
+        return depth + 1
+    
+    def _nonterminal_depth(self, nt_id: int, memo: Dict[int, int]) -> int:
+        """Chamadas abertas a partir de p_A antes de consumir um token."""
+        if nt_id in memo:
+            return memo[nt_id]
+        memo[nt_id] = 1  # Proteção contra ciclos (gramática não LL(1))
+        
+        depth = 0
+        for number, (head, _) in enumerate(self.table.first_follow.production_list):
+            if self.symbols.id_of(head) == nt_id:
+                depth = max(depth, self._sequence_depth(self.productions[number].items, memo))
+        memo[nt_id] = depth + 1
+        return depth + 1
+    
+    def _sequence_depth(self, items: Sequence, memo: Dict[int, int]) -> int:
+        """Maior cadeia de chamadas no prefixo anulável de uma sequência."""
+        depth = 0
+        for entry in items:
+            if type(entry) is int:
+                if entry >= self.num_terminals:
+                    depth = max(depth, self._nonterminal_depth(entry, memo))
+            elif entry.kind == CHOICE:
+                for alternative in entry.alternatives:
+                    depth = max(depth, self._sequence_depth(alternative.items, memo))
+            else:
+                depth = max(depth, self._sequence_depth(entry.body.items, memo))
+            
+            if not self.compiler._first_of_entry(entry) & self.compiler.EPSILON:
+                break
+        return depth
+
+
+def generate_parser_module(table: ParsingTable, grammar_file: Optional[str] = None,
+                           grammar_sha256: str = '') -> str:
+    """
+    Gera o código-fonte do parser descendente recursivo.
+    
+    Args:
+        table: Tabela LL(1) construída (sem conflitos)
+        grammar_file: Arquivo de origem (só para o cabeçalho)
+        grammar_sha256: Hash da gramática (só para o cabeçalho)
+    
+    Returns:
+        Código-fonte do módulo
+    """
+    grammar = table.grammar
+    symbols = grammar.symbols
+    writer = _FunctionWriter(table)
+    functions = writer.write_all()
+    
+    token_ids = {name: terminal_id for name, terminal_id in symbols.token_ids.items()
+                 if terminal_id < symbols.num_terminals}
+    
+    return _MODULE_TEMPLATE.format(
+        grammar_name=os.path.basename(grammar_file) if grammar_file else 'gramática LL(1)',
+        grammar_sha256=grammar_sha256,
+        num_terminals=symbols.num_terminals,
+        num_nonterminals=len(symbols) - symbols.num_terminals,
+        start_symbol=grammar.start_symbol,
+        terminals=_format_strings(symbols.names[:symbols.num_terminals]),
+        token_ids=_format_token_ids(token_ids),
+        end_id=symbols.id_of(grammar.end_marker),
+        calls_per_token=writer.calls_per_token(),
+        functions=functions,
+        start_function=writer.function_names[symbols.id_of(grammar.start_symbol)],
+    )
+
+
+def write_parser_module(table: ParsingTable, output_path: str,
+                        grammar_file: Optional[str] = None, grammar_sha256: str = ''):
+    """Gera o parser descendente recursivo e grava em output_path."""
+    source = generate_parser_module(table, grammar_file, grammar_sha256)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    print(f"[OK] Parser LL(1) descendente recursivo gerado em: {output_path}")
+
+
+# =============================================================================
+# LINHA DE COMANDO
+# =============================================================================
+
+if __name__ == "__main__":
+    from table_cache import load_ll1_tables, grammar_hash
+    
+    if len(sys.argv) > 1:
+        grammar_file = sys.argv[1]
+    else:
+        grammar_file = None
+        for path in ["../docs/gramatica_sem_ambiguidade.bnf", "docs/gramatica_sem_ambiguidade.bnf",
+                     "gramatica_sem_ambiguidade.bnf"]:
+            if os.path.exists(path):
+                grammar_file = path
+                break
+        if not grammar_file:
+            print("❌ ERRO: Arquivo de gramática não encontrado!")
+            print("\nUso: python3 ll1_codegen.py [gramatica.bnf] [saida.py]")
+            sys.exit(1)
+    
+    output_path = sys.argv[2] if len(sys.argv) > 2 else "vython_ll1_parser.py"
+    
+    grammar, ff, table = load_ll1_tables(grammar_file, verbose=True)
+    if not table.is_ll1():
+        print(f"❌ Gramática NÃO é LL(1) - {len(table.conflicts)} conflito(s)")
+        sys.exit(1)
+    
+    write_parser_module(table, output_path, grammar_file, grammar_hash(grammar_file))
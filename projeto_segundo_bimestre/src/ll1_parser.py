@@ -2,559 +2,382 @@
 """
 Parser LL(1) com Pilha - Processa EBNF nativamente
 Requisito da lauda: Tabela de casamento (MATCH) com pilha
+
+Grupos e operadores EBNF são compilados uma vez em nós (ebnf_nodes);
+a pilha guarda ids de símbolos e referências a esses nós. Gramáticas em
+BNF (ou Grammar.to_bnf()) usam um driver rápido sobre a matriz densa
+M[A, a] e uma pilha array('H').
 """
 
+from array import array
 from collections import deque
+from dataclasses import dataclass
+
+from ebnf_nodes import EBNFCompiler, REPEAT, OPTION
+
+
+# Níveis de rastreamento (trace_level): cada nível inclui os anteriores
+TRACE_OFF = 0     # Nada
+TRACE_ERRORS = 1  # Mensagens de erro
+TRACE_INFO = 2    # Início e resultado da análise
+TRACE_STEPS = 3   # Pilha a cada passo e ação aplicada
+
+
+@dataclass
+class TraceStep:
+    """Passo do parsing guardado no histórico (formatado só ao exibir)."""
+    step: int
+    top: str
+    token: tuple
+    depth: int
+    
+    def __str__(self):
+        return f"[Passo {self.step}] Topo: {self.top} (pilha: {self.depth}) | Token: {self.token[0]}:'{self.token[1]}'"
 
 
 class LL1Parser:
     """Parser LL(1) que processa operadores EBNF durante parsing."""
     
-    def __init__(self, grammar, parsing_table):
+    def __init__(self, grammar, parsing_table, trace=None, trace_level=TRACE_STEPS, history=0):
         """
         Inicializa parser.
         
+        Sem trace, nenhuma mensagem é montada durante a análise.
+        
         Args:
             grammar: Objeto Grammar com a gramática
             parsing_table: Objeto ParsingTable com tabela construída
+            trace: Função chamada com cada mensagem (ex.: print ou
+                   logger.debug); None desliga o rastreamento
+            trace_level: Nível máximo das mensagens enviadas a trace
+            history: Quantos passos recentes guardar para error_report()
         """
         self.grammar = grammar
         self.table = parsing_table.table
+        self.table_ids = parsing_table.table_ids  # M[A, a] pelos ids dos símbolos
+        self.symbols = grammar.symbols
         self.first_follow = parsing_table.first_follow
-        self.stack = deque()
-        self.tokens = []
+        self.stack = []               # Ids de símbolos e nós EBNF compilados
+        self.lookahead = deque()      # Tokens já lidos da entrada
+        self.token_stream = iter(())
+        self.buffer = None            # TokenBuffer lido por índice
         self.position = 0
         self.accepted = False
         self.derivations = []
-        
-    def parse(self, tokens):
+        self.error_message = None
+        
+        # Rastreamento
+        self.trace = trace
+        self.trace_level = trace_level if trace is not None else TRACE_OFF
+        self.recent = deque(maxlen=history) if history > 0 else None
+        
+        # Produções compiladas (ebnf_nodes): M[A, a] -> (nó, derivação)
+        compiled = EBNFCompiler(grammar, self.first_follow).compile()
+        numbers = self.first_follow.production_numbers
+        self.derivation_texts = [f"{nt} → {' '.join(prod)}"
+                                 for nt, prod in self.first_follow.production_list]
+        self.expansions = {}
+        for (nt_id, term_id), prod in self.table_ids.items():
+            number = numbers[(self.symbols.names[nt_id], tuple(prod))]
+            self.expansions[(nt_id, term_id)] = (compiled[number], self.derivation_texts[number])
+        
+        # Driver rápido (_parse_dense): só para gramáticas sem EBNF, em que
+        # todo corpo é uma sequência de ids; corpos invertidos em array('H')
+        self.dense_table = parsing_table.dense_table
+        if all(type(entry) is int and entry >= 0 for node in compiled for entry in node.items):
+            self.dense_bodies = [array('H', node.pushed) for node in compiled]
+        else:
+            self.dense_bodies = None
+        self.start_id = self.symbols.id_of(grammar.start_symbol)
+        self.end_id = self.symbols.id_of(grammar.end_marker)
+        
+        # Passos por token: fator da gramática vezes os passos de pilha
+        # que um corpo gera além de EXPAND/MATCH (operadores EBNF e grupos)
+        width = max((sum(len(str(item).split()) for item in prod)
+                     for prods in grammar.productions.values() for prod in prods),
+                    default=0)
+        self.step_factor = self.first_follow.step_factor * (width + 2)
+        
+    def parse(self, tokens, max_steps=None):
         """
-        Analisa lista de tokens usando LL(1) com pilha processando EBNF.
+        Analisa tokens usando LL(1) com pilha processando EBNF.
+        
+        A entrada é consumida sob demanda, então um gerador como
+        Lexer.iter_tokens() pode ser passado diretamente. Um TokenBuffer
+        (Lexer.tokenize_buffer()) é lido por índice.
         
         Args:
-            tokens: Lista de tuplas (tipo, valor) ou objetos Token
+            tokens: Tuplas (tipo, valor) ou objetos Token (lista ou
+                    gerador), ou um TokenBuffer
+            max_steps: Limite fixo de passos. Sem ele, o limite cresce com
+                    a entrada: (tokens lidos + 2) * step_factor
             
         Returns:
             bool: True se aceito, False se rejeitado
         """
+        # Limite = (tokens lidos + 2) * step_factor + step_limit
+        if max_steps is None:
+            step_factor = self.step_factor
+            step_limit = 0
+        else:
+            step_factor = 0
+            step_limit = max_steps
+        
         # Inicializar
-        self.tokens = self._normalize_tokens(tokens)
+        if hasattr(tokens, 'type_ids'):
+            self.buffer = tokens
+        else:
+            self.buffer = None
+            self.token_stream = self._iter_normalized(tokens)
+        self.lookahead = deque()
         self.position = 0
-        self.stack = deque()
         self.derivations = []
         self.accepted = False
+        self.error_message = None
+        if self.recent is not None:
+            self.recent.clear()
+        trace = self.trace
+        level = self.trace_level
+        recent = self.recent
         
         # Configurar pilha: $ e símbolo inicial
-        self.stack.append('$')
-        self.stack.append(self.grammar.start_symbol)
+        stack = self.stack = [self.end_id, self.start_id]
         
         # Derivação inicial
         self.derivations.append(self.grammar.start_symbol)
         
-        print(f"[PARSER] Iniciando análise")
-        print(f"[PARSER] Tokens: {len(self.tokens)}")
-        print(f"[PARSER] Pilha inicial: $ {self.grammar.start_symbol}")
+        if level >= TRACE_INFO:
+            trace(f"[PARSER] Iniciando análise")
+            if hasattr(tokens, '__len__'):
+                trace(f"[PARSER] Tokens: {len(tokens) + 1}")
+            else:
+                trace(f"[PARSER] Tokens: (lidos sob demanda)")
+            trace(f"[PARSER] Pilha inicial: $ {self.grammar.start_symbol}")
+        
+        # Sem histórico nem passos no rastreamento, o driver rápido basta
+        if self.dense_bodies is not None and recent is None and level < TRACE_STEPS:
+            return self._parse_dense(step_factor, step_limit)
+        
+        names = self.symbols.names
+        token_ids = self.symbols.token_ids
+        num_terminals = self.symbols.num_terminals
+        end_id = self.end_id
+        expansions = self.expansions
+        derivations = self.derivations
         
-        # Algoritmo LL(1) com processamento EBNF
+        # Algoritmo LL(1) sobre ids de símbolos e nós EBNF compilados
         step = 0
-        while len(self.stack) > 0:
+        while stack:
             step += 1
-            top = self.stack[-1]
+            top = stack[-1]
             current_token = self._current_token()
+            token_id = token_ids.get(current_token[0], -1)
             
-            # Debug
-            print(f"[Passo {step}] Pilha: {self._format_stack()} | Token: {current_token[0]}:'{current_token[1]}'")
+            # Histórico e rastreamento
+            if recent is not None:
+                recent.append(TraceStep(step, names[top] if type(top) is int else str(top),
+                                        current_token, len(stack)))
+            if level >= TRACE_STEPS:
+                trace(f"[Passo {step}] Pilha: {self._format_stack()} | Token: {current_token[0]}:'{current_token[1]}'")
             
-            # Identificar tipo do topo
-            if top == '$':
-                # Final
-                if current_token[0] == '$':
-                    print(f"[PARSER] ✅ ACEITO (em {step} passos)")
-                    self.accepted = True
-                    return True
-                else:
-                    print(f"[ERRO] Esperado fim ($), mas há tokens sobrando")
-                    return False
-            
-            elif self._is_terminal(top):
-                # Terminal: MATCH
-                if self._match(top, current_token):
-                    self.stack.pop()
-                    self.position += 1
-                    if step <= 5:
-                        print(f"  → MATCH '{top}'")
-                else:
-                    print(f"[ERRO] Esperado '{top}', encontrado '{current_token[0]}:{current_token[1]}'")
-                    return False
-            
-            elif self._is_nonterminal(top):
-                # Não-terminal: EXPAND
-                production = self._get_production(top, current_token[0])
-                
-                if production is None:
-                    print(f"[ERRO] Sem produção M[{top}, {current_token[0]}]")
-                    return False
-                
-                self.stack.pop()
-                
-                # Empilhar produção agrupando operadores EBNF
-                self._push_production_with_ebnf(production)
-                
-                prod_str = ' '.join(production)
-                if step <= 10:
-                    print(f"  → EXPAND {top} → {prod_str}")
-                    print(f"     Nova pilha (5 primeiros): {self._format_stack()}")
-                self.derivations.append(f"{top} → {prod_str}")
-            
-            elif top == '*':
-                # Operador * : repete elementos marcados
-                self.stack.pop()  # Remove *
-                
-                # Pegar elementos (quantidade definida pelo marcador)
-                # Pilha está: ... LOOP:N elem1 elem2 ... elemN
-                elements = []
-                count = 1  # Padrão se não houver marcador
-                
-                # Coletar elementos
-                while len(self.stack) > 0 and not str(self.stack[-1]).startswith("LOOP:"):
-                    elements.append(self.stack.pop())
+            if type(top) is int:
+                if top == end_id:
+                    # Final
+                    if token_id == end_id:
+                        if level >= TRACE_INFO:
+                            trace(f"[PARSER] ✅ ACEITO (em {step} passos)")
+                        self.accepted = True
+                        return True
+                    return self._fail(f"Esperado fim ($), mas há tokens sobrando")
                 
-                # Pegar marcador se existe
-                if len(self.stack) > 0 and str(self.stack[-1]).startswith("LOOP:"):
-                    marker = self.stack.pop()
-                    count = int(marker.split(':')[1])
+                elif top < num_terminals:
+                    # Terminal: MATCH (pelo id; o valor do token é a alternativa)
+                    if top == token_id or self._match(names[top], current_token):
+                        stack.pop()
+                        self._advance()
+                        if level >= TRACE_STEPS and step <= 5:
+                            trace(f"  → MATCH '{names[top]}'")
+                    else:
+                        return self._fail(f"Esperado '{names[top]}', encontrado '{current_token[0]}:{current_token[1]}'")
                 
-                # Reverter lista (estavam em ordem reversa)
-                elements = list(reversed(elements))
-                
-                # Verificar se primeiro elemento casa com lookahead
-                if elements and self._element_matches_lookahead(elements[0], current_token):
-                    # Pode repetir: re-empilhar marcador, elementos e *
-                    self.stack.append(f"LOOP:{count}")
-                    for elem in reversed(elements):
-                        self.stack.append(elem)
-                    self.stack.append('*')
-                    
-                    # Empilhar elementos mais uma vez para processar
-                    for elem in reversed(elements):
-                        self.stack.append(elem)
-                    
-                    if step <= 5:
-                        print(f"  → EBNF * (repetindo {count} elemento(s))")
-                else:
-                    # Não pode mais repetir: não re-empilha nada
-                    if step <= 5:
-                        print(f"  → EBNF * (terminado)")
-            
-            elif top == '?':
-                # Operador ? : elemento opcional
-                self.stack.pop()  # Remove ?
-                
-                # Coletar elementos até marcador OPT:N
-                elements = []
-                count = 1
-                
-                while len(self.stack) > 0 and not str(self.stack[-1]).startswith("OPT:"):
-                    elements.append(self.stack.pop())
-                
-                # Pegar marcador
-                if len(self.stack) > 0 and str(self.stack[-1]).startswith("OPT:"):
-                    marker = self.stack.pop()
-                    count = int(marker.split(':')[1])
-                
-                # Reverter lista
-                elements = list(reversed(elements))
-                
-                # Testar se primeiro elemento casa com lookahead
-                if elements and self._element_matches_lookahead(elements[0], current_token):
-                    # Processar: re-empilhar elementos
-                    for elem in reversed(elements):
-                        self.stack.append(elem)
-                    if step <= 5:
-                        print(f"  → EBNF ? (processando {count} elemento(s))")
                 else:
-                    # Pular: não re-empilha nada
-                    if step <= 5:
-                        print(f"  → EBNF ? (pulando {count} elemento(s))")
-            
-            elif top.startswith('(') and top.endswith(')'):
-                # Grupo (...)
-                # Verificar se próximo elemento é operador EBNF
-                if len(self.stack) >= 2 and self.stack[-2] in ['*', '+', '?']:
-                    # Deixar o operador processar o grupo
-                    # Trocar posição: grupo e operador
-                    self.stack.pop()  # Remove grupo
-                    operator = self.stack.pop()  # Remove operador
-                    self.stack.append(top)  # Coloca grupo de volta
-                    self.stack.append(operator)  # Coloca operador no topo
-                    
-                    if step <= 5:
-                        print(f"  → REORDENAR: {operator} processará {top}")
-                    continue  # Próxima iteração processará o operador
-                
-                # Processar grupo normalmente
-                self.stack.pop()
-                
-                # Verificar se tem alternativas (|) no nível raiz ou é sequencial
-                if self._has_top_level_alternatives(top):
-                    # Grupo com alternativas: (A | B | C)
-                    alternatives = self._extract_alternatives(top)
-                    
-                    # Escolher alternativa baseada no lookahead
-                    chosen = None
-                    for alt in alternatives:
-                        if self._pattern_matches_lookahead(alt, current_token):
-                            chosen = alt
-                            break
-                    
-                    if chosen is None:
-                        print(f"[ERRO] Nenhuma alternativa do grupo casa com {current_token[0]}")
-                        return False
+                    # Não-terminal: EXPAND pela produção compilada em M[A, a]
+                    expansion = expansions.get((top, token_id))
                     
-                    # Empilhar alternativa escolhida (reverso)
-                    symbols = self._tokenize_pattern(chosen)
-                    for symbol in reversed(symbols):
-                        if not self.grammar.is_epsilon(symbol):
-                            self.stack.append(symbol)
+                    if expansion is None:
+                        return self._fail(f"Sem produção M[{names[top]}, {current_token[0]}]")
                     
-                    if step <= 5:
-                        print(f"  → EBNF GROUP ALT (escolheu: {chosen})")
-                else:
-                    # Grupo sequencial: (A B C)
-                    # Remove parênteses e empilha tudo
-                    content = top[1:-1].strip()
-                    symbols = self._tokenize_pattern(content)
-                    
-                    for symbol in reversed(symbols):
-                        if not self.grammar.is_epsilon(symbol):
-                            self.stack.append(symbol)
+                    node, derivation = expansion
+                    stack.pop()
+                    stack.extend(node.pushed)
                     
-                    if step <= 5:
-                        print(f"  → EBNF GROUP SEQ (empilhado: {content})")
+                    if level >= TRACE_STEPS and step <= 10:
+                        trace(f"  → EXPAND {derivation}")
+                        trace(f"     Nova pilha (5 primeiros): {self._format_stack()}")
+                    derivations.append(derivation)
+            
+            elif top.kind == REPEAT:
+                # X* : repete o corpo enquanto o lookahead está em FIRST(X)
+                stack.pop()
+                if token_id in top.starts:
+                    stack.append(top)
+                    stack.extend(top.body.pushed)
+                    if level >= TRACE_STEPS and step <= 5:
+                        trace(f"  → EBNF * (repetindo {len(top.body.items)} elemento(s))")
+                elif level >= TRACE_STEPS and step <= 5:
+                    trace(f"  → EBNF * (terminado)")
+            
+            elif top.kind == OPTION:
+                # X? : empilha o corpo se o lookahead está em FIRST(X)
+                stack.pop()
+                if token_id in top.starts:
+                    stack.extend(top.body.pushed)
+                    if level >= TRACE_STEPS and step <= 5:
+                        trace(f"  → EBNF ? (processando {len(top.body.items)} elemento(s))")
+                elif level >= TRACE_STEPS and step <= 5:
+                    trace(f"  → EBNF ? (pulando {len(top.body.items)} elemento(s))")
             
             else:
-                print(f"[ERRO] Símbolo desconhecido na pilha: {top}")
-                return False
+                # ( α | β ) : alternativa escolhida pelo lookahead
+                stack.pop()
+                chosen = top.select.get(token_id, top.default)
+                
+                if chosen is None:
+                    return self._fail(f"Nenhuma alternativa do grupo casa com {current_token[0]}")
+                
+                stack.extend(chosen.pushed)
+                if level >= TRACE_STEPS and step <= 5:
+                    trace(f"  → EBNF GROUP ALT (escolheu: {chosen})")
             
             # Proteção contra loop infinito
-            if step > 1000:
-                print(f"[ERRO] Limite de passos excedido")
-                return False
+            if step > (self.position + 2) * step_factor + step_limit:
+                return self._fail(f"Limite de passos excedido")
         
-        print(f"[ERRO] Pilha vazia antes do fim")
-        return False
+        return self._fail(f"Pilha vazia antes do fim")
     
-    def _parse_element(self, element):
-        """
-        Processa um elemento (pode ser terminal, não-terminal ou grupo).
-        Retorna True se sucesso, False se erro.
+    def _parse_dense(self, step_factor, step_limit):
         """
-        current_token = self._current_token()
-        
-        if self._is_terminal(element):
-            if self._match(element, current_token):
-                self.position += 1
-                return True
-            else:
-                return False
-        
-        elif self._is_nonterminal(element):
-            # Empilhar não-terminal e deixar próxima iteração processar
-            self.stack.append(element)
-            return True
-        
-        elif element.startswith('(') and element.endswith(')'):
-            # Grupo: empilhar e deixar próxima iteração processar
-            self.stack.append(element)
-            return True
+        Driver rápido: mesmo algoritmo de parse(), para gramáticas em BNF.
         
-        else:
-            # Símbolo desconhecido
-            return False
-    
-    def _element_matches_lookahead(self, element, token):
-        """
-        Verifica se elemento pode ser parseado com token atual.
-        Usa FIRST sets.
-        """
-        first_set = self._get_first_of_element(element)
-        
-        token_type = token[0]
-        token_value = token[1]
-        
-        # Verificar se token está no FIRST
-        for f in first_set:
-            clean_f = str(f).strip("'\"")
-            if clean_f == token_type or clean_f == token_value:
-                return True
-            if token_type in ['IDENTIFIER', 'NUMBER', 'STRING'] and clean_f == token_type:
-                return True
-        
-        return False
-    
-    def _pattern_matches_lookahead(self, pattern, token):
-        """Verifica se padrão (sequência de símbolos) casa com lookahead."""
-        symbols = self._tokenize_pattern(pattern)
-        
-        if not symbols:
-            return False
-        
-        # Pegar FIRST do primeiro símbolo do padrão
-        first_symbol = symbols[0]
-        return self._element_matches_lookahead(first_symbol, token)
-    
-    def _get_first_of_element(self, element):
-        """Obtém FIRST set de um elemento."""
-        # Limpar elemento
-        clean = element.strip("'\"")
-        
-        # Buscar no FIRST calculado
-        if element in self.first_follow.first:
-            return self.first_follow.first[element]
-        elif clean in self.first_follow.first:
-            return self.first_follow.first[clean]
-        elif self._is_terminal(element):
-            return {clean}
-        else:
-            return set()
-    
-    def _has_top_level_alternatives(self, group):
+        A pilha é um array('H') de ids, M[A, a] vem da matriz densa da
+        ParsingTable e cada EXPAND estende a pilha com o corpo já
+        invertido. Os passos contados são os mesmos do laço geral, então
+        as mesmas entradas são aceitas e rejeitadas.
         """
-        Verifica se grupo tem | no nível raiz (alternativas).
-        Retorna True se tem alternativas, False se é sequencial.
-        """
-        content = group[1:-1]  # Remove parênteses externos
-        depth = 0
-        
-        for char in content:
-            if char == '(':
-                depth += 1
-            elif char == ')':
-                depth -= 1
-            elif char == '|' and depth == 0:
-                # Encontrou | no nível raiz
-                return True
-        
-        # Não tem | no nível raiz, é sequencial
-        return False
-    
-    def _extract_alternatives(self, group):
-        """Extrai alternativas de grupo (A | B | C)"""
-        # Remove parênteses
-        content = group[1:-1].strip()
-        
-        # Dividir por | respeitando aninhamento
-        alternatives = []
-        current = ""
-        depth = 0
-        
-        for char in content:
-            if char == '(':
-                depth += 1
-                current += char
-            elif char == ')':
-                depth -= 1
-                current += char
-            elif char == '|' and depth == 0:
-                if current.strip():
-                    alternatives.append(current.strip())
-                current = ""
-            else:
-                current += char
-        
-        if current.strip():
-            alternatives.append(current.strip())
-        
-        return alternatives
-    
-    def _tokenize_pattern(self, pattern):
-        """Tokeniza padrão em símbolos individuais."""
-        symbols = []
-        i = 0
+        names = self.symbols.names
+        token_ids = self.symbols.token_ids
+        num_terminals = self.symbols.num_terminals
+        end_id = self.end_id
+        dense_table = self.dense_table
+        bodies = self.dense_bodies
+        texts = self.derivation_texts
+        derivations = self.derivations
+        
+        stack = self.stack = array('H', [end_id, self.start_id])
+        current_token = self._current_token()
+        token_id = token_ids.get(current_token[0], -1)
         
-        while i < len(pattern):
-            # Pular espaços
-            if pattern[i].isspace():
-                i += 1
-                continue
-            
-            # Não-terminal <...>
-            if pattern[i] == '<':
-                end = pattern.find('>', i)
-                if end != -1:
-                    symbols.append(pattern[i:end+1])
-                    i = end + 1
-                    continue
+        step = 0
+        while stack:
+            step += 1
+            top = stack[-1]
             
-            # Terminal '...'
-            if pattern[i] == "'":
-                end = pattern.find("'", i + 1)
-                if end != -1:
-                    symbols.append(pattern[i:end+1])
-                    i = end + 1
-                    continue
+            if top >= num_terminals:
+                # Não-terminal: EXPAND
+                number = -1
+                if token_id >= 0:
+                    number = dense_table[(top - num_terminals) * num_terminals + token_id]
+                if number < 0:
+                    return self._fail(f"Sem produção M[{names[top]}, {current_token[0]}]")
+                stack.pop()
+                stack.extend(bodies[number])
+                derivations.append(texts[number])
             
-            # Grupo (...)
-            if pattern[i] == '(':
-                depth = 1
-                j = i + 1
-                while j < len(pattern) and depth > 0:
-                    if pattern[j] == '(':
-                        depth += 1
-                    elif pattern[j] == ')':
-                        depth -= 1
-                    j += 1
-                symbols.append(pattern[i:j])
-                i = j
-                continue
+            elif top == end_id:
+                # Final
+                if token_id == end_id:
+                    if self.trace_level >= TRACE_INFO:
+                        self.trace(f"[PARSER] ✅ ACEITO (em {step} passos)")
+                    self.accepted = True
+                    return True
+                return self._fail(f"Esperado fim ($), mas há tokens sobrando")
             
-            # Operadores EBNF
-            if pattern[i] in '*+?':
-                symbols.append(pattern[i])
-                i += 1
-                continue
+            elif top == token_id or self._match(names[top], current_token):
+                # Terminal: MATCH
+                stack.pop()
+                self._advance()
+                current_token = self._current_token()
+                token_id = token_ids.get(current_token[0], -1)
             
-            # Palavra
-            if pattern[i].isalnum() or pattern[i] == '_':
-                j = i
-                while j < len(pattern) and (pattern[j].isalnum() or pattern[j] == '_'):
-                    j += 1
-                symbols.append(pattern[i:j])
-                i = j
             else:
-                # Símbolo único
-                symbols.append(pattern[i])
-                i += 1
+                return self._fail(f"Esperado '{names[top]}', encontrado '{current_token[0]}:{current_token[1]}'")
+            
+            # Proteção contra loop infinito
+            if step > (self.position + 2) * step_factor + step_limit:
+                return self._fail(f"Limite de passos excedido")
         
-        return symbols
+        return self._fail(f"Pilha vazia antes do fim")
+    
+    def _fail(self, message):
+        """Registra o erro, envia ao rastreamento e retorna False."""
+        self.error_message = message
+        if self.trace_level >= TRACE_ERRORS:
+            self.trace(f"[ERRO] {message}")
+        return False
     
-    def _push_production_with_ebnf(self, production):
+    def error_report(self):
         """
-        Empilha produção expandindo operadores EBNF baseado em lookahead.
+        Mensagem de erro seguida dos últimos passos guardados.
         
-        Para ?, decide agora se empilha ou não.
-        Para *, empilha elemento uma vez e re-coloca * e elemento para loop.
+        O histórico só existe com history > 0 no construtor.
         """
-        i = len(production) - 1
-        
-        while i >= 0:
-            symbol = production[i]
-            
-            # Verificar se é operador EBNF
-            if symbol in ['*', '?']:
-                if i == 0:
-                    return
-                
-                # Identificar o "elemento" que o operador afeta
-                # Pode ser um grupo (...) ou símbolo simples
-                if production[i-1].startswith('(') and production[i-1].endswith(')'):
-                    # É um grupo STRING: precisa tokenizar o conteúdo
-                    group_str = production[i-1]
-                    # Tokenizar o grupo usando _tokenize_pattern
-                    group_tokens = self._tokenize_pattern(group_str)
-                    
-                    # Processar baseado no operador
-                    if symbol == '?':
-                        # Opcional: empilhar grupo E marcador E ?
-                        group_content = [t for t in group_tokens if t not in ['(', ')']]
-                        count = len(group_content)
-                        
-                        self.stack.append(f"OPT:{count}")  # Marcador
-                        for k in range(len(group_content) - 1, -1, -1):
-                            self.stack.append(group_content[k])
-                        self.stack.append('?')
-                    
-                    elif symbol == '*':
-                        # Zero ou mais: empilha grupo com marcador de quantidade
-                        group_content = [t for t in group_tokens if t not in ['(', ')']]
-                        count = len(group_content)
-                        
-                        # Empilhar: COUNT | elementos | *
-                        self.stack.append(f"LOOP:{count}")  # Marcador
-                        for k in range(len(group_content) - 1, -1, -1):
-                            self.stack.append(group_content[k])
-                        self.stack.append('*')
-                    
-                    i -= 2  # Pula elemento (grupo) e operador
-                
-                else:
-                    # Elemento simples
-                    element = production[i-1]
-                    
-                    if symbol == '?':
-                        # Opcional: empilhar elemento E marcador E ?
-                        self.stack.append("OPT:1")
-                        self.stack.append(element)
-                        self.stack.append('?')
-                    
-                    elif symbol == '*':
-                        # Zero ou mais: empilha com marcador
-                        self.stack.append("LOOP:1")  # 1 elemento
-                        self.stack.append(element)
-                        self.stack.append('*')
-                    
-                    i -= 2
-            
-            else:
-                # Símbolo normal
-                if not self.grammar.is_epsilon(symbol):
-                    self.stack.append(symbol)
-                i -= 1
-    
-    def _push_group_content(self, group_tokens):
-        """Empilha conteúdo de um grupo (sem parênteses externos)."""
-        for i in range(len(group_tokens) - 1, -1, -1):
-            if group_tokens[i] not in ['(', ')']:
-                self.stack.append(group_tokens[i])
-    
-    def _should_parse_optional(self, group_tokens):
-        """Decide se deve processar elemento/grupo opcional baseado em FIRST."""
-        # Montar string do grupo
-        content = ' '.join([t for t in group_tokens if t not in ['(', ')']])
-        current = self._current_token()
-        return self._pattern_matches_lookahead(content, current)
-    
-    def _should_parse_element(self, element):
-        """Decide se deve processar elemento opcional baseado em FIRST."""
-        current = self._current_token()
-        return self._element_matches_lookahead(element, current)
+        lines = [f"Erro: {self.error_message}" if self.error_message else "Sem erro"]
+        if self.recent:
+            lines.append(f"Últimos {len(self.recent)} passos:")
+            lines.extend(f"  {entry}" for entry in self.recent)
+        return '\n'.join(lines)
     
     def _normalize_tokens(self, tokens):
         """Normaliza tokens para formato (tipo, valor). Adiciona $."""
-        normalized = []
-        
+        return list(self._iter_normalized(tokens))
+    
+    def _iter_normalized(self, tokens):
+        """Normaliza tokens um a um para formato (tipo, valor). Adiciona $."""
         for token in tokens:
             if isinstance(token, tuple):
-                normalized.append(token)
+                yield token
             elif hasattr(token, 'type') and hasattr(token, 'value'):
-                normalized.append((token.type, token.value))
+                yield (token.type, token.value)
             else:
-                normalized.append((str(token), str(token)))
+                yield (str(token), str(token))
         
-        normalized.append(('$', '$'))
-        return normalized
+        yield ('$', '$')
     
     def _current_token(self):
         """Retorna token atual."""
-        if self.position < len(self.tokens):
-            return self.tokens[self.position]
-        return ('$', '$')
-    
-    def _is_terminal(self, symbol):
-        """Verifica se símbolo é terminal."""
-        if symbol in ['*', '+', '?', '$']:
-            return False
-        if symbol.startswith("'") or symbol.startswith('"'):
-            return True
-        if symbol.startswith('<') and symbol.endswith('>'):
-            return False
-        if symbol.startswith('(') and symbol.endswith(')'):
-            return False
-        return symbol in self.grammar.terminals
+        if self.buffer is not None:
+            if self.position < len(self.buffer):
+                return (self.buffer.type_of(self.position),
+                        self.buffer.value_of(self.position))
+            return ('$', '$')
+        
+        if not self.lookahead:
+            token = next(self.token_stream, None)
+            if token is None:
+                return ('$', '$')
+            self.lookahead.append(token)
+        return self.lookahead[0]
     
-    def _is_nonterminal(self, symbol):
-        """Verifica se símbolo é não-terminal."""
-        return symbol in self.grammar.nonterminals
+    def _advance(self):
+        """Consome o token atual."""
+        if self.buffer is not None:
+            self.position += 1
+            return
+        
+        self._current_token()
+        if self.lookahead:
+            self.lookahead.popleft()
+        self.position += 1
     
     def _match(self, expected, token):
         """Implementa MATCH - casa terminal da pilha com token."""
@@ -571,27 +394,14 @@ class LL1Parser:
         
         return False
     
-    def _get_production(self, nonterminal, terminal):
-        """Busca produção na tabela M[A, a]."""
-        attempts = [
-            (nonterminal, terminal),
-            (nonterminal, f"'{terminal}'"),
-            (nonterminal, terminal.strip("'")),
-        ]
-        
-        for key in attempts:
-            if key in self.table:
-                return self.table[key]
-        
-        return None
-    
     def _format_stack(self):
         """Formata pilha para exibição (últimos 5 elementos)."""
+        names = self.symbols.names
+        top5 = [names[entry] if type(entry) is int else str(entry)
+                for entry in reversed(self.stack[-5:])]
         if len(self.stack) <= 5:
-            return ' '.join(reversed(list(self.stack)))
-        else:
-            top5 = list(self.stack)[-5:]
-            return '... ' + ' '.join(reversed(top5))
+            return ' '.join(top5)
+        return '... ' + ' '.join(top5)
     
     def get_derivations(self):
         """Retorna lista de derivações aplicadas."""
@@ -0,0 +1,351 @@
+"""
+=============================================================================
+ITENS LR(1) COM FUSÃO DE PAGER - PARSER LR(1)
+=============================================================================
+
+Coleção de conjuntos de itens LR(1) com a força da LR(1) canônica, mas
+com poucos estados a mais que a LR(0).
+
+Cada estado guarda seu kernel LR(0) (itens inteiros de ItemEncoding) e,
+alinhado com ele, o lookahead de cada item como bitmask de terminais
+(TerminalSets). Um novo kernel é fundido com um estado de mesmo núcleo
+sempre que os dois forem fracamente compatíveis (Pager, 1977): para todo
+par de itens i ≠ j,
+
+    (L1[i] ∩ L2[j]) ∪ (L1[j] ∩ L2[i]) = ∅
+    ou L1[i] ∩ L1[j] ≠ ∅  ou  L2[i] ∩ L2[j] ≠ ∅
+
+Assim a fusão nunca cria um conflito reduce-reduce que a LR(1) canônica
+não teria, e os estados só se dividem onde a fusão LALR causaria
+conflitos. Quando a fusão aumenta os lookaheads de um estado, ele é
+reprocessado para propagá-los aos sucessores.
+=============================================================================
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from slr_grammar import SLRGrammar, SLRFirstFollow
+from slr_items import CanonicalCollection, ItemEncoding, LR0ItemSet
+
+
+class LR1ItemSet(LR0ItemSet):
+    """
+    Estado LR(1): kernel LR(0) mais o lookahead de cada item do kernel.
+    
+    Iterar o estado continua devolvendo os LR0Items do closure (o
+    núcleo), como em LR0ItemSet.
+    
+    Attributes:
+        lookaheads: Bitmask de lookahead de cada item, alinhado com kernel
+    """
+    
+    def __init__(self, kernel: Iterable[int] = (), lookaheads: Iterable[int] = (),
+                 encoding: ItemEncoding = None):
+        super().__init__(kernel, encoding)
+        self.lookaheads: Tuple[int, ...] = tuple(lookaheads)
+    
+    def __eq__(self, other):
+        if not isinstance(other, LR1ItemSet):
+            return False
+        return self.kernel == other.kernel and self.lookaheads == other.lookaheads
+    
+    def __hash__(self):
+        return hash((self.kernel, self.lookaheads))
+
+
+class LR1Collection(CanonicalCollection):
+    """
+    Coleção de conjuntos de itens LR(1) com fusão fracamente compatível.
+    
+    Mesma interface de CanonicalCollection (states, goto_table,
+    get_goto), mais os lookaheads das reduções de cada estado.
+    
+    Attributes:
+        reduce_lookaheads: (estado, número da produção) -> bitmask
+        lr0_states: Número de núcleos LR(0) distintos entre os estados
+    """
+    
+    def __init__(self, grammar: SLRGrammar, first_follow: SLRFirstFollow):
+        super().__init__(grammar)
+        self.first_follow = first_follow
+        self.reduce_lookaheads: Dict[Tuple[int, int], int] = {}
+        self.lr0_states = 0
+        
+        # Estado de construção (ids internos, antes da renumeração)
+        self._kernels: List[Tuple[int, ...]] = []
+        self._lookaheads: List[List[int]] = []
+        self._by_core: Dict[Tuple[int, ...], List[int]] = {}
+        self._goto: Dict[Tuple[int, int], int] = {}
+        self._worklist: deque = deque()
+        self._pending: set = set()
+    
+    def build(self):
+        """
+        Constrói a coleção LR(1).
+        
+        Algoritmo:
+        1. Criar I0 a partir do kernel [S' -> • S, {$}]
+        2. Para cada estado, calcular o closure LR(1) e particionar os
+           itens pelo símbolo após o ponto (kernels de GOTO com lookahead)
+        3. Fundir cada kernel com um estado de mesmo núcleo fracamente
+           compatível, ou criar um estado novo
+        4. Reprocessar estados cujos lookaheads cresceram
+        5. Descartar estados que ficaram inalcançáveis e renumerar
+        """
+        encoding = ItemEncoding(self.grammar)
+        self.encoding = encoding
+        sets = self.first_follow.sets
+        
+        self._add_state((encoding.base[0],), [sets.bit(self.grammar.END_MARKER)])
+        
+        while self._worklist:
+            state = self._worklist.popleft()
+            self._pending.discard(state)
+            
+            closure = self._closure_lr1(self._kernels[state], self._lookaheads[state])
+            for symbol, (kernel, lookaheads) in self._goto_kernels_lr1(closure).items():
+                self._goto[(state, symbol)] = self._merge_or_add(
+                    self._goto.get((state, symbol)), kernel, lookaheads)
+        
+        self._finish()
+        return self.states
+    
+    # -------------------------------------------------------------------------
+    # CLOSURE E GOTO COM LOOKAHEAD
+    # -------------------------------------------------------------------------
+    
+    def _closure_lr1(self, kernel: Tuple[int, ...], lookaheads: List[int]) -> Dict[int, int]:
+        """
+        CLOSURE LR(1) de um kernel.
+        
+        Para [A -> α • B β, L], adiciona [B -> • γ, FIRST(β L)]; um item
+        já presente é revisitado só quando seu lookahead cresce.
+        
+        Returns:
+            Item inteiro -> bitmask de lookahead
+        """
+        encoding = self.encoding
+        next_symbol = encoding.next_symbol
+        item_production = encoding.item_production
+        item_dot = encoding.item_dot
+        starts = encoding.starts
+        num_terminals = encoding.num_terminals
+        suffix_first = self.first_follow.suffixes.first
+        epsilon = self.first_follow.sets.EPSILON
+        not_epsilon = ~epsilon
+        
+        result = dict(zip(kernel, lookaheads))
+        work = list(kernel)
+        
+        while work:
+            item = work.pop()
+            symbol = next_symbol[item]
+            if symbol < num_terminals:
+                continue
+            
+            first_beta = suffix_first[item_production[item]][item_dot[item] + 1]
+            new = first_beta & not_epsilon
+            if first_beta & epsilon:
+                new |= result[item]
+            
+            for start in starts.get(symbol, ()):
+                old = result.get(start)
+                if old is None:
+                    result[start] = new
+                    work.append(start)
+                elif new & ~old:
+                    result[start] = old | new
+                    work.append(start)
+        
+        return result
+    
+    def _goto_kernels_lr1(self, closure: Dict[int, int]
+                          ) -> Dict[int, Tuple[Tuple[int, ...], List[int]]]:
+        """
+        Kernels (com lookahead) de GOTO(I, X) para todos os X, numa passada.
+        
+        Returns:
+            Id de X -> (kernel ordenado, lookaheads alinhados)
+        """
+        next_symbol = self.encoding.next_symbol
+        buckets: Dict[int, Dict[int, int]] = {}
+        
+        for item, lookahead in closure.items():
+            symbol = next_symbol[item]
+            if symbol >= 0:
+                buckets.setdefault(symbol, {})[item + 1] = lookahead
+        
+        result = {}
+        for symbol, items in buckets.items():
+            kernel = tuple(sorted(items))
+            result[symbol] = (kernel, [items[item] for item in kernel])
+        return result
+    
+    # -------------------------------------------------------------------------
+    # FUSÃO DE ESTADOS
+    # -------------------------------------------------------------------------
+    
+    @staticmethod
+    def _weakly_compatible(first: List[int], second: List[int]) -> bool:
+        """Teste de compatibilidade fraca de Pager entre dois lookaheads."""
+        size = len(first)
+        for i in range(size):
+            for j in range(i + 1, size):
+                if not (first[i] & second[j] or first[j] & second[i]):
+                    continue
+                if first[i] & first[j] or second[i] & second[j]:
+                    continue
+                return False
+        return True
+    
+    def _add_state(self, kernel: Tuple[int, ...], lookaheads: List[int]) -> int:
+        """Cria um estado e o coloca na worklist."""
+        state = len(self._kernels)
+        self._kernels.append(kernel)
+        self._lookaheads.append(list(lookaheads))
+        self._by_core.setdefault(kernel, []).append(state)
+        self._worklist.append(state)
+        self._pending.add(state)
+        return state
+    
+    def _merge_into(self, state: int, lookaheads: List[int]):
+        """Soma lookaheads a um estado; reprocessa se algum cresceu."""
+        current = self._lookaheads[state]
+        changed = False
+        for i, lookahead in enumerate(lookaheads):
+            if lookahead & ~current[i]:
+                current[i] |= lookahead
+                changed = True
+        
+        if changed and state not in self._pending:
+            self._worklist.append(state)
+            self._pending.add(state)
+    
+    def _merge_or_add(self, previous: Optional[int], kernel: Tuple[int, ...],
+                      lookaheads: List[int]) -> int:
+        """
+        Escolhe o estado destino de uma transição.
+        
+        Prefere o destino anterior da mesma transição; senão, qualquer
+        estado de mesmo núcleo fracamente compatível; senão, um novo.
+        """
+        candidates = self._by_core.get(kernel, [])
+        if previous is not None and previous in candidates:
+            candidates = [previous] + [c for c in candidates if c != previous]
+        
+        for state in candidates:
+            if self._weakly_compatible(self._lookaheads[state], lookaheads):
+                self._merge_into(state, lookaheads)
+                return state
+        
+        return self._add_state(kernel, lookaheads)
+    
+    def _finish(self):
+        """Renumera os estados alcançáveis e calcula os lookaheads das reduções."""
+        names = self.grammar.symbols.names
+        encoding = self.encoding
+        
+        successors: Dict[int, List[Tuple[int, int]]] = {}
+        for (state, symbol), target in self._goto.items():
+            successors.setdefault(state, []).append((symbol, target))
+        
+        # Busca em largura a partir de I0
+        number = {0: 0}
+        order = [0]
+        for state in order:
+            for _, target in successors.get(state, ()):
+                if target not in number:
+                    number[target] = len(order)
+                    order.append(target)
+        
+        self.states = [LR1ItemSet(self._kernels[s], self._lookaheads[s], encoding)
+                       for s in order]
+        self.state_index = {}
+        for new, state in enumerate(self.states):
+            self.state_index.setdefault(state.kernel, new)
+        self.goto_table = {
+            (number[state], names[symbol]): number[target]
+            for state in order
+            for symbol, target in successors.get(state, ())
+        }
+        
+        # Lookahead de cada item completo [A -> ω •, L]
+        next_symbol = encoding.next_symbol
+        item_production = encoding.item_production
+        reduce_lookaheads: Dict[Tuple[int, int], int] = {}
+        for new, state in enumerate(self.states):
+            closure = self._closure_lr1(state.kernel, list(state.lookaheads))
+            for item, lookahead in closure.items():
+                if next_symbol[item] < 0:
+                    key = (new, item_production[item])
+                    reduce_lookaheads[key] = reduce_lookaheads.get(key, 0) | lookahead
+        
+        self.reduce_lookaheads = reduce_lookaheads
+        self.lr0_states = len({state.kernel for state in self.states})
+        
+        # Liberar estruturas de construção
+        self._kernels = []
+        self._lookaheads = []
+        self._by_core = {}
+        self._goto = {}
+    
+    def print_statistics(self):
+        """Imprime estatísticas, comparando com o autômato LR(0)."""
+        print(f"\nEstatísticas da Coleção LR(1) (fusão de Pager):")
+        print(f"  - Estados LR(1): {len(self.states)}")
+        print(f"  - Estados LR(0) (núcleos distintos): {self.lr0_states}")
+        print(f"  - Estados extras por divisão: {len(self.states) - self.lr0_states}")
+        print(f"  - Transições: {len(self.goto_table)}")
+
+
+# =============================================================================
+# TESTE DO MÓDULO
+# =============================================================================
+
+if __name__ == "__main__":
+    import sys
+    import os
+    
+    if len(sys.argv) > 1:
+        grammar_file = sys.argv[1]
+    else:
+        # Procurar gramatica_slr.bnf em docs/
+        possible_paths = [
+            "../docs/gramatica_slr.bnf",
+            "docs/gramatica_slr.bnf",
+            "gramatica_slr.bnf",
+        ]
+        grammar_file = None
+        for path in possible_paths:
+            if os.path.exists(path):
+                grammar_file = path
+                break
+        if not grammar_file:
+            grammar_file = "gramatica_slr.bnf"
+    
+    print("=" * 70)
+    print("TESTE: CONSTRUÇÃO DE ITENS LR(1) (PAGER)")
+    print("=" * 70)
+    
+    # Carregar gramática
+    print(f"\n[1] Carregando gramática: {grammar_file}")
+    grammar = SLRGrammar()
+    
+    try:
+        grammar.load_from_file(grammar_file)
+        print(f"    Produções: {len(grammar.productions)}")
+    except FileNotFoundError:
+        print(f"    ❌ ERRO: Arquivo não encontrado: {grammar_file}")
+        print(f"    Diretório atual: {os.getcwd()}")
+        sys.exit(1)
+    
+    ff = SLRFirstFollow(grammar)
+    ff.compute()
+    
+    # Construir coleção LR(1)
+    print("\n[2] Construindo coleção LR(1)...")
+    collection = LR1Collection(grammar, ff)
+    collection.build()
+    
+    collection.print_statistics()
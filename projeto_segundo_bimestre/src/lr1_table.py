@@ -0,0 +1,114 @@
+"""
+=============================================================================
+TABELA DE PARSING LR(1) - LINGUAGEM VYTHON
+=============================================================================
+
+Tabela construída sobre a coleção LR(1) com fusão de Pager
+(LR1Collection). Shift, accept e GOTO seguem a SLR(1); cada redução usa
+o lookahead LR(1) do item completo no seu estado.
+
+A interface é a de SLRParsingTable, então o SLRParser usa a tabela sem
+mudanças.
+=============================================================================
+"""
+
+from typing import Set
+
+from slr_grammar import SLRGrammar, SLRFirstFollow, Production
+from slr_table import SLRParsingTable
+from lr1_items import LR1Collection
+
+
+class LR1ParsingTable(SLRParsingTable):
+    """
+    Tabela de parsing LR(1) (estados fundidos por compatibilidade fraca).
+    
+    Recebe uma LR1Collection no lugar da CanonicalCollection; reduções
+    usam collection.reduce_lookaheads em vez de FOLLOW.
+    """
+    
+    KIND = "LR(1)"
+    
+    def _reduce_lookaheads(self, state_idx: int, prod: Production) -> Set[str]:
+        """Terminais que disparam a redução por prod: lookahead LR(1) do item."""
+        mask = self.collection.reduce_lookaheads.get((state_idx, prod.number), 0)
+        return self.first_follow.sets.names(mask)
+    
+    def print_statistics(self):
+        """Imprime estatísticas da tabela e da coleção."""
+        super().print_statistics()
+        print(f"  - Estados LR(0) equivalentes: {self.collection.lr0_states}")
+
+
+# =============================================================================
+# TESTE DO MÓDULO
+# =============================================================================
+
+if __name__ == "__main__":
+    import sys
+    import os
+    from slr_items import CanonicalCollection
+    from lalr_table import LALRParsingTable
+    
+    if len(sys.argv) > 1:
+        grammar_file = sys.argv[1]
+    else:
+        # Procurar gramatica_slr.bnf em docs/
+        possible_paths = [
+            "../docs/gramatica_slr.bnf",
+            "docs/gramatica_slr.bnf",
+            "gramatica_slr.bnf",
+        ]
+        grammar_file = None
+        for path in possible_paths:
+            if os.path.exists(path):
+                grammar_file = path
+                break
+        if not grammar_file:
+            grammar_file = "gramatica_slr.bnf"
+    
+    print("=" * 70)
+    print("TESTE: CONSTRUÇÃO DA TABELA LR(1)")
+    print("=" * 70)
+    
+    # Carregar gramática
+    print(f"\n[1] Carregando gramática: {grammar_file}")
+    grammar = SLRGrammar()
+    
+    try:
+        grammar.load_from_file(grammar_file)
+        print(f"    Produções: {len(grammar.productions)}")
+    except FileNotFoundError:
+        print(f"    ❌ ERRO: Arquivo não encontrado: {grammar_file}")
+        print(f"    Diretório atual: {os.getcwd()}")
+        sys.exit(1)
+    
+    ff = SLRFirstFollow(grammar)
+    ff.compute()
+    
+    # LALR(1) sobre o autômato LR(0), para comparação
+    print("\n[2] Construindo tabela LALR(1)...")
+    lr0 = CanonicalCollection(grammar)
+    lr0.build()
+    lalr = LALRParsingTable(grammar, lr0, ff)
+    lalr.build()
+    
+    # LR(1) com fusão de Pager
+    print("\n[3] Construindo coleção e tabela LR(1)...")
+    collection = LR1Collection(grammar, ff)
+    collection.build()
+    collection.print_statistics()
+    
+    table = LR1ParsingTable(grammar, collection, ff)
+    is_lr1 = table.build()
+    
+    table.print_statistics()
+    table.print_conflicts()
+    
+    print(f"\n    Estados LR(0): {len(lr0.states)}  |  Estados LR(1): {len(collection.states)}")
+    print(f"    Conflitos LALR(1): {len(lalr.conflicts)}  |  Conflitos LR(1): {len(table.conflicts)}")
+    
+    if is_lr1:
+        print("\n✅ Gramática é LR(1)!")
+    else:
+        print(f"\n❌ Gramática NÃO é LR(1) - {len(table.conflicts)} conflito(s)")
@@ -1,5 +1,11 @@
+from array import array
 from collections import defaultdict
 
+
+# Célula vazia da matriz densa M[A, a]
+NO_PRODUCTION = -1
+
+
 class ParsingTable:
     """Constrói tabela de parsing LL(1) processando EBNF diretamente."""
     
@@ -7,6 +13,11 @@ class ParsingTable:
         self.grammar = grammar
         self.first_follow = first_follow
         self.table = {}
+        self.table_ids = {}  # Mesma tabela indexada pelos ids de grammar.symbols
+        # Forma densa: dense_table[(A - num_terminals) * num_terminals + a] é o
+        # número da produção (first_follow.production_list) ou NO_PRODUCTION
+        self.dense_table = array('i')
+        self.num_terminals = 0
         self.conflicts = []
         self.unresolved_conflicts = []
         
@@ -19,7 +30,7 @@ class ParsingTable:
         for nt in self.grammar.nonterminals:
             for prod in self.grammar.productions[nt]:
                 # Calcular FIRST da produção com EBNF
-                first_prod = self._first_of_production(prod)
+                first_prod = self._first_of_production(nt, prod)
                 
                 # Regra 1: Para cada terminal em FIRST(α)
                 for terminal in first_prod - {self.grammar.epsilon}:
@@ -33,8 +44,29 @@ class ParsingTable:
         # Resolver conflitos
         self._resolve_conflicts()
         
+        # Indexar pelos ids dos símbolos
+        ids = self.grammar.symbols.ids
+        self.table_ids = {(ids[nt], ids[term]): prod
+                          for (nt, term), prod in self.table.items()}
+        self._compile_dense_table()
+        
         return self.table
     
+    def _compile_dense_table(self):
+        """Gera M[A, a] como matriz densa de números de produção."""
+        symbols = self.grammar.symbols
+        num_terminals = symbols.num_terminals
+        num_nonterminals = len(symbols) - num_terminals
+        numbers = self.first_follow.production_numbers
+        
+        dense = array('i', [NO_PRODUCTION]) * (num_nonterminals * num_terminals)
+        for (nt_id, term_id), prod in self.table_ids.items():
+            nt = symbols.names[nt_id]
+            dense[(nt_id - num_terminals) * num_terminals + term_id] = numbers[(nt, tuple(prod))]
+        
+        self.dense_table = dense
+        self.num_terminals = num_terminals
+    
     def _add_entry(self, nonterminal, terminal, production):
         """Adiciona entrada na tabela."""
         key = (nonterminal, terminal)
@@ -50,6 +82,7 @@ class ParsingTable:
                 'cell': key,
                 'existing': existing,
                 'new': production,
+                'kind': self._conflict_kind(nonterminal, terminal, existing, production),
                 'resolved': False,
                 'strategy': None
             }
@@ -77,80 +110,40 @@ class ParsingTable:
         return (len(production) == 1 and 
                 self.grammar.is_epsilon(production[0]))
     
-    def _first_of_production(self, prod):
+    def _first_of_production(self, nonterminal, prod):
         """
-        Calcula FIRST de uma produção processando EBNF diretamente.
+        FIRST de uma produção com EBNF, lido do cache de sufixos.
         
-        Regras EBNF:
+        Regras EBNF (ver TerminalSets.suffix_first):
         - A*  → FIRST(A) ∪ {ε}
         - A+  → FIRST(A)
         - A?  → FIRST(A) ∪ {ε}
         """
-        result = set()
-        
-        # Epsilon
-        if len(prod) == 1 and self.grammar.is_epsilon(prod[0]):
-            return {self.grammar.epsilon}
-        
-        i = 0
-        while i < len(prod):
-            symbol = prod[i]
-            
-            # Verificar operador EBNF
-            if i + 1 < len(prod) and prod[i + 1] in ['*', '+', '?']:
-                operator = prod[i + 1]
-                
-                # Obter FIRST do símbolo
-                if symbol in self.grammar.terminals:
-                    first_sym = {symbol}
-                else:
-                    first_sym = self.first_follow.first.get(symbol, set())
-                
-                # Aplicar operador
-                if operator == '*':
-                    # A*: pode ser vazio, sempre continua
-                    result.update(first_sym - {self.grammar.epsilon})
-                    i += 2
-                    if i >= len(prod):
-                        result.add(self.grammar.epsilon)
-                    continue
-                    
-                elif operator == '+':
-                    # A+: não pode ser vazio
-                    result.update(first_sym - {self.grammar.epsilon})
-                    if self.grammar.epsilon not in first_sym:
-                        break
-                    i += 2
-                    if i >= len(prod):
-                        result.add(self.grammar.epsilon)
-                    continue
-                    
-                elif operator == '?':
-                    # A?: pode ser vazio, sempre continua
-                    result.update(first_sym - {self.grammar.epsilon})
-                    i += 2
-                    if i >= len(prod):
-                        result.add(self.grammar.epsilon)
-                    continue
-            
-            # Símbolo normal (sem operador EBNF)
-            # Terminal
-            if symbol in self.grammar.terminals:
-                result.add(symbol)
-                break
-            
-            # Não-terminal
-            first_sym = self.first_follow.first.get(symbol, set())
-            result.update(first_sym - {self.grammar.epsilon})
-            
-            if self.grammar.epsilon not in first_sym:
-                break
-            
-            i += 1
-            if i >= len(prod):
-                result.add(self.grammar.epsilon)
+        return self.first_follow.first_of_production(nonterminal, prod)
+    
+    def _conflict_kind(self, nonterminal, terminal, existing, new):
+        """
+        Classifica um conflito como FIRST/FIRST ou FIRST/FOLLOW.
         
-        return result
+        Consulta o cache de sufixos para saber se o terminal entrou na
+        célula pelo FIRST de cada produção ou pelo FOLLOW(A).
+        """
+        bit = self.first_follow.sets.bit(terminal)
+        from_first = [
+            bool(self.first_follow.production_first_bits(nonterminal, prod) & bit)
+            for prod in (existing, new)
+        ]
+        return 'FIRST/FIRST' if all(from_first) else 'FIRST/FOLLOW'
+    
+    def get_production_id(self, nonterminal_id, terminal_id):
+        """Busca produção M[A, a] pelos ids dos símbolos."""
+        return self.table_ids.get((nonterminal_id, terminal_id))
+    
+    def get_production_number(self, nonterminal_id, terminal_id):
+        """Número da produção em M[A, a] na matriz densa (ou NO_PRODUCTION)."""
+        if 0 <= terminal_id < self.num_terminals:
+            return self.dense_table[(nonterminal_id - self.num_terminals) * self.num_terminals + terminal_id]
+        return NO_PRODUCTION
     
     def is_ll1(self):
         """Verifica se gramática é LL(1)."""
@@ -182,7 +175,7 @@ class ParsingTable:
             existing_str = ' '.join(conf['existing'])
             new_str = ' '.join(conf['new'])
             
-            print(f"Conflito {i}: M[{nt}, {term}]")
+            print(f"Conflito {i} ({conf['kind']}): M[{nt}, {term}]")
             print(f"  Produção 1: {nt} ::= {existing_str}")
             print(f"  Produção 2: {nt} ::= {new_str}")
             print()
@@ -230,7 +223,7 @@ class ParsingTable:
                 f.write("=== CONFLITOS ===\n")
                 for i, conf in enumerate(self.conflicts, 1):
                     nt, term = conf['cell']
-                    f.write(f"Conflito {i}: M[{nt}, {term}]\n")
+                    f.write(f"Conflito {i} ({conf['kind']}): M[{nt}, {term}]\n")
                     f.write(f"  Existente: {' '.join(conf['existing'])}\n")
                     f.write(f"  Nova: {' '.join(conf['new'])}\n")
                     if conf['resolved']:
@@ -130,7 +130,7 @@ def main():
     print("\n[5] Executando Parser LL(1)...")
 
     # Instancia o Parser com a gramática e a tabela gerada
-    parser = LL1Parser(g, pt)
+    parser = LL1Parser(g, pt, trace=print)
 
     # Executa a análise
     success = parser.parse(tokens)
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+GERADOR DE PARSER SLR(1) - LINGUAGEM VYTHON
+=============================================================================
+
+Modo ahead-of-time: a partir da tabela SLR(1) já construída, gera um
+módulo Python independente, com as tabelas como literais e um laço de
+parsing especializado. Importar o módulo gerado não exige SLRGrammar,
+CanonicalCollection nem SLRFirstFollow.
+
+As tabelas emitidas são exatamente as células de save_to_csv: mesmas
+colunas (terminais e não-terminais em ordem alfabética), lidas com
+get_action/get_goto e codificadas como na tabela densa:
+- 0        -> erro
+- j + 1    -> shift j
+- -(p + 2) -> reduce pela produção p
+- -1       -> accept
+
+Uso:
+    python slr_codegen.py [gramatica.bnf] [saida.py]
+=============================================================================
+"""
+
+import os
+import sys
+from typing import List, Optional, Sequence
+
+from slr_table import SLRParsingTable, encode_action, GOTO_ERROR
+
+
+# Números por linha nos literais gerados
+_ITEMS_PER_LINE = 20
+
+
+# =============================================================================
+# MODELO DO MÓDULO GERADO
+# =============================================================================
+
+_MODULE_TEMPLATE = '''"""
+=============================================================================
+PARSER SLR(1) GERADO - LINGUAGEM VYTHON
+=============================================================================
+
+Gerado por slr_codegen.py a partir de {grammar_name}. NÃO EDITE: gere de
+novo quando a gramática mudar.
+
+SHA-256 da gramática: {grammar_sha256}
+Estados: {num_states} | Terminais: {num_terminals} | Não-terminais: {num_nonterminals}
+
+Uso:
+    accepted, error = parse(tokens)
+
+tokens: tuplas (tipo, valor), objetos Token ou um TokenBuffer do lexer.
+=============================================================================
+"""
+
+GRAMMAR_SHA256 = {grammar_sha256!r}
+
+NUM_STATES = {num_states}
+NUM_TERMINALS = {num_terminals}
+NUM_NONTERMINALS = {num_nonterminals}
+
+# Colunas de ACTION (terminais) e de GOTO (não-terminais)
+TERMINALS = {terminals}
+NONTERMINALS = {nonterminals}
+
+# Tipo de token do lexer (com ou sem aspas) -> coluna de ACTION
+TOKEN_IDS = {token_ids}
+EOF_ID = {eof_id}
+END_ID = {end_id}
+
+# ACTION[estado * NUM_TERMINALS + terminal]
+ACTION = {action}
+
+# GOTO[estado * NUM_NONTERMINALS + não-terminal] (-1 = vazio)
+GOTO = {goto}
+
+# Por produção: tamanho do corpo e coluna GOTO da cabeça
+PROD_LENGTHS = {prod_lengths}
+PROD_HEADS = {prod_heads}
+
+
+def _token_ids(tokens):
+    """Gera (id do terminal, tipo) de cada token, seguidos de EOF e $."""
+    has_eof = False
+    
+    if hasattr(tokens, 'type_ids'):
+        # TokenBuffer: traduz a numeração do buffer uma única vez
+        id_map = [TOKEN_IDS.get(name, -1) for name in tokens.type_names]
+        type_names = tokens.type_names
+        for type_id in tokens.type_ids:
+            token_type = type_names[type_id]
+            if token_type == 'EOF':
+                has_eof = True
+            yield id_map[type_id], token_type
+    else:
+        for token in tokens:
+            if isinstance(token, tuple):
+                token_type = token[0]
+            elif hasattr(token, 'type'):
+                token_type = token.type
+            else:
+                token_type = str(token)
+            
+            if token_type == 'EOF' or token_type == "'EOF'":
+                has_eof = True
+            yield TOKEN_IDS.get(token_type, -1), token_type
+    
+    if not has_eof:
+        yield EOF_ID, 'EOF'
+    yield END_ID, '$'
+
+
+def _error_message(state, token_type):
+    """Mensagem de erro no mesmo formato do SLRParser."""
+    offset = state * NUM_TERMINALS
+    expected = []
+    for terminal_id in range(NUM_TERMINALS):
+        if ACTION[offset + terminal_id]:
+            name = TERMINALS[terminal_id]
+            expected.append(name[1:-1] if name.startswith("'") else name)
+    
+    symbol_display = token_type[1:-1] if token_type.startswith("'") else token_type
+    
+    msg = f"Erro sintático no estado {{state}}\\n"
+    msg += f"  Token encontrado: '{{symbol_display}}'\\n"
+    
+    if expected:
+        expected_str = ", ".join(sorted(expected)[:10])
+        if len(expected) > 10:
+            expected_str += f" ... (+{{len(expected)-10}} outros)"
+        msg += f"  Tokens esperados: {{expected_str}}"
+    
+    return msg
+
+
+def parse(tokens):
+    """
+    Analisa a cadeia de tokens.
+    
+    Returns:
+        (True, None) se aceita, (False, mensagem de erro) se rejeitada
+    """
+    action = ACTION
+    goto = GOTO
+    prod_lengths = PROD_LENGTHS
+    prod_heads = PROD_HEADS
+    num_terminals = NUM_TERMINALS
+    num_nonterminals = NUM_NONTERMINALS
+    
+    stream = _token_ids(tokens)
+    token_id, token_type = next(stream)
+    stack = [0]
+    
+    while True:
+        state = stack[-1]
+        code = action[state * num_terminals + token_id] if token_id >= 0 else 0
+        
+        if code > 0:
+            # SHIFT
+            stack.append(code - 1)
+            token_id, token_type = next(stream)
+        
+        elif code < -1:
+            # REDUCE
+            prod_number = -code - 2
+            body_length = prod_lengths[prod_number]
+            if body_length:
+                del stack[-body_length:]
+            target = goto[stack[-1] * num_nonterminals + prod_heads[prod_number]]
+            if target < 0:
+                return False, f"GOTO[{{stack[-1]}}, {{NONTERMINALS[prod_heads[prod_number]]}}] não definido"
+            stack.append(target)
+        
+        elif code == -1:
+            # ACCEPT
+            return True, None
+        
+        else:
+            return False, _error_message(state, token_type)
+'''
+
+
+# =============================================================================
+# GERAÇÃO
+# =============================================================================
+
+def _format_ints(values: Sequence[int], indent: str = '    ') -> str:
+    """Formata inteiros como literal de tupla, quebrando as linhas."""
+    if not values:
+        return '()'
+    lines = []
+    for start in range(0, len(values), _ITEMS_PER_LINE):
+        chunk = values[start:start + _ITEMS_PER_LINE]
+        lines.append(indent + ', '.join(str(v) for v in chunk) + ',')
+    return '(\n' + '\n'.join(lines) + '\n)'
+
+
+def _format_strings(values: Sequence[str], indent: str = '    ') -> str:
+    """Formata strings como literal de tupla, uma por linha."""
+    if not values:
+        return '()'
+    return '(\n' + '\n'.join(f"{indent}{v!r}," for v in values) + '\n)'
+
+
+def _format_token_ids(terminals: List[str]) -> str:
+    """Mapa tipo de token -> coluna, aceitando o tipo com ou sem aspas."""
+    token_ids = {}
+    for terminal_id, name in enumerate(terminals):
+        token_ids[name] = terminal_id
+    for terminal_id, name in enumerate(terminals):
+        if len(name) >= 2 and name.startswith("'") and name.endswith("'"):
+            token_ids.setdefault(name[1:-1], terminal_id)
+        else:
+            token_ids.setdefault(f"'{name}'", terminal_id)
+    
+    lines = [f"    {name!r}: {terminal_id}," for name, terminal_id in token_ids.items()]
+    return '{\n' + '\n'.join(lines) + '\n}'
+
+
+def generate_parser_module(table: SLRParsingTable, grammar_file: Optional[str] = None,
+                           grammar_sha256: str = '') -> str:
+    """
+    Gera o código-fonte do parser independente.
+    
+    Args:
+        table: Tabela SLR(1) construída
+        grammar_file: Arquivo BNF de origem (só para o cabeçalho)
+        grammar_sha256: Hash da gramática (só para o cabeçalho)
+    
+    Returns:
+        Código-fonte do módulo
+    """
+    grammar = table.grammar
+    
+    # Mesmas colunas de save_to_csv
+    terminals = sorted(grammar.terminals)
+    nonterminals = sorted(grammar.nonterminals - {grammar.start_symbol})
+    nonterminal_ids = {nt: i for i, nt in enumerate(nonterminals)}
+    num_states = len(table.collection.states)
+    
+    action = []
+    goto = []
+    for state_idx in range(num_states):
+        for t in terminals:
+            action.append(encode_action(table.get_action(state_idx, t)))
+        for nt in nonterminals:
+            target = table.get_goto(state_idx, nt)
+            goto.append(target if target is not None else GOTO_ERROR)
+    
+    # Informações de redução. A produção aumentada só vira accept e não
+    # tem coluna GOTO; qualquer outra cabeça sem coluna é erro na geração
+    names = grammar.symbols.names
+    prod_lengths = list(grammar.reduce_lengths)
+    prod_heads = []
+    for number, head in enumerate(grammar.reduce_heads):
+        head_name = names[head]
+        if head_name == grammar.start_symbol:
+            prod_heads.append(GOTO_ERROR)
+        elif head_name in nonterminal_ids:
+            prod_heads.append(nonterminal_ids[head_name])
+        else:
+            raise ValueError(f"Produção {number}: cabeça {head_name} sem coluna na tabela GOTO")
+    
+    return _MODULE_TEMPLATE.format(
+        grammar_name=os.path.basename(grammar_file) if grammar_file else 'gramática SLR',
+        grammar_sha256=grammar_sha256,
+        num_states=num_states,
+        num_terminals=len(terminals),
+        num_nonterminals=len(nonterminals),
+        terminals=_format_strings(terminals),
+        nonterminals=_format_strings(nonterminals),
+        token_ids=_format_token_ids(terminals),
+        eof_id=terminals.index("'EOF'") if "'EOF'" in terminals else -1,
+        end_id=terminals.index(grammar.END_MARKER),
+        action=_format_ints(action),
+        goto=_format_ints(goto),
+        prod_lengths=_format_ints(prod_lengths),
+        prod_heads=_format_ints(prod_heads),
+    )
+
+
+def write_parser_module(table: SLRParsingTable, output_path: str,
+                        grammar_file: Optional[str] = None, grammar_sha256: str = ''):
+    """Gera o parser independente e grava em output_path."""
+    source = generate_parser_module(table, grammar_file, grammar_sha256)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    print(f"[OK] Parser SLR(1) gerado em: {output_path}")
+
+
+# =============================================================================
+# LINHA DE COMANDO
+# =============================================================================
+
+if __name__ == "__main__":
+    from table_cache import load_slr_tables, grammar_hash
+    
+    if len(sys.argv) > 1:
+        grammar_file = sys.argv[1]
+    else:
+        grammar_file = None
+        for path in ["../docs/gramatica_slr.bnf", "docs/gramatica_slr.bnf", "gramatica_slr.bnf"]:
+            if os.path.exists(path):
+                grammar_file = path
+                break
+        if not grammar_file:
+            print("❌ ERRO: Arquivo de gramática não encontrado!")
+            print("\nUso: python3 slr_codegen.py [gramatica.bnf] [saida.py]")
+            sys.exit(1)
+    
+    output_path = sys.argv[2] if len(sys.argv) > 2 else "vython_slr_parser.py"
+    
+    grammar, ff, collection, table = load_slr_tables(grammar_file, verbose=True)
+    if not table.is_slr1():
+        print(f"❌ Gramática NÃO é SLR(1) - {len(table.conflicts)} conflito(s)")
+        sys.exit(1)
+    
+    write_parser_module(table, output_path, grammar_file, grammar_hash(grammar_file))
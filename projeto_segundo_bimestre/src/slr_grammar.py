@@ -7,14 +7,28 @@ Adaptação da gramática para análise SLR(1):
 1. Gramática aumentada com símbolo inicial S' -> S
 2. Produções numeradas para referência na tabela
 3. Estruturas otimizadas para construção de itens LR(0)
+4. Índice das produções por número com os dados de redução
+   (|β| com ε contando 0 e id da cabeça) já calculados
+5. Declarações opcionais de precedência/associatividade (estilo yacc),
+   uma por linha, da menor para a maior precedência:
+       %left '+' '-'
+       %left '*' '/'
+       %right '**'
+       %nonassoc '<' '>'
+   A precedência de uma produção é a do seu último terminal declarado
 =============================================================================
 """
 
+from array import array
 from collections import defaultdict
+from collections.abc import Mapping
 from typing import List, Dict, Set, Tuple, Optional
 from dataclasses import dataclass
 import os
 
+from symbols import SymbolTable
+from terminal_sets import SuffixFirst, TerminalSets, TerminalSetView
+
 
 @dataclass
 class Production:
@@ -56,6 +70,7 @@ class SLRGrammar:
     EPSILON = 'ε'
     AUGMENTED_START = "<program'>"
     END_MARKER = '$'
+    ASSOCIATIVITY = ('%left', '%right', '%nonassoc')
     
     def __init__(self):
         self.productions: List[Production] = []
@@ -64,6 +79,17 @@ class SLRGrammar:
         self.start_symbol: str = None
         self.original_start: str = None
         self.prod_by_head: Dict[str, List[Production]] = defaultdict(list)
+        self.symbols: Optional[SymbolTable] = None  # Ids densos dos símbolos
+        
+        # Índice por número de produção (preenchido por _index_productions)
+        self.production_by_number: List[Optional[Production]] = []
+        self.reduce_lengths = array('i')  # |β| de cada produção (ε conta 0)
+        self.reduce_heads = array('i')    # Id (SymbolTable) da cabeça
+        self.reduce_info: List[Tuple[int, int]] = []  # (|β|, id da cabeça)
+        
+        # Precedência: terminal -> (nível, 'left' | 'right' | 'nonassoc')
+        self.precedence: Dict[str, Tuple[int, str]] = {}
+        self.production_precedence: List[Optional[Tuple[int, str]]] = []
         
     def load_from_file(self, filepath: str):
         """
@@ -75,6 +101,7 @@ class SLRGrammar:
         
         # Juntar linhas de continuação
         merged_lines = []
+        precedence_lines = []
         current_rule = None
         
         for line in lines:
@@ -83,6 +110,14 @@ class SLRGrammar:
             if not stripped or stripped.startswith('#'):
                 continue
             
+            keyword = stripped.split(None, 1)[0]
+            if keyword in self.ASSOCIATIVITY:
+                precedence_lines.append(stripped)
+                continue
+            if keyword[0] == '%' and keyword[1:2].isalpha():
+                raise ValueError(f"Declaração desconhecida: {keyword} "
+                                 f"(esperado {', '.join(self.ASSOCIATIVITY)})")
+            
             if stripped.startswith('|'):
                 if current_rule:
                     current_rule += ' ' + stripped
@@ -133,6 +168,15 @@ class SLRGrammar:
         # Criar gramática aumentada
         self._augment_grammar()
         
+        # Níveis de precedência declarados
+        self._load_precedence(precedence_lines)
+        
+        # Numerar terminais e não-terminais
+        self.symbols = SymbolTable(self.terminals, self.nonterminals)
+        
+        # Indexar produções e dados de redução
+        self._index_productions()
+        
     def _augment_grammar(self):
         """
         Cria gramática aumentada adicionando S' -> S.
@@ -148,6 +192,53 @@ class SLRGrammar:
         # Adicionar $ aos terminais
         self.terminals.add(self.END_MARKER)
     
+    def _load_precedence(self, lines: List[str]):
+        """
+        Lê as declarações %left/%right/%nonassoc.
+        
+        Cada linha é um nível, em ordem crescente de precedência; os
+        terminais são tokenizados como no corpo das produções.
+        """
+        for level, line in enumerate(lines, 1):
+            keyword, *rest = line.split(None, 1)
+            rest = rest[0] if rest else ''
+            associativity = keyword[1:]
+            for terminal in self._tokenize(rest):
+                self.precedence[terminal] = (level, associativity)
+    
+    def _index_productions(self):
+        """
+        Indexa as produções pelo número e pré-calcula os dados de redução.
+        
+        reduce_lengths[p] é quantos símbolos a redução p desempilha
+        (0 para A -> ε) e reduce_heads[p] o id da cabeça em symbols;
+        reduce_info[p] junta os dois num par. production_precedence[p]
+        é a precedência do último terminal declarado do corpo (ou None).
+        """
+        num_productions = max(prod.number for prod in self.productions) + 1
+        by_number: List[Optional[Production]] = [None] * num_productions
+        precedence: List[Optional[Tuple[int, str]]] = [None] * num_productions
+        reduce_lengths = array('i', [0]) * num_productions
+        reduce_heads = array('i', [0]) * num_productions
+        
+        for prod in self.productions:
+            body = prod.body
+            if body == (self.EPSILON,):
+                body = ()
+            by_number[prod.number] = prod
+            reduce_lengths[prod.number] = len(body)
+            reduce_heads[prod.number] = self.symbols.ids[prod.head]
+            for symbol in reversed(body):
+                if symbol in self.precedence:
+                    precedence[prod.number] = self.precedence[symbol]
+                    break
+        
+        self.production_by_number = by_number
+        self.reduce_lengths = reduce_lengths
+        self.reduce_heads = reduce_heads
+        self.reduce_info = list(zip(reduce_lengths, reduce_heads))
+        self.production_precedence = precedence
+    
     def _split_alternatives(self, text: str) -> List[str]:
         """Divide alternativas por | respeitando parênteses e aspas."""
         alternatives = []
@@ -248,9 +339,8 @@ class SLRGrammar:
     
     def get_production(self, number: int) -> Optional[Production]:
         """Retorna produção pelo número."""
-        for prod in self.productions:
-            if prod.number == number:
-                return prod
+        if 0 <= number < len(self.production_by_number):
+            return self.production_by_number[number]
         return None
     
     def get_productions_for(self, nonterminal: str) -> List[Production]:
@@ -289,12 +379,21 @@ class SLRGrammar:
 class SLRFirstFollow:
     """
     Calcula conjuntos FIRST e FOLLOW para gramática SLR.
+    
+    Os conjuntos são calculados como bitmasks (TerminalSets) em
+    first_bits/follow_bits; first e follow são visões dict-de-sets.
+    suffixes guarda FIRST dos sufixos, indexado pelo número da produção.
     """
     
     def __init__(self, grammar: SLRGrammar):
         self.grammar = grammar
-        self.first: Dict[str, Set[str]] = defaultdict(set)
-        self.follow: Dict[str, Set[str]] = defaultdict(set)
+        self.sets = TerminalSets(grammar.symbols, epsilon=grammar.EPSILON)
+        self.first_bits: Dict[str, int] = {}
+        self.follow_bits: Dict[str, int] = {}
+        self.first: Mapping[str, Set[str]] = TerminalSetView(self.first_bits, self.sets)
+        self.follow: Mapping[str, Set[str]] = TerminalSetView(self.follow_bits, self.sets)
+        self.suffixes: Optional[SuffixFirst] = None
+        self.step_factor: int = 1  # Passos por token (TerminalSets.step_factor)
         
     def compute(self):
         """Calcula FIRST e FOLLOW."""
@@ -302,90 +401,46 @@ class SLRFirstFollow:
         self._compute_follow()
         return self.first, self.follow
     
+    def _productions(self):
+        """Pares (cabeça, corpo) de todas as produções."""
+        return [(prod.head, prod.body) for prod in self.grammar.productions]
+    
     def _compute_first(self):
         """Calcula FIRST para todos os símbolos."""
-        # FIRST de terminais
-        for terminal in self.grammar.terminals:
-            self.first[terminal] = {terminal}
+        # FIRST de terminais e de epsilon
+        first = {t: self.sets.bit(t) for t in self.grammar.terminals}
+        first[self.grammar.EPSILON] = self.sets.EPSILON
         
-        # FIRST de epsilon
-        self.first[self.grammar.EPSILON] = {self.grammar.EPSILON}
+        # Ponto fixo sobre bitmasks para não-terminais
+        productions = self._productions()
+        self.sets.compute_first(productions, first)
         
-        # Algoritmo de ponto fixo para não-terminais
-        changed = True
-        while changed:
-            changed = False
-            
-            for prod in self.grammar.productions:
-                nt = prod.head
-                old_size = len(self.first[nt])
-                
-                # Calcular FIRST da produção
-                first_prod = self._first_of_sequence(prod.body)
-                self.first[nt].update(first_prod)
-                
-                if len(self.first[nt]) > old_size:
-                    changed = True
+        self.first_bits = first
+        self.first = TerminalSetView(first, self.sets)
+        self.suffixes = self.sets.suffix_first(productions, first)
+        self.step_factor = self.sets.step_factor(productions, first)
     
     def _compute_follow(self):
-        """Calcula FOLLOW para todos os não-terminais."""
-        # FOLLOW(S') = {$}
-        self.follow[self.grammar.start_symbol].add(self.grammar.END_MARKER)
-        
-        # Algoritmo de ponto fixo
-        changed = True
-        while changed:
-            changed = False
-            
-            for prod in self.grammar.productions:
-                body = prod.body
-                
-                for i, symbol in enumerate(body):
-                    if not self.grammar.is_nonterminal(symbol):
-                        continue
-                    
-                    old_size = len(self.follow[symbol])
-                    
-                    # β = tudo depois do símbolo
-                    beta = body[i+1:]
-                    
-                    if beta:
-                        # FOLLOW(B) inclui FIRST(β) - {ε}
-                        first_beta = self._first_of_sequence(beta)
-                        self.follow[symbol].update(first_beta - {self.grammar.EPSILON})
-                        
-                        # Se ε ∈ FIRST(β), FOLLOW(B) inclui FOLLOW(A)
-                        if self.grammar.EPSILON in first_beta:
-                            self.follow[symbol].update(self.follow[prod.head])
-                    else:
-                        # B é último símbolo
-                        self.follow[symbol].update(self.follow[prod.head])
-                    
-                    if len(self.follow[symbol]) > old_size:
-                        changed = True
+        """Calcula FOLLOW para todos os não-terminais (FOLLOW(S') = {$})."""
+        follow = self.sets.compute_follow(
+            self._productions(),
+            self.first_bits,
+            self.grammar.nonterminals,
+            self.grammar.start_symbol,
+            self.grammar.END_MARKER,
+            self.suffixes
+        )
+        
+        self.follow_bits = follow
+        self.follow = TerminalSetView(follow, self.sets)
     
     def _first_of_sequence(self, sequence: Tuple[str, ...]) -> Set[str]:
         """Calcula FIRST de uma sequência de símbolos."""
-        result = set()
-        
-        if not sequence:
-            return {self.grammar.EPSILON}
-        
-        for symbol in sequence:
-            if self.grammar.is_epsilon(symbol):
-                result.add(self.grammar.EPSILON)
-                continue
-            
-            first_sym = self.first.get(symbol, set())
-            result.update(first_sym - {self.grammar.EPSILON})
-            
-            if self.grammar.EPSILON not in first_sym:
-                break
-        else:
-            # Todos derivam ε
-            result.add(self.grammar.EPSILON)
-        
-        return result
+        return self.sets.names(self.sets.first_of_sequence(sequence, self.first_bits))
+    
+    def first_of_suffix(self, production: int, offset: int = 0) -> Set[str]:
+        """FIRST(corpo[offset:]) da produção de número dado, via cache."""
+        return self.sets.names(self.suffixes.first_at(production, offset))
     
     def get_first(self, symbol: str) -> Set[str]:
         """Retorna FIRST de um símbolo."""
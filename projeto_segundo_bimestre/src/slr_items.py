@@ -13,10 +13,19 @@ Exemplo:
     A -> α • β
     
     Onde α já foi visto e β é esperado.
+
+Representação compacta:
+- Cada item é um inteiro: base[p] + posição do ponto na produção p
+- next_symbol[item] guarda o id do símbolo após o ponto (-1 se completo)
+- Um estado é identificado só pelo seu kernel (tupla ordenada de itens);
+  o closure é expandido quando necessário
+- closure[B] (closure de todos os [B -> • γ]) é pré-calculado por
+  não-terminal, e cada estado é particionado por símbolo numa só passada
 =============================================================================
 """
 
-from typing import List, Dict, Set, Tuple, FrozenSet, Optional
+from array import array
+from typing import Iterable, Iterator, List, Dict, Set, Tuple, FrozenSet, Optional
 from dataclasses import dataclass
 from collections import deque
 
@@ -89,14 +98,136 @@ class LR0Item:
         return LR0Item(self.production, self.dot_position + 1)
 
 
+class ItemEncoding:
+    """
+    Numeração compacta dos itens LR(0) de uma gramática.
+    
+    O item [A -> α • β] da produção p é o inteiro base[p] + |α|. Para
+    A -> ε existe um único item (já completo).
+    
+    Attributes:
+        base: Primeiro item de cada produção, indexado pelo número
+        item_production: Número da produção de cada item
+        item_dot: Posição do ponto de cada item
+        next_symbol: Id do símbolo após o ponto (-1 se completo)
+        starts: Id do não-terminal B -> itens [B -> • γ]
+        nonterminal_closure: Id de B -> closure de starts[B]
+    """
+    
+    def __init__(self, grammar: SLRGrammar):
+        self.grammar = grammar
+        symbols = grammar.symbols
+        ids = symbols.ids
+        self.num_terminals = symbols.num_terminals
+        
+        num_productions = len(grammar.production_by_number)
+        self.base = array('i', [0]) * num_productions
+        self.item_production = array('i')
+        self.item_dot = array('i')
+        self.next_symbol = array('i')
+        self.starts: Dict[int, Tuple[int, ...]] = {}
+        
+        starts: Dict[int, List[int]] = {}
+        for prod in grammar.productions:
+            body = prod.body
+            if body == (grammar.EPSILON,):
+                body = ()
+            
+            first_item = len(self.next_symbol)
+            self.base[prod.number] = first_item
+            for dot in range(len(body) + 1):
+                self.item_production.append(prod.number)
+                self.item_dot.append(dot)
+                self.next_symbol.append(ids[body[dot]] if dot < len(body) else -1)
+            
+            starts.setdefault(ids[prod.head], []).append(first_item)
+        
+        self.starts = {head: tuple(items) for head, items in starts.items()}
+        self.nonterminal_closure: Dict[int, Tuple[int, ...]] = {
+            head: tuple(self._expand(items)) for head, items in self.starts.items()
+        }
+    
+    def __len__(self):
+        return len(self.next_symbol)
+    
+    def encode(self, item: LR0Item) -> int:
+        """Converte um LR0Item no inteiro correspondente."""
+        if item.is_complete():
+            number = item.production.number
+            return self.base[number] + self.grammar.reduce_lengths[number]
+        return self.base[item.production.number] + item.dot_position
+    
+    def decode(self, item: int) -> LR0Item:
+        """Converte um item inteiro em LR0Item."""
+        prod = self.grammar.production_by_number[self.item_production[item]]
+        if prod.body == (self.grammar.EPSILON,):
+            return LR0Item(prod, 1)  # Ponto após epsilon
+        return LR0Item(prod, self.item_dot[item])
+    
+    def _expand(self, items: Iterable[int]) -> List[int]:
+        """
+        Fecho de um conjunto de itens, expandindo cada não-terminal
+        após o ponto uma única vez com os itens [B -> • γ].
+        """
+        next_symbol = self.next_symbol
+        num_terminals = self.num_terminals
+        starts = self.starts
+        
+        result = list(items)
+        seen = set(result)
+        expanded = set()
+        
+        for item in result:
+            symbol = next_symbol[item]
+            if symbol < num_terminals or symbol in expanded:
+                continue
+            expanded.add(symbol)
+            for start in starts.get(symbol, ()):
+                if start not in seen:
+                    seen.add(start)
+                    result.append(start)
+        
+        return result
+    
+    def closure(self, kernel: Iterable[int]) -> List[int]:
+        """
+        CLOSURE de um kernel, em itens inteiros.
+        
+        O kernel vem primeiro, seguido de nonterminal_closure[B] para
+        cada não-terminal B após o ponto num item do kernel.
+        """
+        next_symbol = self.next_symbol
+        num_terminals = self.num_terminals
+        nonterminal_closure = self.nonterminal_closure
+        
+        result = list(kernel)
+        seen = set(result)
+        expanded = set()
+        
+        for item in kernel:
+            symbol = next_symbol[item]
+            if symbol < num_terminals or symbol in expanded:
+                continue
+            expanded.add(symbol)
+            for added in nonterminal_closure.get(symbol, ()):
+                if added not in seen:
+                    seen.add(added)
+                    result.append(added)
+        
+        return result
+
+
 class LR0ItemSet:
     """
     Representa um conjunto de itens LR(0) - um estado do autômato.
+    
+    Só o kernel (itens inteiros, ordenados) é guardado; igualdade e
+    hash usam apenas ele. O closure é expandido a cada consulta.
     """
     
-    def __init__(self, items: Set[LR0Item] = None):
-        self.items: FrozenSet[LR0Item] = frozenset(items) if items else frozenset()
-        self._hash = None
+    def __init__(self, kernel: Iterable[int] = (), encoding: ItemEncoding = None):
+        self.kernel: Tuple[int, ...] = tuple(sorted(kernel))
+        self.encoding = encoding
     
     def __repr__(self):
         items_str = '\n    '.join(str(item) for item in sorted(self.items, key=str))
@@ -105,21 +236,33 @@ class LR0ItemSet:
     def __eq__(self, other):
         if not isinstance(other, LR0ItemSet):
             return False
-        return self.items == other.items
+        return self.kernel == other.kernel
     
     def __hash__(self):
-        if self._hash is None:
-            self._hash = hash(self.items)
-        return self._hash
+        return hash(self.kernel)
+    
+    def item_ids(self) -> List[int]:
+        """Itens inteiros do closure (kernel primeiro)."""
+        if not self.kernel:
+            return []
+        return self.encoding.closure(self.kernel)
+    
+    @property
+    def items(self) -> FrozenSet[LR0Item]:
+        """Closure completo como LR0Items."""
+        return frozenset(self)
     
     def __len__(self):
-        return len(self.items)
+        return len(self.item_ids())
     
-    def __iter__(self):
-        return iter(self.items)
+    def __iter__(self) -> Iterator[LR0Item]:
+        decode = self.encoding.decode if self.kernel else None
+        return (decode(item) for item in self.item_ids())
     
     def __contains__(self, item):
-        return item in self.items
+        if not self.kernel or not isinstance(item, LR0Item):
+            return False
+        return self.encoding.encode(item) in self.item_ids()
 
 
 class CanonicalCollection:
@@ -135,7 +278,8 @@ class CanonicalCollection:
         self.grammar = grammar
         self.states: List[LR0ItemSet] = []
         self.goto_table: Dict[Tuple[int, str], int] = {}
-        self.state_index: Dict[FrozenSet[LR0Item], int] = {}
+        self.state_index: Dict[Tuple[int, ...], int] = {}  # Kernel -> estado
+        self.encoding: Optional[ItemEncoding] = None
         
     def build(self):
         """
@@ -143,59 +287,46 @@ class CanonicalCollection:
         
         Algoritmo:
         1. Criar I0 = CLOSURE({[S' -> • S]})
-        2. Para cada estado I e símbolo X:
-           - Calcular GOTO(I, X)
-           - Se não existe, adicionar à coleção
+        2. Para cada estado I, particionar seus itens pelo símbolo X após
+           o ponto, obtendo o kernel de GOTO(I, X) para todos os X
+           - Se não existe estado com esse kernel, adicionar à coleção
         3. Repetir até não haver novos estados
         """
-        # Criar item inicial: S' -> • S
-        augmented_prod = self.grammar.get_production(0)
-        initial_item = LR0Item(augmented_prod, 0)
+        encoding = ItemEncoding(self.grammar)
+        self.encoding = encoding
+        names = self.grammar.symbols.names
         
-        # Estado inicial I0
-        I0 = self._closure({initial_item})
+        # Estado inicial I0, com kernel S' -> • S
+        I0 = LR0ItemSet((encoding.base[0],), encoding)
         self.states.append(I0)
-        self.state_index[I0.items] = 0
+        self.state_index[I0.kernel] = 0
         
         # Worklist de estados a processar
         worklist = deque([0])
         
         while worklist:
             state_idx = worklist.popleft()
-            state = self.states[state_idx]
-            
-            # Símbolos após o ponto neste estado
-            symbols = set()
-            for item in state:
-                sym = item.symbol_after_dot()
-                if sym and sym != 'ε':
-                    symbols.add(sym)
+            closure = self._closure(self.states[state_idx].kernel)
             
-            # Calcular GOTO para cada símbolo
-            for symbol in symbols:
-                goto_state = self._goto(state, symbol)
-                
-                if not goto_state.items:
-                    continue
-                
+            # Kernels de GOTO(I, X) para todos os X, numa só passada
+            for symbol, kernel in self._goto_kernels(closure).items():
                 # Verificar se estado já existe
-                if goto_state.items in self.state_index:
-                    target_idx = self.state_index[goto_state.items]
-                else:
+                target_idx = self.state_index.get(kernel)
+                if target_idx is None:
                     # Novo estado
                     target_idx = len(self.states)
-                    self.states.append(goto_state)
-                    self.state_index[goto_state.items] = target_idx
+                    self.states.append(LR0ItemSet(kernel, encoding))
+                    self.state_index[kernel] = target_idx
                     worklist.append(target_idx)
                 
                 # Registrar transição
-                self.goto_table[(state_idx, symbol)] = target_idx
+                self.goto_table[(state_idx, names[symbol])] = target_idx
         
         return self.states
     
-    def _closure(self, items: Set[LR0Item]) -> LR0ItemSet:
+    def _closure(self, kernel: Iterable[int]) -> List[int]:
         """
-        Calcula o CLOSURE de um conjunto de itens.
+        Calcula o CLOSURE de um kernel.
         
         CLOSURE(I):
         1. Adicionar todos os itens de I
@@ -204,61 +335,40 @@ class CanonicalCollection:
         3. Repetir até não haver mudanças
         
         Args:
-            items: Conjunto inicial de itens
+            kernel: Itens inteiros do kernel
             
         Returns:
-            LR0ItemSet com closure calculado
+            Itens inteiros do closure
         """
-        result = set(items)
-        worklist = deque(items)
-        added = set(items)
-        
-        while worklist:
-            item = worklist.popleft()
-            symbol = item.symbol_after_dot()
-            
-            if symbol and self.grammar.is_nonterminal(symbol):
-                # Adicionar todas as produções de symbol
-                for prod in self.grammar.get_productions_for(symbol):
-                    # Tratar produção epsilon
-                    if prod.body == ('ε',) or prod.body == (self.grammar.EPSILON,):
-                        new_item = LR0Item(prod, 1)  # Ponto após epsilon
-                    else:
-                        new_item = LR0Item(prod, 0)  # Ponto no início
-                    
-                    if new_item not in added:
-                        result.add(new_item)
-                        added.add(new_item)
-                        worklist.append(new_item)
-        
-        return LR0ItemSet(result)
-    
-    def _goto(self, state: LR0ItemSet, symbol: str) -> LR0ItemSet:
+        return self.encoding.closure(kernel)
+    
+    def _goto_kernels(self, closure: List[int]) -> Dict[int, Tuple[int, ...]]:
         """
-        Calcula GOTO(I, X) - transição do estado I com símbolo X.
+        Calcula os kernels de GOTO(I, X) para todos os símbolos X.
         
-        GOTO(I, X):
-        1. Para cada item [A -> α • X β] em I:
-           - Adicionar [A -> α X • β]
-        2. Retornar CLOSURE do resultado
+        Uma passada pelos itens de I distribui cada [A -> α • X β] já
+        avançado ([A -> α X • β], o inteiro seguinte) no balde de X.
         
         Args:
-            state: Estado atual (conjunto de itens)
-            symbol: Símbolo de transição
+            closure: Itens inteiros do estado atual
             
         Returns:
-            Novo LR0ItemSet após a transição
+            Id de X -> kernel ordenado do estado destino, na ordem em
+            que os símbolos aparecem nos itens
         """
-        moved_items = set()
+        next_symbol = self.encoding.next_symbol
+        buckets: Dict[int, List[int]] = {}
         
-        for item in state:
-            if item.symbol_after_dot() == symbol:
-                moved_items.add(item.advance())
-        
-        if not moved_items:
-            return LR0ItemSet()
+        for item in closure:
+            symbol = next_symbol[item]
+            if symbol >= 0:
+                bucket = buckets.get(symbol)
+                if bucket is None:
+                    buckets[symbol] = [item + 1]
+                else:
+                    bucket.append(item + 1)
         
-        return self._closure(moved_items)
+        return {symbol: tuple(sorted(items)) for symbol, items in buckets.items()}
     
     def get_goto(self, state_idx: int, symbol: str) -> Optional[int]:
         """Retorna índice do estado destino para GOTO(state, symbol)."""
@@ -6,18 +6,22 @@ ALGORITMO DE ANÁLISE SINTÁTICA SLR(1) - LINGUAGEM VYTHON
 Implementação do algoritmo de parsing SLR(1) usando pilha.
 
 O algoritmo usa:
-- Pilha de estados e símbolos
+- Pilhas paralelas de estados e de valores semânticos (o símbolo de cada
+  posição é o símbolo de acesso do estado, não precisa ser empilhado)
 - Tabela ACTION para decidir shift/reduce/accept
 - Tabela GOTO para transições após reduções
+- Ids inteiros dos terminais (grammar.symbols) nas consultas às tabelas
+- Sem debug, um driver rápido que lê as tabelas densas (arrays de inteiros)
 =============================================================================
 """
 
-from typing import List, Tuple, Optional, Any
+from typing import List, Tuple, Optional, Any, Callable, Iterable, Iterator, Deque
 from dataclasses import dataclass
 from enum import Enum
+from collections import deque
 
 from slr_grammar import SLRGrammar, Production
-from slr_table import SLRParsingTable, Action, ActionType
+from slr_table import SLRParsingTable, Action, ActionType, ACTION_ACCEPT
 
 
 @dataclass
@@ -41,120 +45,200 @@ class SLRParser:
     2. Repetir:
        a) Seja s o estado no topo e a o símbolo atual
        b) Se ACTION[s, a] = shift t:
-          - Empilhar a e t
+          - Empilhar t (e o valor do token)
           - Avançar entrada
        c) Se ACTION[s, a] = reduce A -> β:
-          - Desempilhar 2*|β| símbolos
+          - Desempilhar |β| estados (e |β| valores)
           - Seja s' o estado agora no topo
-          - Empilhar A e GOTO[s', A]
+          - Empilhar GOTO[s', A] (e o valor de A)
        d) Se ACTION[s, a] = accept:
           - Aceitar
        e) Senão:
           - Erro
     """
     
-    def __init__(self, grammar: SLRGrammar, table: SLRParsingTable):
+    # Formatos de ACTION lidos pelo driver rápido
+    TABLE_FORMATS = ('dense', 'compressed')
+    
+    def __init__(self, grammar: SLRGrammar, table: SLRParsingTable,
+                 table_format: str = 'dense',
+                 semantic_action: Optional[Callable[[Production, List[Any]], Any]] = None):
+        """
+        Args:
+            grammar: Gramática SLR(1)
+            table: Tabela construída (SLR, LALR ou LR(1))
+            table_format: 'dense' ou 'compressed' (ACTION do driver rápido)
+            semantic_action: Chamada em cada redução com a produção e os
+                valores dos |β| símbolos do corpo; o retorno vira o valor
+                de A na pilha de valores. Sem ela, os valores são None.
+        """
+        if table_format not in self.TABLE_FORMATS:
+            raise ValueError(f"Formato de tabela desconhecido: {table_format}")
+        
         self.grammar = grammar
         self.table = table
+        self.table_format = table_format  # 'compressed' usa table.compressed_action
+        self.semantic_action = semantic_action
         
-        # Estado do parser
-        self.stack: List[Any] = []  # Alternado: estado, símbolo, estado, ...
-        self.tokens: List[Tuple[str, str]] = []
+        # Símbolo de acesso de cada estado (o que está "sob" ele na pilha)
+        self.accessing_symbols: List[Optional[str]] = [None] * len(table.collection.states)
+        for (_, symbol), target in table.collection.goto_table.items():
+            self.accessing_symbols[target] = symbol
+        
+        # Estado do parser: pilhas paralelas, value_stack[i] é o valor do
+        # símbolo de acesso de state_stack[i] (None na base)
+        self.state_stack: List[int] = []
+        self.value_stack: List[Any] = []
+        self.result: Any = None  # Valor do símbolo inicial após aceitar
+        self.lookahead: Deque[Tuple[str, str, int]] = deque()  # Tokens já lidos
+        self.token_stream: Iterator[Tuple[str, str, int]] = iter(())
         self.position: int = 0
         
+        # Entrada como TokenBuffer (lida por índice)
+        self.buffer = None
+        self.buffer_symbols: List[str] = []       # id do tipo -> tipo do token
+        self.buffer_ids: Optional[List[int]] = None   # id do tipo -> id na gramática
+        self.buffer_tail: List[Tuple[str, str, int]] = []  # EOF/$ após o buffer
+        
         # Debug
         self.steps: List[ParseStep] = []
         self.accepted: bool = False
         self.error_message: str = None
         
-    def parse(self, tokens: List[Tuple[str, str]], debug: bool = False) -> bool:
+        # Limite de passos da análise corrente (ver parse)
+        self.step_factor: int = table.first_follow.step_factor
+        self.step_limit: int = 0
+        
+    def parse(self, tokens: Iterable[Tuple[str, str]], debug: bool = False,
+              max_steps: Optional[int] = None) -> bool:
         """
-        Analisa lista de tokens usando SLR(1).
+        Analisa tokens usando SLR(1).
+        
+        A entrada é consumida sob demanda, então um gerador como
+        Lexer.iter_tokens() pode ser passado diretamente. Um TokenBuffer
+        (Lexer.tokenize_buffer()) é lido por índice, sem criar objetos
+        por token.
+        
+        Sem debug, a análise roda no driver rápido (_parse_dense), que
+        consulta as tabelas compiladas em arrays em vez dos dicionários.
         
         Args:
-            tokens: Lista de tuplas (tipo, valor)
+            tokens: Tuplas (tipo, valor) ou objetos Token (lista ou
+                    gerador), ou um TokenBuffer
             debug: Se True, registra passos para visualização
+            max_steps: Limite fixo de passos. Sem ele, o limite cresce com
+                a entrada: (tokens lidos + 2) * first_follow.step_factor,
+                que nenhuma análise de uma gramática acíclica ultrapassa
             
         Returns:
             True se aceito, False se rejeitado
         """
         # Inicializar
-        self.tokens = self._normalize_tokens(tokens)
+        if hasattr(tokens, 'type_ids'):
+            self._bind_buffer(tokens)
+        else:
+            self.buffer = None
+            self.token_stream = self._iter_normalized(tokens)
+        self.lookahead = deque()
         self.position = 0
-        self.stack = [0]  # Estado inicial
+        self.state_stack = [0]  # Estado inicial
+        self.value_stack = [None]
+        self.result = None
         self.steps = []
         self.accepted = False
         self.error_message = None
         
+        # Limite = (tokens lidos + 2) * step_factor + step_limit
+        if max_steps is None:
+            self.step_factor = self.table.first_follow.step_factor
+            self.step_limit = 0
+        else:
+            self.step_factor = 0
+            self.step_limit = max_steps
+        
+        if not debug:
+            return self._parse_dense()
+        
+        # Daqui em diante só em debug: cada passo é registrado em self.steps
+        symbols = self.grammar.symbols
+        reduce_info = self.grammar.reduce_info
+        semantic_action = self.semantic_action
+        state_stack = self.state_stack
+        value_stack = self.value_stack
+        step_factor = self.step_factor
+        step_limit = self.step_limit
         step_number = 0
         
         while True:
             step_number += 1
             
             # Estado atual (topo da pilha)
-            current_state = self.stack[-1]
+            current_state = state_stack[-1]
             
-            # Símbolo atual da entrada
-            current_token = self._current_token()
-            token_type = current_token[0]
+            # Símbolo atual da entrada (id do terminal)
+            token_id = self._current_id()
             
             # Buscar ação
-            action = self.table.get_action(current_state, token_type)
+            action = self.table.get_action_id(current_state, token_id)
             
-            # Registrar passo se debug
-            if debug:
-                self.steps.append(ParseStep(
-                    step_number=step_number,
-                    stack=self._format_stack(),
-                    input_remaining=self._format_remaining_input(),
-                    action=str(action) if action else "ERROR"
-                ))
+            self.steps.append(ParseStep(
+                step_number=step_number,
+                stack=self._format_stack(),
+                input_remaining=self._format_remaining_input(),
+                action=str(action) if action else "ERROR"
+            ))
             
             if action is None:
                 # Erro
+                token_type = self._current_token()[0]
                 self.error_message = self._generate_error_message(current_state, token_type)
                 return False
             
             if action.action_type == ActionType.SHIFT:
-                # SHIFT: empilhar símbolo e novo estado
-                self.stack.append(token_type)
-                self.stack.append(action.value)
-                self.position += 1
+                # SHIFT: empilhar novo estado e valor do token
+                state_stack.append(action.value)
+                value_stack.append(self._current_token()[1] if semantic_action else None)
+                self._advance()
                 
             elif action.action_type == ActionType.REDUCE:
                 # REDUCE: desempilhar e aplicar GOTO
-                production = self.grammar.get_production(action.value)
-                
-                if production is None:
+                if not 0 <= action.value < len(reduce_info):
                     self.error_message = f"Produção {action.value} não encontrada"
                     return False
                 
-                # Número de símbolos no corpo da produção
-                body_length = len(production.body)
-                if production.body == ('ε',) or production.body == (self.grammar.EPSILON,):
-                    body_length = 0
+                # |β| já pré-calculado (ε conta 0) e id da cabeça
+                body_length, head_id = reduce_info[action.value]
+                
+                # Valor de A a partir dos valores do corpo
+                value = None
+                if semantic_action is not None:
+                    children = value_stack[-body_length:] if body_length else []
+                    value = semantic_action(self.grammar.production_by_number[action.value], children)
                 
-                # Desempilhar 2 * |β| elementos (símbolos e estados)
+                # Desempilhar |β| estados e valores, sem copiar a pilha
                 if body_length > 0:
-                    self.stack = self.stack[:-2 * body_length]
+                    del state_stack[-body_length:]
+                    del value_stack[-body_length:]
                 
                 # Estado após desempilhar
-                state_after_pop = self.stack[-1]
+                state_after_pop = state_stack[-1]
                 
                 # GOTO[s', A]
-                goto_state = self.table.get_goto(state_after_pop, production.head)
+                goto_state = self.table.get_goto_id(state_after_pop, head_id)
+                head = symbols.names[head_id]
                 
                 if goto_state is None:
-                    self.error_message = f"GOTO[{state_after_pop}, {production.head}] não definido"
+                    self.error_message = f"GOTO[{state_after_pop}, {head}] não definido"
                     return False
                 
-                # Empilhar não-terminal e novo estado
-                self.stack.append(production.head)
-                self.stack.append(goto_state)
+                # Empilhar novo estado e valor de A
+                state_stack.append(goto_state)
+                value_stack.append(value)
                 
             elif action.action_type == ActionType.ACCEPT:
                 # ACCEPT
                 self.accepted = True
+                self.result = value_stack[-1]
                 return True
             
             else:
@@ -163,15 +247,137 @@ class SLRParser:
                 return False
             
             # Proteção contra loop infinito
-            if step_number > 10000:
+            if step_number > (self.position + 2) * step_factor + step_limit:
                 self.error_message = "Limite de passos excedido"
                 return False
         
         return False
     
-    def _normalize_tokens(self, tokens: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    def _parse_dense(self) -> bool:
+        """
+        Driver rápido: mesmo algoritmo de parse(), sobre as tabelas densas.
+        
+        Cada passo é um índice em array('i') e comparações de inteiros,
+        sem tuplas-chave, dicionários ou objetos Action. Com
+        table_format='compressed', ACTION é lida da tabela comprimida.
+        """
+        table = self.table
+        action_table = table.action_table
+        compressed = table.compressed_action if self.table_format == 'compressed' else None
+        if compressed is not None:
+            base = compressed.base
+            values = compressed.values
+            check = compressed.check
+            defaults = compressed.defaults
+        goto_table = table.goto_table
+        reduce_lengths = table.reduce_lengths
+        reduce_heads = table.reduce_heads
+        num_terminals = table.num_terminals
+        num_nonterminals = table.num_nonterminals
+        
+        head_names = self.grammar.symbols.names[num_terminals:]
+        productions = self.grammar.production_by_number
+        semantic_action = self.semantic_action
+        state_stack = self.state_stack
+        value_stack = self.value_stack
+        
+        # Leitura direta do TokenBuffer, quando houver
+        buffer = self.buffer
+        buffer_length = len(buffer) if buffer is not None else 0
+        type_ids = buffer.type_ids if buffer is not None else None
+        id_map = self.buffer_ids
+        
+        step_factor = self.step_factor
+        step_limit = self.step_limit
+        step_number = 0
+        
+        while True:
+            step_number += 1
+            current_state = state_stack[-1]
+            
+            # Id do terminal atual
+            position = self.position
+            if position < buffer_length:
+                token_id = type_ids[position]
+                if id_map is not None:
+                    token_id = id_map[token_id]
+            else:
+                token_id = self._current_id()
+            
+            if not 0 <= token_id < num_terminals:
+                code = 0
+            elif compressed is None:
+                code = action_table[current_state * num_terminals + token_id]
+            else:
+                index = base[current_state] + token_id
+                if check[index] == current_state:
+                    code = values[index]
+                else:
+                    code = defaults[current_state]
+            
+            if code > 0:
+                # SHIFT j (código j + 1)
+                state_stack.append(code - 1)
+                value_stack.append(self._current_token()[1] if semantic_action else None)
+                if buffer is not None:
+                    self.position = position + 1
+                else:
+                    self._advance()
+                
+            elif code < ACTION_ACCEPT:
+                # REDUCE p (código -(p + 2))
+                prod_number = -code - 2
+                body_length = reduce_lengths[prod_number]
+                
+                value = None
+                if semantic_action is not None:
+                    children = value_stack[-body_length:] if body_length else []
+                    value = semantic_action(productions[prod_number], children)
+                
+                if body_length:
+                    del state_stack[-body_length:]
+                    del value_stack[-body_length:]
+                
+                state_after_pop = state_stack[-1]
+                head = reduce_heads[prod_number]
+                goto_state = goto_table[state_after_pop * num_nonterminals + head]
+                
+                if goto_state < 0:
+                    self.error_message = f"GOTO[{state_after_pop}, {head_names[head]}] não definido"
+                    return False
+                
+                state_stack.append(goto_state)
+                value_stack.append(value)
+                
+            elif code == ACTION_ACCEPT:
+                self.accepted = True
+                self.result = value_stack[-1]
+                return True
+            
+            else:
+                # Erro
+                token_type = self._current_token()[0]
+                self.error_message = self._generate_error_message(current_state, token_type)
+                return False
+            
+            # Proteção contra loop infinito
+            if step_number > (position + 2) * step_factor + step_limit:
+                self.error_message = "Limite de passos excedido"
+                return False
+    
+    def _normalize_tokens(self, tokens: Iterable[Tuple[str, str]]) -> List[Tuple[str, str, int]]:
         """Normaliza tokens e garante marcador de fim."""
-        normalized = []
+        return list(self._iter_normalized(tokens))
+    
+    def _iter_normalized(self, tokens: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, str, int]]:
+        """
+        Normaliza tokens um a um e garante marcador de fim.
+        
+        Cada token vira (tipo sem aspas, valor, id do terminal). Tipos
+        que não são terminais da gramática recebem id -1
+        (SymbolTable.NOT_FOUND); as aspas só entram nas mensagens.
+        """
+        token_id = self.grammar.symbols.token_id
         has_eof = False
         
         for token in tokens:
@@ -193,38 +399,106 @@ class SLRParser:
             if token_type == 'EOF':
                 has_eof = True
             
-            # Converter para formato da gramática (com aspas simples)
-            normalized.append((f"'{token_type}'", token_value))
+            yield (token_type, token_value, token_id(token_type))
         
         # Se não tinha EOF explícito, adicionar
         if not has_eof:
-            normalized.append(("'EOF'", "EOF"))
+            yield self._eof_token()
         
         # Adicionar marcador de fim do parser
-        normalized.append((self.grammar.END_MARKER, '$'))
+        yield self._end_token()
+    
+    def _eof_token(self) -> Tuple[str, str, int]:
+        """Token EOF (tipo, valor, id do terminal)."""
+        return ("EOF", "EOF", self.grammar.symbols.token_id("EOF"))
+    
+    def _end_token(self) -> Tuple[str, str, int]:
+        """Marcador de fim ($): (tipo, valor, id do terminal)."""
+        end_marker = self.grammar.END_MARKER
+        return (end_marker, '$', self.grammar.symbols.token_id(end_marker))
+    
+    def _bind_buffer(self, buffer):
+        """Prepara a leitura por índice de um TokenBuffer."""
+        symbols = self.grammar.symbols
+        self.buffer = buffer
+        self.buffer_symbols = list(buffer.type_names)
+        
+        # Buffer numerado com a mesma SymbolTable: ids usados diretamente
+        if buffer.symbols is symbols:
+            self.buffer_ids = None
+        else:
+            self.buffer_ids = [symbols.token_id(name) for name in buffer.type_names]
         
-        return normalized
+        has_eof = len(buffer) > 0 and buffer.type_of(len(buffer) - 1) == 'EOF'
+        self.buffer_tail = [] if has_eof else [self._eof_token()]
+        self.buffer_tail.append(self._end_token())
     
-    def _current_token(self) -> Tuple[str, str]:
+    def _buffer_token(self, index: int) -> Tuple[str, str, int]:
+        """Retorna o token `index` do TokenBuffer (seguido de EOF/$)."""
+        buffer = self.buffer
+        if index < len(buffer):
+            type_id = buffer.type_ids[index]
+            symbol_id = type_id if self.buffer_ids is None else self.buffer_ids[type_id]
+            return (self.buffer_symbols[type_id], buffer.value_of(index), symbol_id)
+        
+        index -= len(buffer)
+        if index < len(self.buffer_tail):
+            return self.buffer_tail[index]
+        return self._end_token()
+    
+    def _peek(self, count: int) -> Deque[Tuple[str, str, int]]:
+        """Garante até `count` tokens lidos à frente e os retorna."""
+        if self.buffer is not None:
+            total = len(self.buffer) + len(self.buffer_tail)
+            end = min(self.position + count, total)
+            return deque(self._buffer_token(i) for i in range(self.position, end))
+        
+        while len(self.lookahead) < count:
+            token = next(self.token_stream, None)
+            if token is None:
+                break
+            self.lookahead.append(token)
+        return self.lookahead
+    
+    def _current_token(self) -> Tuple[str, str, int]:
         """Retorna token atual."""
-        if self.position < len(self.tokens):
-            return self.tokens[self.position]
-        return (self.grammar.END_MARKER, '$')
+        if self.buffer is not None:
+            return self._buffer_token(self.position)
+        if self.lookahead or self._peek(1):
+            return self.lookahead[0]
+        return self._end_token()
+    
+    def _current_id(self) -> int:
+        """Retorna o id (em grammar.symbols) do terminal atual."""
+        buffer = self.buffer
+        if buffer is not None and self.position < len(buffer):
+            type_id = buffer.type_ids[self.position]
+            return type_id if self.buffer_ids is None else self.buffer_ids[type_id]
+        return self._current_token()[2]
+    
+    def _advance(self):
+        """Consome o token atual."""
+        if self.buffer is not None:
+            self.position += 1
+            return
+        if self.lookahead or self._peek(1):
+            self.lookahead.popleft()
+        self.position += 1
     
     def _format_stack(self) -> str:
-        """Formata pilha para exibição."""
+        """Formata pilha para exibição (estado, símbolo, estado, ...)."""
         parts = []
-        for i, item in enumerate(self.stack):
-            if isinstance(item, int):
-                parts.append(str(item))
-            else:
-                # Símbolo - mostrar de forma compacta
+        for i, state in enumerate(self.state_stack):
+            if i > 0:
+                # Símbolo de acesso do estado - mostrar de forma compacta
+                item = self.accessing_symbols[state]
                 if item.startswith('<'):
                     parts.append(item[1:-1][:10])
                 elif item.startswith("'"):
                     parts.append(item[1:-1])
                 else:
                     parts.append(str(item)[:10])
+            parts.append(str(state))
         
         result = ' '.join(parts)
         if len(result) > 50:
@@ -233,16 +507,13 @@ class SLRParser:
     
     def _format_remaining_input(self) -> str:
         """Formata entrada restante."""
+        upcoming = self._peek(6)
         remaining = []
-        for i in range(self.position, min(self.position + 5, len(self.tokens))):
-            token = self.tokens[i]
-            if token[0].startswith("'"):
-                remaining.append(token[0][1:-1])
-            else:
-                remaining.append(token[0])
+        for i in range(min(5, len(upcoming))):
+            remaining.append(upcoming[i][0])
         
         result = ' '.join(remaining)
-        if self.position + 5 < len(self.tokens):
+        if len(upcoming) > 5:
             result += " ..."
         return result
     
@@ -257,10 +528,8 @@ class SLRParser:
                 else:
                     expected.append(sym)
         
-        symbol_display = symbol[1:-1] if symbol.startswith("'") else symbol
-        
         msg = f"Erro sintático no estado {state}\n"
-        msg += f"  Token encontrado: '{symbol_display}'\n"
+        msg += f"  Token encontrado: '{symbol}'\n"
         
         if expected:
             expected_str = ", ".join(sorted(expected)[:10])
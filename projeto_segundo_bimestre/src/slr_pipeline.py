@@ -31,6 +31,7 @@ from slr_grammar import SLRGrammar, SLRFirstFollow
 from slr_items import CanonicalCollection
 from slr_table import SLRParsingTable
 from slr_parser import SLRParser
+from table_cache import load_slr_tables
 
 
 def find_grammar_file():
@@ -53,14 +54,19 @@ def find_grammar_file():
     return None
 
 
-def run_slr_pipeline(grammar_file: str, test_code: str = None, verbose: bool = True):
+def run_slr_pipeline(grammar_file: str, test_code: str = None, verbose: bool = True,
+                     use_cache: bool = True):
     """
     Executa pipeline completo do parser SLR(1).
     
+    As fases 1 a 4 vêm do cache em disco (table_cache) quando a gramática
+    não mudou desde a última execução.
+    
     Args:
         grammar_file: Caminho para arquivo BNF
         test_code: Código Vython para testar (opcional)
         verbose: Se True, imprime detalhes
+        use_cache: Se False, reconstrói tudo sem usar o cache
         
     Returns:
         dict com resultados
@@ -87,10 +93,9 @@ def run_slr_pipeline(grammar_file: str, test_code: str = None, verbose: bool = T
     print("FASE 1: ADAPTAÇÃO DA GRAMÁTICA PARA SLR(1)")
     print("─" * 80)
     
-    grammar = SLRGrammar()
-    
     try:
-        grammar.load_from_file(grammar_file)
+        grammar, ff, collection, table = load_slr_tables(grammar_file, use_cache=use_cache,
+                                                         verbose=verbose)
         results['grammar_loaded'] = True
         
         print(f"✅ Gramática carregada: {grammar_file}")
@@ -125,8 +130,6 @@ def run_slr_pipeline(grammar_file: str, test_code: str = None, verbose: bool = T
     print("FASE 2: CÁLCULO DE FIRST E FOLLOW")
     print("─" * 80)
     
-    ff = SLRFirstFollow(grammar)
-    ff.compute()
     results['first_follow_computed'] = True
     
     print(f"✅ FIRST calculado para {len(ff.first)} símbolos")
@@ -156,8 +159,6 @@ def run_slr_pipeline(grammar_file: str, test_code: str = None, verbose: bool = T
     print("FASE 3: CONSTRUÇÃO DA COLEÇÃO DE ITENS LR(0)")
     print("─" * 80)
     
-    collection = CanonicalCollection(grammar)
-    collection.build()
     results['items_built'] = True
     
     print(f"✅ Coleção canônica construída")
@@ -181,8 +182,7 @@ def run_slr_pipeline(grammar_file: str, test_code: str = None, verbose: bool = T
     print("FASE 4: CONSTRUÇÃO DA TABELA DE PARSING SLR(1)")
     print("─" * 80)
     
-    table = SLRParsingTable(grammar, collection, ff)
-    is_slr1 = table.build()
+    is_slr1 = table.is_slr1()
     results['table_built'] = True
     results['is_slr1'] = is_slr1
     
@@ -414,18 +414,8 @@ z = x + y;
     if results['grammar_loaded']:
         print("\nSalvando arquivos de saída...")
         
-        # Recriar objetos para salvar
-        grammar = SLRGrammar()
-        grammar.load_from_file(grammar_file)
-        
-        ff = SLRFirstFollow(grammar)
-        ff.compute()
-        
-        collection = CanonicalCollection(grammar)
-        collection.build()
-        
-        table = SLRParsingTable(grammar, collection, ff)
-        table.build()
+        # Recarregar objetos para salvar (do cache)
+        grammar, ff, collection, table = load_slr_tables(grammar_file)
         
         save_outputs(grammar, ff, collection, table, output_dir=".")
     
@@ -9,9 +9,26 @@ de itens LR(0) e dos conjuntos FOLLOW.
 A tabela possui duas partes:
 1. ACTION[estado, terminal] -> shift/reduce/accept/error
 2. GOTO[estado, não-terminal] -> próximo estado
+
+Além dos dicionários, a tabela é compilada em arrays densos de inteiros
+(estados × terminais e estados × não-terminais), usados pelo driver
+rápido do SLRParser. Codificação de cada célula de ACTION:
+- 0        -> erro (célula vazia)
+- j + 1    -> shift j
+- -(p + 2) -> reduce pela produção p
+- -1       -> accept
+
+A tabela ACTION também pode ser comprimida por deslocamento de linhas
+(CompressedActionTable), com consulta O(1).
+
+Conflitos shift-reduce entre terminal e produção com precedência
+declarada na gramática (%left/%right/%nonassoc) são resolvidos como no
+yacc e ficam em resolved_conflicts; os demais ficam em conflicts,
+indexados pela célula (estado, terminal).
 =============================================================================
 """
 
+from array import array
 from typing import Dict, List, Set, Tuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
@@ -61,6 +78,125 @@ class Action:
         return hash((self.action_type, self.value))
 
 
+# -----------------------------------------------------------------------------
+# CODIFICAÇÃO DAS AÇÕES NA TABELA DENSA
+# -----------------------------------------------------------------------------
+ACTION_ERROR = 0
+ACTION_ACCEPT = -1
+GOTO_ERROR = -1
+
+
+def encode_action(action: Optional[Action]) -> int:
+    """Converte uma Action no inteiro gravado na tabela densa."""
+    if action is None or action.action_type == ActionType.ERROR:
+        return ACTION_ERROR
+    if action.action_type == ActionType.SHIFT:
+        return action.value + 1
+    if action.action_type == ActionType.REDUCE:
+        return -(action.value + 2)
+    return ACTION_ACCEPT
+
+
+def decode_action(code: int) -> Optional[Action]:
+    """Converte um inteiro da tabela densa de volta em Action."""
+    if code == ACTION_ERROR:
+        return None
+    if code > 0:
+        return Action(ActionType.SHIFT, code - 1)
+    if code == ACTION_ACCEPT:
+        return Action(ActionType.ACCEPT)
+    return Action(ActionType.REDUCE, -code - 2)
+
+
+class CompressedActionTable:
+    """
+    Tabela ACTION comprimida por deslocamento de linhas (comb-vector).
+    
+    Cada estado recebe uma redução padrão (a redução mais frequente da
+    linha); as células iguais a ela deixam de ser guardadas. As demais
+    células de todas as linhas são sobrepostas em um único vetor:
+    a linha do estado s começa em base[s], e check[i] registra a qual
+    estado pertence a posição i.
+    
+    Consulta de ACTION[s, a]:
+        i = base[s] + a
+        check[i] == s  ->  values[i]
+        senão          ->  defaults[s]  (0 = erro)
+    
+    Com reduções padrão, um erro pode ser detectado só depois de algumas
+    reduções (nunca depois de um shift): a entrada aceita é a mesma, mas
+    o estado do erro pode ser outro.
+    
+    Attributes:
+        base: Deslocamento da linha de cada estado
+        values: Ações codificadas (mesma codificação da tabela densa)
+        check: Estado dono de cada posição de values (-1 = livre)
+        defaults: Redução padrão codificada de cada estado (0 = nenhuma)
+    """
+    
+    def __init__(self, action_table: array, num_states: int, num_terminals: int):
+        self.num_states = num_states
+        self.num_terminals = num_terminals
+        self.base = array('i', [0]) * num_states
+        self.defaults = array('i', [ACTION_ERROR]) * num_states
+        self.values = array('i')
+        self.check = array('i')
+        
+        # Linhas esparsas: só células diferentes da redução padrão
+        rows: List[Dict[int, int]] = []
+        for state in range(num_states):
+            offset = state * num_terminals
+            row = {t: action_table[offset + t] for t in range(num_terminals)
+                   if action_table[offset + t] != ACTION_ERROR}
+            
+            reduces = [code for code in row.values() if code < ACTION_ACCEPT]
+            if reduces:
+                default = max(set(reduces), key=lambda code: (reduces.count(code), -code))
+                self.defaults[state] = default
+                row = {t: code for t, code in row.items() if code != default}
+            rows.append(row)
+        
+        # Linhas mais cheias primeiro: primeiro encaixe (first-fit)
+        order = sorted(range(num_states), key=lambda s: (-len(rows[s]), s))
+        used: List[int] = []  # Dono de cada posição (-1 = livre)
+        for state in order:
+            columns = sorted(rows[state])
+            if not columns:
+                continue
+            
+            base = 0
+            while any(base + t < len(used) and used[base + t] >= 0 for t in columns):
+                base += 1
+            
+            needed = base + columns[-1] + 1
+            if needed > len(used):
+                used.extend([-1] * (needed - len(used)))
+            for t in columns:
+                used[base + t] = state
+            self.base[state] = base
+        
+        # Espaço extra para que base[s] + a nunca saia do vetor
+        size = max(self.base, default=0) + num_terminals
+        self.check = array('i', used + [-1] * (size - len(used)))
+        self.values = array('i', [ACTION_ERROR]) * size
+        for state in range(num_states):
+            for t, code in rows[state].items():
+                self.values[self.base[state] + t] = code
+    
+    def lookup(self, state: int, terminal_id: int) -> int:
+        """Retorna a ação codificada de ACTION[state, terminal_id]."""
+        if not 0 <= terminal_id < self.num_terminals:
+            return ACTION_ERROR
+        index = self.base[state] + terminal_id
+        if self.check[index] == state:
+            return self.values[index]
+        return self.defaults[state]
+    
+    def size(self) -> int:
+        """Total de inteiros armazenados (base, values, check e defaults)."""
+        return len(self.base) + len(self.values) + len(self.check) + len(self.defaults)
+
+
 @dataclass
 class SLRConflict:
     """Representa um conflito na tabela SLR."""
@@ -68,10 +204,16 @@ class SLRConflict:
     symbol: str
     actions: List[Action]
     conflict_type: str  # "shift-reduce" ou "reduce-reduce"
+    resolution: Optional[str] = None  # Como a precedência resolveu, se resolveu
     
     def __repr__(self):
         actions_str = ', '.join(str(a) for a in self.actions)
         return f"Conflito {self.conflict_type} no estado {self.state}, símbolo '{self.symbol}': [{actions_str}]"
+    
+    def productions(self) -> Tuple[int, ...]:
+        """Números das produções reduzidas no conflito, ordenados."""
+        return tuple(sorted({a.value for a in self.actions
+                             if a.action_type == ActionType.REDUCE}))
 
 
 class SLRParsingTable:
@@ -92,6 +234,9 @@ class SLRParsingTable:
           GOTO[i, A] = j
     """
     
+    # Nome do método nos relatórios (subclasses trocam, ex.: LALR(1))
+    KIND = "SLR(1)"
+    
     def __init__(self, grammar: SLRGrammar, collection: CanonicalCollection, 
                  first_follow: SLRFirstFollow):
         self.grammar = grammar
@@ -102,8 +247,24 @@ class SLRParsingTable:
         self.action: Dict[Tuple[int, str], Action] = {}
         self.goto: Dict[Tuple[int, str], int] = {}
         
+        # Mesmas tabelas indexadas pelos ids de grammar.symbols
+        self.action_ids: Dict[Tuple[int, int], Action] = {}
+        self.goto_ids: Dict[Tuple[int, int], int] = {}
+        
+        # Forma compilada: arrays densos linha a linha (ver _compile_dense_tables)
+        self.num_terminals: int = 0
+        self.num_nonterminals: int = 0
+        self.action_table = array('i')    # [estado * num_terminals + id do terminal]
+        self.goto_table = array('i')      # [estado * num_nonterminals + coluna do não-terminal]
+        self.reduce_lengths = array('i')  # |β| de cada produção (ε conta 0)
+        self.reduce_heads = array('i')    # Coluna GOTO da cabeça de cada produção
+        self.compressed_action: Optional[CompressedActionTable] = None
+        
         # Conflitos
         self.conflicts: List[SLRConflict] = []
+        self.conflict_index: Dict[Tuple[int, str], SLRConflict] = {}  # Célula -> conflito
+        self.resolved_conflicts: List[SLRConflict] = []  # Resolvidos por precedência
+        self.error_cells: Set[Tuple[int, str]] = set()   # Células de erro por %nonassoc
         
         # Estatísticas
         self.shift_count = 0
@@ -124,6 +285,12 @@ class SLRParsingTable:
         # Construir tabela GOTO
         self._build_goto_table()
         
+        # Indexar pelos ids dos símbolos
+        self._build_id_tables()
+        
+        # Compilar em arrays densos
+        self._compile_dense_tables()
+        
         return len(self.conflicts) == 0
     
     def _process_state(self, state_idx: int, state: LR0ItemSet):
@@ -142,9 +309,7 @@ class SLRParsingTable:
                                    Action(ActionType.ACCEPT))
                 else:
                     # Redução: ACTION[i, a] = reduce para a ∈ FOLLOW(A)
-                    follow_set = self.first_follow.get_follow(prod.head)
-                    
-                    for terminal in follow_set:
+                    for terminal in self._reduce_lookaheads(state_idx, prod):
                         self._add_action(state_idx, terminal,
                                        Action(ActionType.REDUCE, prod.number))
             
@@ -156,46 +321,155 @@ class SLRParsingTable:
                     self._add_action(state_idx, symbol_after_dot,
                                    Action(ActionType.SHIFT, target))
     
+    def _reduce_lookaheads(self, state_idx: int, prod: Production) -> Set[str]:
+        """Terminais que disparam a redução por prod no estado (FOLLOW da cabeça)."""
+        return self.first_follow.get_follow(prod.head)
+    
     def _add_action(self, state: int, symbol: str, action: Action):
         """
         Adiciona ação à tabela, detectando conflitos.
+        
+        Shift-reduce com precedência declarada é resolvido na hora;
+        os demais conflitos são agregados por célula. Uma ação nova numa
+        célula já anulada por %nonassoc também é conflito.
         """
         key = (state, symbol)
         
+        if key in self.error_cells:
+            self._add_error_cell_action(key, action)
+            return
+        
         if key in self.action:
             existing = self.action[key]
             
-            if existing != action:
-                # Conflito detectado
-                conflict_type = self._get_conflict_type(existing, action)
-                
-                # Verificar se conflito já foi registrado
-                existing_conflict = None
-                for c in self.conflicts:
-                    if c.state == state and c.symbol == symbol:
-                        existing_conflict = c
-                        break
-                
-                if existing_conflict:
-                    if action not in existing_conflict.actions:
-                        existing_conflict.actions.append(action)
+            if existing == action:
+                return
+            
+            # Conflito detectado
+            conflict_type = self._get_conflict_type(existing, action)
+            
+            # Conflito já registrado na célula
+            existing_conflict = self.conflict_index.get(key)
+            if existing_conflict:
+                if action not in existing_conflict.actions:
+                    existing_conflict.actions.append(action)
+                return
+            
+            resolved = self._resolve_by_precedence(symbol, existing, action)
+            if resolved is not None:
+                winner, resolution = resolved
+                self.resolved_conflicts.append(SLRConflict(
+                    state=state,
+                    symbol=symbol,
+                    actions=[existing, action],
+                    conflict_type=conflict_type,
+                    resolution=resolution
+                ))
+                self._count_action(existing, -1)
+                if winner is None:
+                    del self.action[key]
+                    self.error_cells.add(key)
                 else:
-                    self.conflicts.append(SLRConflict(
-                        state=state,
-                        symbol=symbol,
-                        actions=[existing, action],
-                        conflict_type=conflict_type
-                    ))
+                    self.action[key] = winner
+                    self._count_action(winner, 1)
+                return
+            
+            conflict = SLRConflict(
+                state=state,
+                symbol=symbol,
+                actions=[existing, action],
+                conflict_type=conflict_type
+            )
+            self.conflicts.append(conflict)
+            self.conflict_index[key] = conflict
         else:
             self.action[key] = action
-            
-            # Estatísticas
+            self._count_action(action, 1)
+    
+    def _add_error_cell_action(self, key: Tuple[int, str], action: Action):
+        """Registra como conflito uma ação extra numa célula de erro %nonassoc."""
+        existing_conflict = self.conflict_index.get(key)
+        if existing_conflict:
+            if action not in existing_conflict.actions:
+                existing_conflict.actions.append(action)
+            return
+        
+        resolved = next(c for c in reversed(self.resolved_conflicts)
+                        if (c.state, c.symbol) == key)
+        if action in resolved.actions:
+            return
+        
+        reduce = next(a for a in resolved.actions if a.action_type == ActionType.REDUCE)
+        conflict = SLRConflict(
+            state=key[0],
+            symbol=key[1],
+            actions=resolved.actions + [action],
+            conflict_type=self._get_conflict_type(reduce, action)
+        )
+        self.conflicts.append(conflict)
+        self.conflict_index[key] = conflict
+    
+    def _count_action(self, action: Action, delta: int):
+        """Atualiza as estatísticas de ações."""
+        if action.action_type == ActionType.SHIFT:
+            self.shift_count += delta
+        elif action.action_type == ActionType.REDUCE:
+            self.reduce_count += delta
+        elif action.action_type == ActionType.ACCEPT:
+            self.accept_count += delta
+    
+    def _resolve_by_precedence(self, symbol: str, action1: Action,
+                               action2: Action) -> Optional[Tuple[Optional[Action], str]]:
+        """
+        Resolve um conflito shift-reduce pelas precedências declaradas.
+        
+        - Produção com precedência maior que o terminal: reduce
+        - Menor: shift
+        - Igual: %left reduz, %right empilha, %nonassoc vira erro
+        
+        Returns:
+            (ação vencedora ou None para erro, descrição), ou None se o
+            conflito não puder ser resolvido por precedência
+        """
+        shift = reduce = None
+        for action in (action1, action2):
             if action.action_type == ActionType.SHIFT:
-                self.shift_count += 1
+                shift = action
             elif action.action_type == ActionType.REDUCE:
-                self.reduce_count += 1
-            elif action.action_type == ActionType.ACCEPT:
-                self.accept_count += 1
+                reduce = action
+        if shift is None or reduce is None:
+            return None
+        
+        token_precedence = self.grammar.precedence.get(symbol)
+        production_precedence = self.grammar.production_precedence[reduce.value]
+        if token_precedence is None or production_precedence is None:
+            return None
+        
+        token_level, associativity = token_precedence
+        production_level = production_precedence[0]
+        
+        if production_level > token_level:
+            return reduce, "reduce (precedência maior)"
+        if production_level < token_level:
+            return shift, "shift (precedência maior)"
+        if associativity == 'left':
+            return reduce, "reduce (%left)"
+        if associativity == 'right':
+            return shift, "shift (%right)"
+        return None, "erro (%nonassoc)"
+    
+    def conflicts_by_productions(self) -> Dict[Tuple[str, Tuple[int, ...]], List[SLRConflict]]:
+        """
+        Agrupa os conflitos pelas produções envolvidas.
+        
+        Returns:
+            (tipo, números das produções reduzidas) -> conflitos
+        """
+        groups: Dict[Tuple[str, Tuple[int, ...]], List[SLRConflict]] = {}
+        for conflict in self.conflicts:
+            key = (conflict.conflict_type, conflict.productions())
+            groups.setdefault(key, []).append(conflict)
+        return groups
     
     def _get_conflict_type(self, action1: Action, action2: Action) -> str:
         """Determina o tipo de conflito."""
@@ -214,6 +488,62 @@ class SLRParsingTable:
             if self.grammar.is_nonterminal(symbol):
                 self.goto[(state_idx, symbol)] = target
     
+    def _build_id_tables(self):
+        """Reindexa ACTION e GOTO por (estado, id do símbolo)."""
+        ids = self.grammar.symbols.ids
+        self.action_ids = {(state, ids[symbol]): action
+                           for (state, symbol), action in self.action.items()}
+        self.goto_ids = {(state, ids[symbol]): target
+                         for (state, symbol), target in self.goto.items()}
+    
+    def _compile_dense_tables(self):
+        """
+        Gera ACTION e GOTO como matrizes densas de inteiros.
+        
+        Colunas de ACTION são os ids dos terminais; colunas de GOTO são
+        os ids dos não-terminais menos num_terminals.
+        """
+        symbols = self.grammar.symbols
+        num_states = len(self.collection.states)
+        num_terminals = symbols.num_terminals
+        num_nonterminals = len(symbols) - num_terminals
+        
+        action_table = array('i', [ACTION_ERROR]) * (num_states * num_terminals)
+        for (state, symbol_id), action in self.action_ids.items():
+            action_table[state * num_terminals + symbol_id] = encode_action(action)
+        
+        goto_table = array('i', [GOTO_ERROR]) * (num_states * num_nonterminals)
+        for (state, symbol_id), target in self.goto_ids.items():
+            goto_table[state * num_nonterminals + symbol_id - num_terminals] = target
+        
+        # Informações de redução por número de produção (coluna GOTO da cabeça)
+        reduce_lengths = array('i', self.grammar.reduce_lengths)
+        reduce_heads = array('i', [head - num_terminals for head in self.grammar.reduce_heads])
+        
+        self.num_terminals = num_terminals
+        self.num_nonterminals = num_nonterminals
+        self.action_table = action_table
+        self.goto_table = goto_table
+        self.reduce_lengths = reduce_lengths
+        self.reduce_heads = reduce_heads
+        
+        # Versão comprimida de ACTION
+        self.compressed_action = CompressedActionTable(action_table, num_states, num_terminals)
+    
+    def get_action_code(self, state: int, symbol_id: int) -> int:
+        """Retorna a ação codificada da tabela densa (0 = erro)."""
+        if 0 <= symbol_id < self.num_terminals:
+            return self.action_table[state * self.num_terminals + symbol_id]
+        return ACTION_ERROR
+    
+    def get_action_id(self, state: int, symbol_id: int) -> Optional[Action]:
+        """Retorna ação para (estado, id do terminal)."""
+        return self.action_ids.get((state, symbol_id))
+    
+    def get_goto_id(self, state: int, symbol_id: int) -> Optional[int]:
+        """Retorna próximo estado para GOTO(estado, id do não-terminal)."""
+        return self.goto_ids.get((state, symbol_id))
+    
     def get_action(self, state: int, terminal: str) -> Optional[Action]:
         """Retorna ação para (estado, terminal)."""
         return self.action.get((state, terminal))
@@ -229,7 +559,7 @@ class SLRParsingTable:
     def print_table(self, max_states: int = None):
         """Imprime a tabela de parsing."""
         print("\n" + "=" * 100)
-        print("TABELA DE PARSING SLR(1)")
+        print(f"TABELA DE PARSING {self.KIND}")
         print("=" * 100)
         
         # Coletar terminais e não-terminais usados
@@ -297,7 +627,7 @@ class SLRParsingTable:
     def print_conflicts(self):
         """Imprime conflitos detectados."""
         if not self.conflicts:
-            print("\n✅ Nenhum conflito detectado! Gramática é SLR(1).")
+            print(f"\n✅ Nenhum conflito detectado! Gramática é {self.KIND}.")
             return
         
         print("\n" + "=" * 70)
@@ -313,14 +643,25 @@ class SLRParsingTable:
                 if action.action_type == ActionType.SHIFT:
                     print(f"    - SHIFT para estado {action.value}")
                 elif action.action_type == ActionType.REDUCE:
-                    prod = self.grammar.get_production(action.value)
+                    prod = self.grammar.production_by_number[action.value]
                     print(f"    - REDUCE pela produção {action.value}: {prod}")
         
+        # Resumo por produções envolvidas
+        print("\n" + "-" * 70)
+        print("RESUMO POR PRODUÇÕES")
+        print("-" * 70)
+        groups = self.conflicts_by_productions()
+        for (conflict_type, numbers), group in sorted(groups.items(), key=lambda g: -len(g[1])):
+            symbols = ', '.join(sorted({c.symbol for c in group}))
+            print(f"\n{conflict_type.upper()}: {len(group)} célula(s), símbolos {symbols}")
+            for number in numbers:
+                print(f"    {self.grammar.production_by_number[number]}")
+        
         print("\n" + "=" * 70)
     
     def print_statistics(self):
         """Imprime estatísticas da tabela."""
-        print(f"\nEstatísticas da Tabela SLR(1):")
+        print(f"\nEstatísticas da Tabela {self.KIND}:")
         print(f"  - Estados: {len(self.collection.states)}")
         print(f"  - Entradas ACTION: {len(self.action)}")
         print(f"  - Entradas GOTO: {len(self.goto)}")
@@ -328,7 +669,17 @@ class SLRParsingTable:
         print(f"  - Reduces: {self.reduce_count}")
         print(f"  - Accepts: {self.accept_count}")
         print(f"  - Conflitos: {len(self.conflicts)}")
-        print(f"  - É SLR(1)? {'SIM ✅' if self.is_slr1() else 'NÃO ❌'}")
+        if self.resolved_conflicts:
+            print(f"  - Resolvidos por precedência: {len(self.resolved_conflicts)}")
+        print(f"  - É {self.KIND}? {'SIM ✅' if self.is_slr1() else 'NÃO ❌'}")
+        
+        if self.compressed_action is not None:
+            dense_size = len(self.action_table)
+            compressed_size = self.compressed_action.size()
+            ratio = compressed_size / dense_size if dense_size else 0.0
+            print(f"  - ACTION densa: {dense_size} células")
+            print(f"  - ACTION comprimida: {compressed_size} células "
+                  f"({ratio:.1%} da densa, {1 / ratio if ratio else 0:.1f}x menor)")
     
     def save_to_csv(self, filename: str):
         """Salva tabela em formato CSV."""
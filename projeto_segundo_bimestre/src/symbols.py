@@ -0,0 +1,103 @@
+"""
+=============================================================================
+TABELA DE SÍMBOLOS DA GRAMÁTICA - LINGUAGEM VYTHON
+=============================================================================
+
+Numeração densa (0, 1, 2, ...) de todos os terminais e não-terminais de
+uma gramática. Lexer, gramática e tabelas de parsing usam os mesmos ids,
+então o parser compara e busca inteiros em vez de strings.
+
+Convenção:
+- Terminais recebem os primeiros ids (0 .. num_terminals - 1)
+- Não-terminais vêm em seguida
+- Tipos de token do lexer (sem aspas, ex.: IDENTIFIER, +) são aceitos
+  como apelidos dos terminais da gramática (com aspas, ex.: 'IDENTIFIER')
+=============================================================================
+"""
+
+from typing import Dict, Iterable, List
+
+
+class SymbolTable:
+    """
+    Mapeia símbolos da gramática para inteiros pequenos e densos.
+    
+    Attributes:
+        names: Nome do símbolo para cada id
+        ids: Id de cada nome de símbolo
+        num_terminals: Quantidade de terminais (ids abaixo deste valor)
+        token_ids: Id do terminal para cada tipo de token (com ou sem aspas)
+        token_names: Tipo de token (sem aspas) para cada id
+    """
+    
+    NOT_FOUND = -1
+    
+    def __init__(self, terminals: Iterable[str], nonterminals: Iterable[str]):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        
+        for terminal in sorted(terminals):
+            self._add(terminal)
+        self.num_terminals = len(self.names)
+        
+        for nonterminal in sorted(nonterminals):
+            if nonterminal not in self.ids:
+                self._add(nonterminal)
+        
+        # Apelidos de tipos de token: nomes exatos têm prioridade
+        self.token_ids: Dict[str, int] = {}
+        self.token_names: List[str] = []
+        for symbol_id, name in enumerate(self.names):
+            if symbol_id < self.num_terminals:
+                self.token_ids[name] = symbol_id
+            self.token_names.append(self._strip_quotes(name))
+        
+        for symbol_id in range(self.num_terminals):
+            name = self.names[symbol_id]
+            if self._is_quoted(name):
+                self.token_ids.setdefault(name[1:-1], symbol_id)
+            else:
+                self.token_ids.setdefault(f"'{name}'", symbol_id)
+    
+    def _add(self, name: str):
+        """Registra um novo símbolo."""
+        self.ids[name] = len(self.names)
+        self.names.append(name)
+    
+    @staticmethod
+    def _is_quoted(name: str) -> bool:
+        return len(name) >= 2 and name.startswith("'") and name.endswith("'")
+    
+    def _strip_quotes(self, name: str) -> str:
+        return name[1:-1] if self._is_quoted(name) else name
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+    
+    def id_of(self, name: str) -> int:
+        """Retorna o id de um símbolo da gramática (ou NOT_FOUND)."""
+        return self.ids.get(name, self.NOT_FOUND)
+    
+    def name_of(self, symbol_id: int) -> str:
+        """Retorna o nome de um símbolo pelo id."""
+        return self.names[symbol_id]
+    
+    def token_id(self, token_type: str) -> int:
+        """
+        Retorna o id do terminal para um tipo de token do lexer.
+        
+        Aceita o tipo com ou sem aspas ('+' ou +). Tipos que não são
+        terminais da gramática retornam NOT_FOUND.
+        """
+        return self.token_ids.get(token_type, self.NOT_FOUND)
+    
+    def is_terminal(self, symbol_id: int) -> bool:
+        """Verifica se o id corresponde a um terminal."""
+        return 0 <= symbol_id < self.num_terminals
+    
+    def is_nonterminal(self, symbol_id: int) -> bool:
+        """Verifica se o id corresponde a um não-terminal."""
+        return self.num_terminals <= symbol_id < len(self.names)
@@ -0,0 +1,211 @@
+"""
+=============================================================================
+CACHE DAS TABELAS DE PARSING - LINGUAGEM VYTHON
+=============================================================================
+
+Guarda em disco as tabelas já construídas (SLR(1) e LL(1)), junto com a
+gramática numerada e os conjuntos FIRST/FOLLOW, para que execuções curtas
+não precisem refazer todo o pipeline a cada chamada.
+
+Funcionamento:
+- O arquivo de cache é nomeado pelo SHA-256 do texto da gramática
+  (ex.: slr-3fa2...c9.cache)
+- O conteúdo é um pickle versionado: CACHE_VERSION e uma impressão
+  digital do código dos construtores (grammar, first_follow, tabelas)
+- Se a gramática ou o código mudarem, o cache é ignorado e as tabelas
+  são reconstruídas e gravadas novamente
+=============================================================================
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from typing import Optional, Tuple
+
+from grammar import Grammar
+from first_follow import FirstFollow
+from parsing_table import ParsingTable
+from slr_grammar import SLRGrammar, SLRFirstFollow
+from slr_items import CanonicalCollection
+from slr_table import SLRParsingTable
+
+
+# Versão do formato do arquivo; incrementar ao mudar o conteúdo salvo
+CACHE_VERSION = 1
+
+# Diretório padrão, ao lado do arquivo da gramática
+CACHE_DIR_NAME = '.table_cache'
+
+# Módulos cujo código define as estruturas salvas
+BUILDER_MODULES = ('symbols', 'terminal_sets', 'grammar', 'first_follow',
+                   'parsing_table', 'slr_grammar', 'slr_items', 'slr_table')
+
+
+# =============================================================================
+# CHAVES DO CACHE
+# =============================================================================
+
+def grammar_hash(grammar_file: str) -> str:
+    """Retorna o SHA-256 (hex) do conteúdo do arquivo de gramática."""
+    with open(grammar_file, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def builder_fingerprint() -> str:
+    """
+    Retorna o SHA-256 do código dos módulos construtores.
+    
+    Mudanças no código que monta as tabelas invalidam o cache mesmo
+    que CACHE_VERSION não tenha sido incrementada.
+    """
+    digest = hashlib.sha256()
+    for name in BUILDER_MODULES:
+        module = sys.modules.get(name)
+        path = getattr(module, '__file__', None)
+        if path and os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def cache_path(grammar_file: str, kind: str, cache_dir: Optional[str] = None) -> str:
+    """Caminho do arquivo de cache para a gramática e o tipo de tabela."""
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(grammar_file)),
+                                 CACHE_DIR_NAME)
+    return os.path.join(cache_dir, f"{kind}-{grammar_hash(grammar_file)}.cache")
+
+
+# =============================================================================
+# LEITURA E ESCRITA
+# =============================================================================
+
+def _read_cache(path: str, kind: str):
+    """Lê o cache; retorna None se ausente, inválido ou de outra versão."""
+    try:
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ImportError, IndexError, TypeError, ValueError):
+        return None
+    
+    if not isinstance(payload, dict):
+        return None
+    if payload.get('version') != CACHE_VERSION or payload.get('kind') != kind:
+        return None
+    if payload.get('builder') != builder_fingerprint():
+        return None
+    return payload.get('objects')
+
+
+def _write_cache(path: str, kind: str, objects: tuple):
+    """Grava o cache de forma atômica (arquivo temporário + rename)."""
+    payload = {
+        'version': CACHE_VERSION,
+        'kind': kind,
+        'builder': builder_fingerprint(),
+        'objects': objects,
+    }
+    
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError as e:
+        # Sem permissão de escrita: segue sem cache
+        print(f"[CACHE] Não foi possível gravar {path}: {e}")
+
+
+# =============================================================================
+# CONSTRUÇÃO COM CACHE
+# =============================================================================
+
+def _build_slr(grammar_file: str) -> Tuple[SLRGrammar, SLRFirstFollow,
+                                             CanonicalCollection, SLRParsingTable]:
+    """Executa o pipeline SLR(1) completo."""
+    grammar = SLRGrammar()
+    grammar.load_from_file(grammar_file)
+    
+    ff = SLRFirstFollow(grammar)
+    ff.compute()
+    
+    collection = CanonicalCollection(grammar)
+    collection.build()
+    
+    table = SLRParsingTable(grammar, collection, ff)
+    table.build()
+    return grammar, ff, collection, table
+
+
+def _build_ll1(grammar_file: str, bnf: bool = False) -> Tuple[Grammar, FirstFollow, ParsingTable]:
+    """Executa o pipeline LL(1) completo (sobre Grammar.to_bnf() se bnf)."""
+    grammar = Grammar()
+    grammar.load_from_file(grammar_file)
+    if bnf:
+        grammar = grammar.to_bnf()
+    
+    ff = FirstFollow(grammar)
+    ff.compute_first()
+    ff.compute_follow()
+    
+    table = ParsingTable(grammar, ff)
+    table.build()
+    return grammar, ff, table
+
+
+def _load_or_build(grammar_file: str, kind: str, builder, cache_dir: Optional[str],
+                   use_cache: bool, verbose: bool):
+    """Carrega do cache ou constrói (e grava) as tabelas."""
+    if not use_cache:
+        return builder(grammar_file)
+    
+    path = cache_path(grammar_file, kind, cache_dir)
+    objects = _read_cache(path, kind)
+    if objects is not None:
+        if verbose:
+            print(f"[CACHE] Tabelas {kind.upper()} carregadas de {path}")
+        return objects
+    
+    objects = builder(grammar_file)
+    _write_cache(path, kind, objects)
+    if verbose:
+        print(f"[CACHE] Tabelas {kind.upper()} construídas e salvas em {path}")
+    return objects
+
+
+def load_slr_tables(grammar_file: str, cache_dir: Optional[str] = None,
+                    use_cache: bool = True, verbose: bool = False
+                    ) -> Tuple[SLRGrammar, SLRFirstFollow, CanonicalCollection, SLRParsingTable]:
+    """
+    Retorna (gramática, FIRST/FOLLOW, coleção LR(0), tabela SLR(1)).
+    
+    Args:
+        grammar_file: Caminho para arquivo BNF
+        cache_dir: Diretório do cache (padrão: .table_cache ao lado da gramática)
+        use_cache: Se False, sempre reconstrói e não grava
+        verbose: Se True, informa se o cache foi usado
+    """
+    return _load_or_build(grammar_file, 'slr', _build_slr, cache_dir, use_cache, verbose)
+
+
+def load_ll1_tables(grammar_file: str, cache_dir: Optional[str] = None,
+                    use_cache: bool = True, verbose: bool = False, bnf: bool = False
+                    ) -> Tuple[Grammar, FirstFollow, ParsingTable]:
+    """
+    Retorna (gramática, FIRST/FOLLOW, tabela LL(1)).
+    
+    Args:
+        grammar_file: Caminho para arquivo BNF
+        cache_dir: Diretório do cache (padrão: .table_cache ao lado da gramática)
+        use_cache: Se False, sempre reconstrói e não grava
+        verbose: Se True, informa se o cache foi usado
+        bnf: Se True, converte a gramática com Grammar.to_bnf() antes
+            de montar a tabela (cache separado)
+    """
+    if bnf:
+        return _load_or_build(grammar_file, 'll1-bnf', lambda path: _build_ll1(path, bnf=True),
+                              cache_dir, use_cache, verbose)
+    return _load_or_build(grammar_file, 'll1', _build_ll1, cache_dir, use_cache, verbose)
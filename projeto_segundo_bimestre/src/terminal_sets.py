@@ -0,0 +1,480 @@
+"""
+=============================================================================
+MOTOR DE FIRST/FOLLOW COM BITSETS - LINGUAGEM VYTHON
+=============================================================================
+
+Cálculo de FIRST e FOLLOW compartilhado pelas duas gramáticas (LL(1) com
+EBNF e SLR(1) em BNF). Conjuntos de terminais são inteiros Python usados
+como bitmasks sobre os ids da SymbolTable:
+
+- bit i              -> terminal de id i
+- bit num_terminals  -> ε
+
+União, diferença e teste de ε viram uma única operação inteira
+(a | b, a & ~EPSILON, a & EPSILON). TerminalSetView expõe os resultados
+como o dicionário de sets usado pelo resto do código, convertendo cada
+conjunto só quando ele é lido.
+
+Depois que FIRST converge, SuffixFirst guarda FIRST de todo sufixo de
+produção, indexado por (número da produção, posição). FOLLOW, a tabela
+LL(1) e os diagnósticos de conflito consultam o cache em vez de
+recalcular FIRST das mesmas sequências.
+=============================================================================
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from symbols import SymbolTable
+
+
+# Operadores EBNF que seguem um símbolo
+EBNF_OPERATORS = frozenset(('*', '+', '?'))
+
+
+def digraph(nodes: Iterable, relation: Dict, initial: Dict) -> Dict:
+    """
+    Algoritmo digraph de DeRemer e Pennello.
+    
+    Resolve F(x) = F'(x) | ⋃{F(y) | x R y} para todos os nós em tempo
+    linear no tamanho do grafo. Componentes fortemente conexas são
+    detectadas durante a busca em profundidade e recebem o mesmo valor.
+    
+    Args:
+        nodes: Nós do grafo
+        relation: Dicionário x -> sucessores y (x R y)
+        initial: Dicionário x -> bitmask inicial F'(x)
+    
+    Returns:
+        Dicionário x -> F(x)
+    """
+    infinity = float('inf')
+    result = {x: initial.get(x, 0) for x in nodes}
+    depth = dict.fromkeys(result, 0)
+    stack = []
+    
+    for root in result:
+        if depth[root] != 0:
+            continue
+        
+        # Busca em profundidade iterativa: (nó, profundidade, sucessores)
+        stack.append(root)
+        depth[root] = len(stack)
+        work = [(root, len(stack), iter(relation.get(root, ())))]
+        
+        while work:
+            x, d, successors = work[-1]
+            
+            for y in successors:
+                if depth[y] == 0:
+                    stack.append(y)
+                    depth[y] = len(stack)
+                    work.append((y, len(stack), iter(relation.get(y, ()))))
+                    break
+                depth[x] = min(depth[x], depth[y])
+                result[x] |= result[y]
+            else:
+                work.pop()
+                
+                # x é raiz de uma componente: todos recebem F(x)
+                if depth[x] == d:
+                    while True:
+                        z = stack.pop()
+                        depth[z] = infinity
+                        if z == x:
+                            break
+                        result[z] = result[x]
+                
+                # Propagar para o pai na busca
+                if work:
+                    parent = work[-1][0]
+                    depth[parent] = min(depth[parent], depth[x])
+                    result[parent] |= result[x]
+    
+    return result
+
+
+class SuffixFirst:
+    """
+    FIRST de todos os sufixos das produções.
+    
+    first[p][k] é o bitmask de FIRST(corpo[k:]) da produção p, para
+    0 <= k <= len(corpo). Em nullable[p], o bit k indica que corpo[k:]
+    deriva ε. Posições que apontam para um operador EBNF não são
+    início de sufixo e não devem ser consultadas.
+    
+    Attributes:
+        first: Para cada produção, tupla de bitmasks por posição
+        nullable: Para cada produção, bits dos sufixos anuláveis
+    """
+    
+    def __init__(self, first: List[Tuple[int, ...]], nullable: List[int]):
+        self.first = first
+        self.nullable = nullable
+    
+    def __len__(self) -> int:
+        return len(self.first)
+    
+    def first_at(self, production: int, offset: int = 0) -> int:
+        """Bitmask de FIRST(corpo[offset:]) da produção."""
+        return self.first[production][offset]
+    
+    def is_nullable(self, production: int, offset: int = 0) -> bool:
+        """Verifica se corpo[offset:] da produção deriva ε."""
+        return bool(self.nullable[production] >> offset & 1)
+
+
+class TerminalSets:
+    """
+    Conjuntos de terminais como bitmasks e cálculo de FIRST/FOLLOW.
+    
+    Attributes:
+        symbols: SymbolTable que define os ids dos terminais
+        epsilon: Nome de ε nos conjuntos convertidos
+        EPSILON: Bit que representa ε
+        ebnf: Se True, trata *, + e ? após um símbolo como operadores
+    """
+    
+    def __init__(self, symbols: SymbolTable, epsilon: str = 'ε',
+                 epsilon_symbols: Iterable[str] = (), ebnf: bool = False):
+        self.symbols = symbols
+        self.epsilon = epsilon
+        self.epsilon_symbols = frozenset(epsilon_symbols) | {epsilon}
+        self.ebnf = ebnf
+        self.num_terminals = symbols.num_terminals
+        self.EPSILON = 1 << self.num_terminals
+        
+        # Nome de cada bit (terminais e, por último, ε)
+        self.bit_names: Tuple[str, ...] = tuple(symbols.names[:self.num_terminals]) + (epsilon,)
+    
+    # -------------------------------------------------------------------------
+    # CONVERSÕES
+    # -------------------------------------------------------------------------
+    
+    def bit(self, terminal: str) -> int:
+        """Bitmask com um único terminal."""
+        if terminal in self.epsilon_symbols:
+            return self.EPSILON
+        return 1 << self.symbols.ids[terminal]
+    
+    def mask(self, names: Iterable[str]) -> int:
+        """Converte um conjunto de nomes em bitmask."""
+        result = 0
+        for name in names:
+            result |= self.bit(name)
+        return result
+    
+    def names(self, mask: int) -> Set[str]:
+        """Converte um bitmask no conjunto de nomes."""
+        bit_names = self.bit_names
+        result = set()
+        while mask:
+            low = mask & -mask
+            result.add(bit_names[low.bit_length() - 1])
+            mask ^= low
+        return result
+    
+    # -------------------------------------------------------------------------
+    # FIRST
+    # -------------------------------------------------------------------------
+    
+    def first_of_sequence(self, sequence: Sequence[str], first: Dict[str, int]) -> int:
+        """
+        FIRST de uma sequência de símbolos.
+        
+        Com EBNF: A* e A? sempre podem ser vazios; A+ é anulável só se
+        A for. A sequência vazia (ou só de ε) gera {ε}.
+        """
+        epsilon = self.EPSILON
+        epsilon_symbols = self.epsilon_symbols
+        ebnf = self.ebnf
+        length = len(sequence)
+        result = 0
+        
+        i = 0
+        while i < length:
+            symbol = sequence[i]
+            operator = None
+            if ebnf and i + 1 < length and sequence[i + 1] in EBNF_OPERATORS:
+                operator = sequence[i + 1]
+            
+            if symbol in epsilon_symbols:
+                i += 1
+                continue
+            
+            symbol_first = first.get(symbol, 0)
+            result |= symbol_first & ~epsilon
+            
+            if not (symbol_first & epsilon or operator == '*' or operator == '?'):
+                return result
+            
+            i += 2 if operator else 1
+        
+        return result | epsilon
+    
+    def compute_first(self, productions: Iterable[Tuple[str, Sequence[str]]],
+                      first: Dict[str, int]) -> Dict[str, int]:
+        """
+        Calcula FIRST dos não-terminais por ponto fixo.
+        
+        Args:
+            productions: Pares (cabeça, corpo)
+            first: FIRST já conhecido (terminais); atualizado e retornado
+        """
+        productions = list(productions)
+        for head, _ in productions:
+            first.setdefault(head, 0)
+        
+        changed = True
+        while changed:
+            changed = False
+            for head, body in productions:
+                old = first[head]
+                new = old | self.first_of_sequence(body, first)
+                if new != old:
+                    first[head] = new
+                    changed = True
+        
+        return first
+    
+    def suffix_first(self, productions: Iterable[Tuple[str, Sequence[str]]],
+                     first: Dict[str, int]) -> SuffixFirst:
+        """
+        Preenche o cache de FIRST dos sufixos, com FIRST já convergido.
+        
+        Cada corpo é percorrido uma vez, da direita para a esquerda:
+        FIRST(X β) = FIRST(X) - {ε}, somado a FIRST(β) se X for anulável.
+        
+        Args:
+            productions: Pares (cabeça, corpo); a posição na sequência é
+                o número da produção no cache
+            first: FIRST final dos símbolos
+        """
+        epsilon = self.EPSILON
+        not_epsilon = ~epsilon
+        epsilon_symbols = self.epsilon_symbols
+        ebnf = self.ebnf
+        suffix_first: List[Tuple[int, ...]] = []
+        suffix_nullable: List[int] = []
+        
+        for _, body in productions:
+            length = len(body)
+            masks = [0] * (length + 1)
+            masks[length] = epsilon
+            
+            # Posições onde começa um símbolo (as demais são operadores)
+            operators = {}
+            i = 0
+            while i < length:
+                operators[i] = None
+                if (ebnf and body[i] not in epsilon_symbols
+                        and i + 1 < length and body[i + 1] in EBNF_OPERATORS):
+                    operators[i] = body[i + 1]
+                    i += 2
+                else:
+                    i += 1
+            
+            for i in range(length - 1, -1, -1):
+                symbol = body[i]
+                
+                if i not in operators or symbol in epsilon_symbols:
+                    masks[i] = masks[i + 1]
+                    continue
+                
+                operator = operators[i]
+                rest = masks[i + 2] if operator else masks[i + 1]
+                
+                symbol_first = first.get(symbol, 0)
+                if symbol_first & epsilon or operator == '*' or operator == '?':
+                    masks[i] = (symbol_first & not_epsilon) | rest
+                else:
+                    masks[i] = symbol_first & not_epsilon
+            
+            nullable = 0
+            for i, mask in enumerate(masks):
+                if mask & epsilon:
+                    nullable |= 1 << i
+            
+            suffix_first.append(tuple(masks))
+            suffix_nullable.append(nullable)
+        
+        return SuffixFirst(suffix_first, suffix_nullable)
+    
+    # -------------------------------------------------------------------------
+    # LIMITE DE PASSOS
+    # -------------------------------------------------------------------------
+    
+    def step_factor(self, productions: Iterable[Tuple[str, Sequence[str]]],
+                    first: Dict[str, int]) -> int:
+        """
+        Fator K tal que uma análise de n tokens dá no máximo (n + 1) * K passos.
+        
+        A árvore de derivação de n tokens tem no máximo n - 1 nós com
+        dois ou mais filhos não vazios. Acima de cada folha ou desses nós
+        há no máximo U nós em cadeia (um único filho não vazio: produções
+        unitárias e corpos em que o resto é anulável), e cada nó carrega
+        no máximo W - 1 nós em subárvores que derivam ε. Cada nó é uma
+        redução (ou expansão), cada folha um shift (ou match), então
+        K = 1 + 2 * (U + 1) * W.
+        
+        Gramáticas cíclicas (A ⇒+ A) não têm limite; as cadeias são
+        cortadas após um número de rodadas igual ao de não-terminais.
+        
+        Args:
+            productions: Pares (cabeça, corpo)
+            first: FIRST final dos símbolos
+        """
+        epsilon = self.EPSILON
+        epsilon_symbols = self.epsilon_symbols
+        ebnf = self.ebnf
+        
+        # Itens de cada corpo: (símbolo, anulável), sem ε e operadores
+        bodies = []
+        for head, body in productions:
+            items = []
+            length = len(body)
+            i = 0
+            while i < length:
+                symbol = body[i]
+                operator = None
+                if ebnf and i + 1 < length and body[i + 1] in EBNF_OPERATORS:
+                    operator = body[i + 1]
+                if symbol not in epsilon_symbols:
+                    nullable = bool(first.get(symbol, 0) & epsilon) or operator in ('*', '?')
+                    items.append((symbol, nullable))
+                i += 2 if operator else 1
+            bodies.append((head, items))
+        
+        heads = {head for head, _ in bodies}
+        rounds = len(heads)
+        
+        # Maior subárvore ε de cada não-terminal anulável
+        empty = dict.fromkeys(heads, 0)
+        for _ in range(rounds):
+            changed = False
+            for head, items in bodies:
+                if all(nullable for _, nullable in items):
+                    size = 1 + sum(empty.get(symbol, 0) for symbol, _ in items)
+                    if size > empty[head]:
+                        empty[head] = size
+                        changed = True
+            if not changed:
+                break
+        
+        width = 1 + max((sum(empty.get(symbol, 0) for symbol, nullable in items if nullable)
+                         for _, items in bodies), default=0)
+        
+        # Cadeias: A -> α B γ com α e γ anuláveis
+        edges: Dict[str, Set[str]] = {}
+        for head, items in bodies:
+            solid = [symbol for symbol, nullable in items if not nullable]
+            candidates = solid if len(solid) == 1 else ([] if solid else [s for s, _ in items])
+            for symbol in candidates:
+                if symbol in heads:
+                    edges.setdefault(head, set()).add(symbol)
+        
+        chain = dict.fromkeys(heads, 1)
+        for _ in range(rounds):
+            changed = False
+            for head, targets in edges.items():
+                size = 1 + max(chain[target] for target in targets)
+                if size > chain[head]:
+                    chain[head] = size
+                    changed = True
+            if not changed:
+                break
+        
+        longest = max(chain.values(), default=0)
+        return 1 + 2 * (longest + 1) * width
+    
+    # -------------------------------------------------------------------------
+    # FOLLOW
+    # -------------------------------------------------------------------------
+    
+    def compute_follow(self, productions: Iterable[Tuple[str, Sequence[str]]],
+                       first: Dict[str, int], nonterminals: Iterable[str],
+                       start_symbol: str, end_marker: str = '$',
+                       suffixes: Optional[SuffixFirst] = None) -> Dict[str, int]:
+        """
+        Calcula FOLLOW de todos os não-terminais.
+        
+        Cada produção é visitada uma vez para coletar:
+        - FOLLOW(B) ⊇ FIRST(β) - {ε}          (termos constantes)
+        - FOLLOW(B) ⊇ FOLLOW(A), se β ⇒* ε    (arestas B -> A)
+        Com EBNF, B* e B+ também somam FIRST(B) a FOLLOW(B).
+        Depois o algoritmo digraph propaga os conjuntos pelo grafo.
+        FIRST(β) vem do cache de sufixos (calculado aqui se não for dado).
+        """
+        productions = list(productions)
+        if suffixes is None:
+            suffixes = self.suffix_first(productions, first)
+        suffix_first = suffixes.first
+        
+        nonterminals = set(nonterminals)
+        not_epsilon = ~self.EPSILON
+        ebnf = self.ebnf
+        initial: Dict[str, int] = {nt: 0 for nt in nonterminals}
+        includes: Dict[str, Set[str]] = {}
+        
+        initial[start_symbol] |= self.bit(end_marker)
+        
+        for number, (head, body) in enumerate(productions):
+            masks = suffix_first[number]
+            length = len(body)
+            i = 0
+            while i < length:
+                symbol = body[i]
+                
+                # Só processar não-terminais
+                if symbol not in nonterminals:
+                    i += 1
+                    continue
+                
+                operator = None
+                if ebnf and i + 1 < length and body[i + 1] in EBNF_OPERATORS:
+                    operator = body[i + 1]
+                    
+                    # B* e B+: FOLLOW(B) inclui FIRST(B) (repetição)
+                    if operator != '?':
+                        initial[symbol] |= first.get(symbol, 0) & not_epsilon
+                
+                rest = i + 2 if operator else i + 1
+                first_beta = masks[rest]
+                initial[symbol] |= first_beta & not_epsilon
+                
+                if first_beta & self.EPSILON and symbol != head:
+                    includes.setdefault(symbol, set()).add(head)
+                
+                i = rest
+        
+        return digraph(nonterminals, includes, initial)
+
+
+class TerminalSetView(Mapping):
+    """
+    Visão somente leitura de bitmasks como dicionário de sets.
+    
+    Cada conjunto é convertido na primeira leitura e guardado, então
+    código que usa .get(), [] ou .items() continua funcionando.
+    """
+    
+    def __init__(self, masks: Dict[str, int], sets: TerminalSets):
+        self.masks = masks
+        self.sets = sets
+        self._cache: Dict[str, Set[str]] = {}
+    
+    def __getitem__(self, key: str) -> Set[str]:
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self.sets.names(self.masks[key])
+            self._cache[key] = cached
+        return cached
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.masks)
+    
+    def __len__(self) -> int:
+        return len(self.masks)
+    
+    def __contains__(self, key) -> bool:
+        return key in self.masks
@@ -14,9 +14,7 @@ src_dir = project_root / "src"
 sys.path.insert(0, str(src_dir))
 
 try:
-    from grammar import Grammar
-    from first_follow import FirstFollow
-    from parsing_table import ParsingTable
+    from table_cache import load_ll1_tables
 except ImportError as e:
     print(f"❌ Erro de importação: {e}")
     print(f"O script tentou buscar os módulos em: {src_dir}")
@@ -46,19 +44,10 @@ def main():
         return
 
     print(f"📂 Gramática: {grammar_file.name}")
-    g = Grammar()
-    g.load_from_file(str(grammar_file))
 
-    # --- 3. Calcular First e Follow ---
-    print("⚙️  Calculando First e Follow...")
-    ff = FirstFollow(g)
-    ff.compute_first()
-    ff.compute_follow()
-
-    # --- 4. Gerar Tabela ---
-    print("🏗️  Construindo Tabela de Parsing...")
-    pt = ParsingTable(g, ff)
-    pt.build()
+    # --- 3/4. First, Follow e Tabela (do cache se a gramática não mudou) ---
+    print("🏗️  Carregando Tabela de Parsing...")
+    g, ff, pt = load_ll1_tables(str(grammar_file), verbose=True)
 
     # Verifica status da tabela
     if pt.is_ll1_pure():
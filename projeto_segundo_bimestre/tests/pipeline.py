@@ -207,7 +207,7 @@ def main():
         print(f"\n  Teste {i}/{len(test_cases)}: {test['name']}")
         print(f"    Código: {test['code']}")
         
-        parser = LL1Parser(g, pt)
+        parser = LL1Parser(g, pt, trace=print)
         result = parser.parse(test['tokens'])
         
         if result:
@@ -14,11 +14,9 @@ if src_dir not in sys.path:
 
 # --- Importações do seu compilador ---
 try:
-    from grammar import Grammar
-    from first_follow import FirstFollow
-    from parsing_table import ParsingTable
     from ll1_parser import LL1Parser
     from lexer import Lexer
+    from table_cache import load_ll1_tables
 except ImportError as e:
     print(f"❌ Erro de importação: {e}")
     print(f"Verifique se os arquivos estão em: {src_dir}")
@@ -48,15 +46,8 @@ def setup_compiler():
     if not grammar_path:
         raise FileNotFoundError("Arquivo de gramática não encontrado!")
 
-    g = Grammar()
-    g.load_from_file(grammar_path)
-
-    ff = FirstFollow(g)
-    ff.compute_first()
-    ff.compute_follow()
-
-    pt = ParsingTable(g, ff)
-    pt.build()
+    # Tabelas vêm do cache em disco se a gramática não mudou
+    g, ff, pt = load_ll1_tables(grammar_path)
 
     return g, pt
 
@@ -66,41 +57,22 @@ def run_file_test(filepath, grammar, table):
     filename = os.path.basename(filepath)
     print(f"\nTestando: {filename}")
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        source_code = f.read()
-
-    # 1. Lexer
+    # 1. Lexer (arquivo mapeado em memória, sem cópia str do conteúdo)
     try:
-        lexer = Lexer(source_code)
-        tokens = lexer.get_token_tuples()
+        with Lexer.from_path(filepath) as lexer:
+            tokens = lexer.get_token_tuples()
     except Exception as e:
         print(f"   ❌ ERRO LÉXICO: {e}")
         return False
 
-    # 2. Parser
+    # 2. Parser (sem rastreamento nem histórico: usa o driver rápido)
     parser = LL1Parser(grammar, table)
 
-    # CORREÇÃO AQUI: Forçar encoding utf-8 no devnull para suportar a seta '→'
-    try:
-        # Tenta usar devnull com encoding (Python 3)
-        devnull = open(os.devnull, "w", encoding="utf-8")
-    except:
-        # Fallback para sistemas muito antigos
-        devnull = open(os.devnull, "w")
-
-    old_stdout = sys.stdout
-    sys.stdout = devnull
-
     try:
         success = parser.parse(tokens)
     except Exception as e:
-        # Se der erro durante o parse, restaura stdout para mostrar o erro
-        sys.stdout = old_stdout
         print(f"   ❌ ERRO DE EXECUÇÃO: {e}")
         return False
-    finally:
-        sys.stdout = old_stdout  # Restaura o print normal
-        devnull.close()
 
     if success:
         print(f"   ✅ PASSOU (Sintaxe Aceita)")
@@ -110,6 +82,10 @@ def run_file_test(filepath, grammar, table):
             print(f"   ✅ PASSOU (Rejeitado corretamente como esperado)")
         else:
             print(f"   ❌ FALHOU (Deveria aceitar, mas rejeitou)")
+            # Repete guardando os últimos passos para o relatório
+            parser = LL1Parser(grammar, table, history=20)
+            parser.parse(tokens)
+            print(parser.error_report())
 
     return success
 
@@ -0,0 +1,159 @@
+import sys
+import os
+import glob
+import random
+
+# --- Configuração de Path para encontrar o 'src' ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, "src")
+
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+# --- Importações do seu compilador ---
+try:
+    from ll1_parser import LL1Parser, TRACE_OFF
+    from ll1_codegen import generate_parser_module
+    from lexer import Lexer
+    from table_cache import load_ll1_tables
+except ImportError as e:
+    print(f"❌ Erro de importação: {e}")
+    print(f"Verifique se os arquivos estão em: {src_dir}")
+    sys.exit(1)
+
+
+# Teste diferencial: os drivers do LL1Parser devem aceitar e rejeitar
+# exatamente as mesmas entradas, com a mesma mensagem de erro.
+#   laço  -> laço sobre nós EBNF (forçado com history)
+#   denso -> _parse_dense (gramática em BNF, sem histórico)
+#   bnf   -> tabela de Grammar.to_bnf() para a gramática EBNF
+#   gerado -> parser descendente recursivo de ll1_codegen.py
+
+VYTHON_GRAMMAR = os.path.join(project_root, "docs", "gramatica_sem_ambiguidade.bnf")
+EBNF_GRAMMAR = os.path.join(current_dir, "ebnf_exemplo.bnf")
+
+# Sentenças válidas de ebnf_exemplo.bnf (base das mutações)
+EBNF_SENTENCES = [
+    "IDENTIFIER ;",
+    "IDENTIFIER [ NUMBER ] [ NUMBER ] = - NUMBER ;",
+    "IDENTIFIER = STRING ; print ( NUMBER , NUMBER ) ;",
+    "print ( ) ; tup x , x , y ;",
+    "tup x , y ; IDENTIFIER [ NUMBER ] = NUMBER ;",
+]
+
+MUTATIONS = 3000
+SEED = 2024
+DEEP_NESTING = 500  # Níveis de parênteses (recursão do parser gerado)
+
+
+def words_to_tokens(text):
+    """Tokens (tipo, valor) de cada palavra, terminando com EOF."""
+    return [(word, word) for word in text.split()] + [("EOF", "EOF")]
+
+
+def nested_expression(depth, closed=True):
+    """x = ((...(1)...)); com depth níveis de parênteses."""
+    closing = [(")", ")")] * (depth if closed else depth - 1)
+    return ([("IDENTIFIER", "x"), ("=", "=")] + [("(", "(")] * depth
+            + [("NUMBER", "1")] + closing + [(";", ";"), ("EOF", "EOF")])
+
+
+def mutate(rng, tokens, vocabulary):
+    """Remove, insere, troca ou substitui um token (o EOF final fica)."""
+    tokens = list(tokens)
+    i = rng.randrange(len(tokens) - 1)
+    operation = rng.randrange(4)
+    if operation == 0:
+        del tokens[i]
+    elif operation == 1:
+        tokens.insert(i, rng.choice(vocabulary))
+    elif operation == 2 and i + 1 < len(tokens) - 1:
+        tokens[i], tokens[i + 1] = tokens[i + 1], tokens[i]
+    else:
+        tokens[i] = rng.choice(vocabulary)
+    return tokens
+
+
+def driver(grammar, table, history):
+    """Função entrada -> (aceito, mensagem de erro) de um parser reutilizado."""
+    parser = LL1Parser(grammar, table, trace_level=TRACE_OFF, history=history)
+
+    def run(tokens):
+        accepted = parser.parse(tokens)
+        return bool(accepted), parser.error_message
+
+    return run
+
+
+def generated_driver(table):
+    """parse() do módulo gerado por ll1_codegen, carregado em memória."""
+    namespace = {}
+    exec(compile(generate_parser_module(table), "<parser gerado>", "exec"), namespace)
+    return namespace["parse"]
+
+
+def compare(label, drivers, inputs):
+    """Roda todas as entradas em todos os drivers; conta divergências."""
+    mismatches = rejected = 0
+    for tokens in inputs:
+        results = {name: run(tokens) for name, run in drivers.items()}
+        rejected += not results["laço"][0]
+        accepted = {result[0] for result in results.values()}
+        messages = {result[1] for name, result in results.items() if name != "bnf"}
+        if len(accepted) > 1 or len(messages) > 1:
+            mismatches += 1
+            if mismatches <= 5:
+                types = [t[0] for t in tokens]
+                shown = types if len(types) <= 20 else types[:20] + ["..."]
+                print(f"   divergência em {shown}: {results}")
+
+    if mismatches:
+        print(f"   ❌ FALHOU {label}: {mismatches} divergência(s) em {len(inputs)} entradas")
+    else:
+        print(f"   ✅ PASSOU {label}: {len(inputs)} entradas, {rejected} rejeitadas")
+    return mismatches == 0
+
+
+def main():
+    rng = random.Random(SEED)
+    ok = True
+
+    # 1. Gramática da Vython (BNF): laço x denso x gerado
+    g, ff, pt = load_ll1_tables(VYTHON_GRAMMAR)
+    bases = [Lexer.from_path(path).get_token_tuples()
+             for path in sorted(glob.glob(os.path.join(current_dir, "*.vy")))]
+    vocabulary = sorted({token for tokens in bases for token in tokens})
+    inputs = bases + [mutate(rng, rng.choice(bases), vocabulary) for _ in range(MUTATIONS)]
+    inputs += [nested_expression(DEEP_NESTING), nested_expression(DEEP_NESTING, closed=False)]
+
+    drivers = {
+        "laço": driver(g, pt, history=1),
+        "denso": driver(g, pt, history=0),
+        "gerado": generated_driver(pt),
+    }
+    ok &= compare("Vython (laço x denso x gerado)", drivers, inputs)
+
+    # 2. Gramática EBNF: laço sobre nós x tabela da versão BNF x gerado
+    g, ff, pt = load_ll1_tables(EBNF_GRAMMAR, use_cache=False)
+    bnf_g, bnf_ff, bnf_pt = load_ll1_tables(EBNF_GRAMMAR, use_cache=False, bnf=True)
+    if not pt.is_ll1() or not bnf_pt.is_ll1():
+        print("   ❌ FALHOU: ebnf_exemplo.bnf deveria ser LL(1) antes e depois de to_bnf()")
+        return False
+
+    bases = [words_to_tokens(text) for text in EBNF_SENTENCES]
+    vocabulary = sorted({token for tokens in bases for token in tokens})
+    inputs = bases + [mutate(rng, rng.choice(bases), vocabulary) for _ in range(MUTATIONS)]
+
+    drivers = {
+        "laço": driver(g, pt, history=0),
+        "bnf": driver(bnf_g, bnf_pt, history=0),
+        "gerado": generated_driver(pt),
+    }
+    ok &= compare("EBNF (nós x to_bnf x gerado)", drivers, inputs)
+
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
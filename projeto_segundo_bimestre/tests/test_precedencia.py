@@ -0,0 +1,81 @@
+import sys
+import os
+
+# --- Configuração de Path para encontrar o 'src' ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, "src")
+
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+# --- Importações do seu compilador ---
+try:
+    from slr_parser import SLRParser
+    from table_cache import load_slr_tables
+except ImportError as e:
+    print(f"❌ Erro de importação: {e}")
+    print(f"Verifique se os arquivos estão em: {src_dir}")
+    sys.exit(1)
+
+
+GRAMMAR_PATH = os.path.join(current_dir, "expressoes_ambiguas.bnf")
+
+# Entrada -> árvore esperada com parênteses (None = deve ser rejeitada)
+CASES = [
+    ("n + n * n", "(n + (n * n))"),
+    ("n * n + n", "((n * n) + n)"),
+    ("n - n - n", "((n - n) - n)"),
+    ("n ^ n ^ n", "(n ^ (n ^ n))"),
+    ("n * n ^ n", "(n * (n ^ n))"),
+    ("n < n + n", "(n < (n + n))"),
+    ("( n + n ) * n", "((n + n) * n)"),
+    ("n < n < n", None),  # %nonassoc: comparação encadeada é erro
+]
+
+
+def parenthesize(production, children):
+    """Ação semântica: monta a expressão com parênteses explícitos."""
+    if len(children) == 3 and production.body[0] == "'('":
+        return children[1]
+    if len(children) == 3:
+        return f"({children[0]} {children[1]} {children[2]})"
+    return children[0]
+
+
+def tokens_of(text):
+    """Tokens (tipo, valor) de cada palavra, terminando com $."""
+    return [(word, word) for word in text.split()] + [("$", "$")]
+
+
+def main():
+    grammar, _, _, table = load_slr_tables(GRAMMAR_PATH, use_cache=False)
+    ok = True
+
+    # 1. Todos os conflitos resolvidos pelas declarações
+    print(f"Conflitos resolvidos por precedência: {len(table.resolved_conflicts)}")
+    if table.conflicts or not table.resolved_conflicts:
+        print(f"   ❌ FALHOU ({len(table.conflicts)} conflito(s) sem resolução)")
+        for conflict in table.conflicts:
+            print(f"      {conflict}")
+        ok = False
+    else:
+        print("   ✅ PASSOU (nenhum conflito sem resolução)")
+
+    # 2. Associatividade e precedência das reduções
+    for text, expected in CASES:
+        parser = SLRParser(grammar, table, semantic_action=parenthesize)
+        accepted = parser.parse(tokens_of(text))
+        result = parser.result if accepted else None
+
+        if result == expected:
+            print(f"   ✅ PASSOU {text!r} -> {result}")
+        else:
+            print(f"   ❌ FALHOU {text!r} -> {result} (esperado {expected})")
+            ok = False
+
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
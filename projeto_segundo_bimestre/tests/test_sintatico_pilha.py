@@ -9,11 +9,9 @@ sys.path.insert(0, os.path.join(current_dir, '..'))
 sys.path.insert(0, os.path.join(current_dir, '..', 'src'))
 
 try:
-    from grammar import Grammar
-    from first_follow import FirstFollow
-    from parsing_table import ParsingTable
     from ll1_parser import LL1Parser
     from lexer import Lexer
+    from table_cache import load_ll1_tables
 except ImportError:
     print("[ERRO] Falha ao importar módulos do compilador. Verifique a estrutura de pastas.")
     sys.exit(1)
@@ -42,15 +40,7 @@ def run_stack_trace_test():
         return
 
     print(f"Carregando gramática de: {os.path.basename(grammar_path)}")
-    g = Grammar()
-    g.load_from_file(grammar_path)
-    
-    ff = FirstFollow(g)
-    ff.compute_first()
-    ff.compute_follow()
-    
-    pt = ParsingTable(g, ff)
-    pt.build()
+    g, ff, pt = load_ll1_tables(grammar_path)
 
     # 2. Código simples para visualização clara da pilha
     # Usamos uma atribuição simples para não gerar 500 passos
@@ -73,10 +63,9 @@ def run_stack_trace_test():
     print("Legenda: [Passo N] Pilha: TOPO ... FUNDO | Token Atual")
     print("-"*60 + "\n")
 
-    parser = LL1Parser(g, pt)
+    parser = LL1Parser(g, pt, trace=print)
     
-    # O método parse() do seu arquivo ll1_parser.py já contém prints
-    # detalhados da pilha (linha 67 do seu código).
+    # Com trace=print, parse() imprime a pilha a cada passo
     sucesso = parser.parse(tokens)
 
     print("\n" + "-"*60)